@@ -0,0 +1,240 @@
+"""파서/후처리 단계별 마이크로 벤치마크와 성능 회귀 검사.
+
+단계별로 별도의 (fork 된) 프로세스에서 실행해 처리량과 최대 RSS를 측정하고,
+기준(baseline) 결과보다 처리량이 threshold 이상 떨어지면 종료 코드 1로 실패합니다.
+
+사용 예:
+    python -m bench.bench_parsers --scales 10k --update-baseline     # 기준 결과 저장
+    python -m bench.bench_parsers --scales 10k                       # 기준 대비 회귀 검사
+    python -m bench.bench_parsers --scales 100k 1m --stages flatten_data clean_factory_name
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from datetime import datetime
+
+from bench.corpus import make_record, render_detail_html
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "bench", "baseline_parsers.json")
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+BATCH_SIZE = 1000
+
+
+def _iter_batches(scale):
+    for start in range(0, scale, BATCH_SIZE):
+        yield [make_record(n, scale) for n in range(start, min(start + BATCH_SIZE, scale))]
+
+
+def _crawler_parser():
+    """브라우저를 띄우지 않고 SafetyKoreaCrawler 의 파서 메서드만 사용합니다."""
+    from kc_core import SafetyKoreaCrawler
+
+    return SafetyKoreaCrawler.__new__(SafetyKoreaCrawler)
+
+
+def _per_item_stage(prepare, func):
+    """배치마다 입력을 준비(측정 제외)하고 func 호출 시간만 누적합니다."""
+
+    def run(scale):
+        elapsed = 0.0
+        items = 0
+        for batch in _iter_batches(scale):
+            inputs = prepare(batch)
+            started = time.perf_counter()
+            for value in inputs:
+                func(value)
+            elapsed += time.perf_counter() - started
+            items += len(inputs)
+        return items, elapsed
+
+    return run
+
+
+def stage_parse_detail_page():
+    crawler = _crawler_parser()
+    return _per_item_stage(lambda batch: [render_detail_html(r) for r in batch], crawler.parse_detail_page)
+
+
+def stage_parse_list_table():
+    from bs4 import BeautifulSoup
+
+    crawler = _crawler_parser()
+
+    def parse(soup):
+        crawler._parse_list_table(soup, "제조공장 상세", ["번호", "제조공장", "제조국"])
+        crawler._parse_list_table(soup, "연관 인증 번호 상세", ["번호", "인증번호", "인증상태"])
+
+    return _per_item_stage(
+        lambda batch: [BeautifulSoup(render_detail_html(r), "html.parser") for r in batch],
+        parse,
+    )
+
+
+def stage_flatten_data():
+    from parse2csv import flatten_data
+
+    return _per_item_stage(lambda batch: batch, flatten_data)
+
+
+def stage_clean_factory_name():
+    from parse2csv import clean_factory_name
+
+    return _per_item_stage(
+        lambda batch: [factory["제조공장"] for r in batch for factory in r["제조공장"]], clean_factory_name
+    )
+
+
+def stage_normalize_company_name():
+    from normalizers import normalize_company_name
+
+    return _per_item_stage(
+        lambda batch: [factory["제조공장"].upper() for r in batch for factory in r["제조공장"]],
+        normalize_company_name,
+    )
+
+
+def stage_normalize_product_name():
+    from normalizers import normalize_product_name
+
+    return _per_item_stage(lambda batch: [r["제품정보"]["품목명"] for r in batch], normalize_product_name)
+
+
+def stage_extract_chinese_factories():
+    import pandas as pd
+
+    from parse2csv import extract_chinese_factories, flatten_data
+
+    def run(scale):
+        rows = [flatten_data(r) for batch in _iter_batches(scale) for r in batch]
+        df = pd.DataFrame(rows)
+        del rows
+        started = time.perf_counter()
+        extract_chinese_factories(df)
+        return len(df), time.perf_counter() - started
+
+    return run
+
+
+STAGES = {
+    "parse_detail_page": stage_parse_detail_page,
+    "parse_list_table": stage_parse_list_table,
+    "flatten_data": stage_flatten_data,
+    "extract_chinese_factories": stage_extract_chinese_factories,
+    "clean_factory_name": stage_clean_factory_name,
+    "normalize_company_name": stage_normalize_company_name,
+    "normalize_product_name": stage_normalize_product_name,
+}
+
+
+def _stage_worker(stage, scale, conn):
+    try:
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        items, elapsed = STAGES[stage]()(scale)
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        conn.send(
+            {
+                "items": items,
+                "seconds": round(elapsed, 4),
+                "items_per_second": round(items / elapsed, 1) if elapsed else 0.0,
+                "peak_rss_mb": round(rss_after / 1024, 1),
+                "rss_growth_mb": round((rss_after - rss_before) / 1024, 1),
+            }
+        )
+    except Exception as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_stage(stage, scale):
+    """단계 하나를 새 프로세스에서 실행해 메모리 측정이 서로 섞이지 않도록 합니다."""
+    ctx = multiprocessing.get_context("fork")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_stage_worker, args=(stage, scale, child_conn))
+    process.start()
+    child_conn.close()
+    result = parent_conn.recv()
+    process.join()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """기준 대비 처리량이 threshold 비율 이상 떨어진 항목을 반환합니다."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base or "items_per_second" not in result or not base.get("items_per_second"):
+            continue
+        change = result["items_per_second"] / base["items_per_second"] - 1
+        result["change_vs_baseline"] = round(change, 4)
+        if change < -threshold:
+            regressions.append((key, base["items_per_second"], result["items_per_second"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파서/후처리 마이크로 벤치마크")
+    parser.add_argument("--scales", nargs="+", default=["10k"], choices=list(SCALES), help="코퍼스 크기")
+    parser.add_argument("--stages", nargs="+", default=list(STAGES), choices=list(STAGES), help="측정할 단계")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE, help="기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.10, help="허용 처리량 감소율 (기본값: 0.10)")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준 결과로 저장")
+    args = parser.parse_args()
+
+    results = {}
+    for scale_name in args.scales:
+        for stage in args.stages:
+            key = f"{stage}@{scale_name}"
+            print(f"Running {key}...", flush=True)
+            result = run_stage(stage, SCALES[scale_name])
+            results[key] = result
+            if "error" in result:
+                print(f"  실패: {result['error']}")
+            else:
+                print(
+                    f"  {result['items']}건 {result['seconds']:.3f}s "
+                    f"({result['items_per_second']:,.0f}/s, peak RSS {result['peak_rss_mb']}MB)"
+                )
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.update_baseline:
+        merged = dict(baseline)
+        merged.update({key: value for key, value in results.items() if "error" not in value})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {"updated_at": datetime.now().isoformat(timespec="seconds"), "results": merged},
+                f,
+                ensure_ascii=False,
+                indent=4,
+            )
+        print(f"\n기준 결과 저장: {args.baseline}")
+        return
+
+    if not baseline:
+        print("\n기준 결과가 없습니다. --update-baseline 으로 먼저 저장하세요.")
+        return
+
+    if regressions:
+        print(f"\n성능 회귀 감지 (허용 감소율 {args.threshold:.0%}):")
+        for key, before, after, change in regressions:
+            print(f"- {key}: {before:,.0f}/s -> {after:,.0f}/s ({change:+.1%})")
+        sys.exit(1)
+    print("\n성능 회귀 없음.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""벤치마크용 합성 KC 인증 데이터 생성기.
+
+모의 SafetyKorea 사이트(bench.mock_site)와 파서 벤치마크(bench.bench_parsers)가
+같은 데이터를 사용하도록, 레코드 번호 n 으로부터 항상 같은 레코드를 만들어냅니다.
+"""
+
+import random
+from datetime import date, timedelta
+from html import escape
+
+# 레코드 n 의 인증일자 = END_DATE - (n // RECORDS_PER_DAY) 일
+END_DATE = date(2024, 12, 31)
+RECORDS_PER_DAY = 20
+
+LIST_COLUMNS = ["번호", "인증구분", "품목명", "모델명", "인증일자", "인증상태", "인증번호"]
+
+_PREFIXES = ["HU", "SU", "YU", "XU", "ZU", "R-R", "CB"]
+_ORGANS = ["한국산업기술시험원", "한국화학융합시험연구원", "한국기계전기전자시험연구원", "KTC"]
+_DIVS = ["안전인증", "안전확인", "공급자적합성확인"]
+_STATES = ["적합", "적합", "적합", "청문실시", "인증취소", "반납"]
+_CHANGE_REASONS = ["", "", "모델명 변경", "제조공장 추가", "인증서 재발급"]
+_ITEMS = ["전기밥솥", "직류전원장치", "LED 등기구", "전기청소기", "휴대용 선풍기", "아답터", "전기포트", "완구"]
+_REGIONS = ["SHENZHEN", "DONGGUAN", "GUANGZHOU", "NINGBO", "SUZHOU", "SHANGHAI", "ZHONGSHAN", "XIAMEN"]
+_WORDS = ["BRIGHT", "GOLDEN", "POWER", "STAR", "SMART", "UNION", "ORIENT", "GREAT", "WELL", "SUN", "TECH", "ELEC"]
+_SUFFIXES = ["CO., LTD.", "CO.,LTD", "ELECTRONICS CO., LTD.", "TECHNOLOGY CO LTD", "INDUSTRIAL LIMITED", "유한공사"]
+_KOREAN_MAKERS = ["(주)대한전기", "한빛산업(주)", "주식회사 세진", "(유)동방테크"]
+_COUNTRIES = ["중국"] * 6 + ["대한민국"] * 2 + ["베트남", "태국", "대만", "독일"]
+
+
+def cert_number(n: int) -> str:
+    """레코드 번호에 대응하는 인증번호를 반환합니다."""
+    rng = random.Random(n * 7919)
+    return f"{rng.choice(_PREFIXES)}{n:08d}-{rng.randint(1, 99):02d}{rng.choice('ABCDE')}"
+
+
+def cert_date(n: int) -> date:
+    return END_DATE - timedelta(days=n // RECORDS_PER_DAY)
+
+
+def _maker_name(rng: random.Random, country: str) -> str:
+    if country == "대한민국":
+        return rng.choice(_KOREAN_MAKERS)
+    words = " ".join(rng.sample(_WORDS, 2))
+    region = rng.choice(_REGIONS) + " " if country == "중국" and rng.random() < 0.6 else ""
+    name = f"{region}{words} {rng.choice(_SUFFIXES)}"
+    # 실제 데이터처럼 대소문자/구두점이 제각각인 표기를 섞음
+    if rng.random() < 0.2:
+        name = name.title()
+    if rng.random() < 0.1:
+        name = name.replace(",", "").replace(".", "")
+    return name
+
+
+def make_record(n: int, total: int = None) -> dict:
+    """크롤러 출력 형식(상세 페이지 파싱 결과)의 레코드를 생성합니다."""
+    rng = random.Random(n)
+    issued = cert_date(n)
+    changed = issued + timedelta(days=rng.choice([0, 0, 0, 30, 180, 400]))
+    country = rng.choice(_COUNTRIES)
+
+    factories = []
+    for idx in range(rng.choice([1, 1, 1, 2, 3])):
+        factory_country = country if idx == 0 else rng.choice(_COUNTRIES)
+        factories.append(
+            {"번호": str(idx + 1), "제조공장": _maker_name(rng, factory_country), "제조국": factory_country}
+        )
+
+    related = []
+    for idx in range(rng.choice([0, 0, 1, 2, 3])):
+        other = rng.randint(0, (total or n + 1000) - 1)
+        related.append({"번호": str(idx + 1), "인증번호": cert_number(other), "인증상태": rng.choice(_STATES)})
+
+    return {
+        "인증정보": {
+            "인증번호": cert_number(n),
+            "인증기관": rng.choice(_ORGANS),
+            "인증구분": rng.choice(_DIVS),
+            "인증상태": rng.choice(_STATES),
+            "인증일자": issued.isoformat(),
+            "인증변경일자": changed.isoformat(),
+            "인증변경사유": rng.choice(_CHANGE_REASONS),
+            "리콜현황(모델명)": "",
+        },
+        "제품정보": {
+            "품목명": rng.choice(_ITEMS),
+            "모델명": f"MD-{rng.randint(100, 9999)}{rng.choice('ABCXYZ')}",
+            "상세정보": f"정격 {rng.choice([5, 12, 24, 220])}V / {rng.randint(1, 2000)}W",
+            "제품분류코드": f"{rng.randint(10, 99)}-{rng.randint(100, 999)}",
+            "파생모델": ", ".join(f"MD-{rng.randint(100, 9999)}" for _ in range(rng.choice([0, 0, 1, 3]))),
+        },
+        "제조공장": factories,
+        "연관 인증 번호": related,
+    }
+
+
+def to_api_record(record: dict) -> dict:
+    """크롤러 레코드를 Open API(certificationList.json) 형식으로 변환합니다."""
+    cert_info = record["인증정보"]
+    product_info = record["제품정보"]
+    first_factory = record["제조공장"][0]
+    return {
+        "certUid": cert_info["인증번호"].replace("-", ""),
+        "certOrganName": cert_info["인증기관"],
+        "certNum": cert_info["인증번호"],
+        "certState": cert_info["인증상태"],
+        "certDiv": cert_info["인증구분"],
+        "certDate": cert_info["인증일자"].replace("-", ""),
+        "certChgDate": cert_info["인증변경일자"].replace("-", ""),
+        "certChgReason": cert_info["인증변경사유"],
+        "productName": product_info["품목명"],
+        "brandName": "",
+        "modelName": product_info["모델명"],
+        "categoryName": f"전기용품 > {product_info['품목명']}",
+        "importDiv": "수입" if first_factory["제조국"] != "대한민국" else "제조",
+        "makerName": first_factory["제조공장"],
+        "makerCntryName": first_factory["제조국"],
+        "derivationModels": product_info["파생모델"],
+    }
+
+
+def _key_value_table(caption: str, data: dict) -> str:
+    cells = "".join(f"<tr><th>{escape(key)}</th><td>{escape(value)}</td></tr>" for key, value in data.items())
+    return f"<table class='tb_view'><caption>{escape(caption)}</caption><tbody>{cells}</tbody></table>"
+
+
+def _list_table(caption: str, header_keys: list, items: list, link_key: str = None) -> str:
+    header = "".join(f"<th>{escape(key)}</th>" for key in header_keys)
+    rows = []
+    for item in items:
+        cols = []
+        for key in header_keys:
+            value = escape(item.get(key, ""))
+            if key == link_key:
+                value = f"<a href='#'>{value}</a>"
+            cols.append(f"<td>{value}</td>")
+        rows.append(f"<tr>{''.join(cols)}</tr>")
+    return (
+        f"<table class='tb_list2'><caption>{escape(caption)}</caption>"
+        f"<thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+    )
+
+
+def render_detail_html(record: dict) -> str:
+    """parse_detail_page 가 기대하는 캡션 구조의 상세 페이지 HTML을 생성합니다."""
+    body = "".join(
+        [
+            _key_value_table("인증정보 상세", record["인증정보"]),
+            _key_value_table("제품정보 상세", record["제품정보"]),
+            _list_table("제조공장 상세", ["번호", "제조공장", "제조국"], record["제조공장"]),
+            _list_table("연관 인증 번호 상세", ["번호", "인증번호", "인증상태"], record["연관 인증 번호"], "인증번호"),
+        ]
+    )
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>제품인증 상세</title></head>"
+        f"<body><div id='header'><ul class='gnb'><li>제품안전정보</li></ul></div>"
+        f"<div class='contents_area'>{body}</div><div id='footer'>SafetyKorea</div></body></html>"
+    )
+
+
+def list_row(n: int, record: dict) -> dict:
+    """목록 페이지 한 행에 표시되는 요약 컬럼을 반환합니다."""
+    cert_info = record["인증정보"]
+    return {
+        "번호": str(n + 1),
+        "인증구분": cert_info["인증구분"],
+        "품목명": record["제품정보"]["품목명"],
+        "모델명": record["제품정보"]["모델명"],
+        "인증일자": cert_info["인증일자"],
+        "인증상태": cert_info["인증상태"],
+        "인증번호": cert_info["인증번호"],
+    }
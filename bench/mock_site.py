@@ -0,0 +1,223 @@
+"""로컬 모의 SafetyKorea 사이트.
+
+크롤러가 사용하는 경로를 흉내냅니다.
+    /release/itemSearch?page=N                     목록 페이지 (table.tb_list, 페이지 버튼, #loading)
+    /release/itemDetail?certNum=...                상세 페이지 (parse_detail_page 가 기대하는 캡션 구조)
+    /openapi/api/cert/certificationList.json       Open API (conditionKey=certDate, ETag 재검증 지원)
+    /stats                                         경로별 요청 수 (JSON)
+
+사용 예:
+    python -m bench.mock_site --port 8808 --pages 50 --latency 0.05 --error-rate 0.01
+    SAFETYKOREA_BASE_URL=http://127.0.0.1:8808 KC_SLEEP_TIME=0 python kc_crawl_mt.py --threads 10
+    (대기열 모드는 SAFETYKOREA_DETAIL_URL='http://127.0.0.1:8808/release/itemDetail?certNum={cert_num}' 도 지정)
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from bench.corpus import (
+    END_DATE,
+    LIST_COLUMNS,
+    RECORDS_PER_DAY,
+    list_row,
+    make_record,
+    render_detail_html,
+    to_api_record,
+)
+
+ROWS_PER_PAGE = 10
+PAGES_PER_BLOCK = 10
+
+
+class MockSiteConfig:
+    def __init__(self, pages=20, latency=0.0, error_rate=0.0, seed=0):
+        self.pages = pages
+        self.latency = latency
+        self.error_rate = error_rate
+        self.total = pages * ROWS_PER_PAGE
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.requests = Counter()
+        self.requests_lock = threading.Lock()
+
+
+def _record_index(cert_num: str):
+    match = re.search(r"(\d{8})-", cert_num or "")
+    return int(match.group(1)) if match else None
+
+
+def render_list_page(config: MockSiteConfig, page: int) -> str:
+    """목록 페이지 HTML을 생성합니다. 한 페이지에 10건, 페이지 버튼은 10개 단위로 표시합니다."""
+    start = (page - 1) * ROWS_PER_PAGE
+    header = "".join(f"<th scope='col'>{escape(col)}</th>" for col in LIST_COLUMNS)
+    rows = []
+    for n in range(start, min(start + ROWS_PER_PAGE, config.total)):
+        row = list_row(n, make_record(n, config.total))
+        detail_url = f"/release/itemDetail?certNum={quote(row['인증번호'])}"
+        cols = "".join(f"<td>{escape(row[col])}</td>" for col in LIST_COLUMNS)
+        rows.append(f"<tr onclick=\"location.href='{detail_url}'\" style='cursor:pointer'>{cols}</tr>")
+
+    block_start = (page - 1) // PAGES_PER_BLOCK * PAGES_PER_BLOCK + 1
+    block_end = min(block_start + PAGES_PER_BLOCK - 1, config.pages)
+    items = [
+        "<li><a title='처음 페이지' href='?page=1'>&lt;&lt;</a></li>",
+        (
+            f"<li><a title='이전 페이지' href='?page={page - 1}'>&lt;</a></li>"
+            if page > 1
+            else "<li><span>&lt;</span></li>"
+        ),
+    ]
+    for number in range(block_start, block_end + 1):
+        css = " class='on'" if number == page else ""
+        items.append(f"<li><a{css} href='?page={number}'>{number}</a></li>")
+    if page < config.pages:
+        items.append(f"<li><a title='다음 페이지' href='?page={page + 1}'>&gt;</a></li>")
+    else:
+        items.append("<li><span>&gt;</span></li>")
+    items.append(f"<li><a title='마지막 페이지' href='?page={config.pages}'>&gt;&gt;</a></li>")
+
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>제품인증 검색</title></head><body>"
+        "<div id='loading' style='display:none'>loading...</div>"
+        "<div class='contents'><table class='tb_list'><caption>제품인증 목록</caption>"
+        f"<thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+        f"<div class='page'><ul>{''.join(items)}</ul></div></div></body></html>"
+    )
+
+
+def api_records_for_date(config: MockSiteConfig, date_str: str) -> list:
+    """인증일자가 date_str 인 레코드들을 Open API 형식으로 반환합니다."""
+    try:
+        day = datetime.strptime(date_str, "%Y%m%d").date()
+    except ValueError:
+        return []
+    offset = (END_DATE - day).days
+    if offset < 0:
+        return []
+    start = offset * RECORDS_PER_DAY
+    return [
+        to_api_record(make_record(n, config.total)) for n in range(start, min(start + RECORDS_PER_DAY, config.total))
+    ]
+
+
+def make_handler(config: MockSiteConfig):
+    class MockSiteHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, body, content_type="text/html; charset=utf-8", etag=None):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _simulate_network(self):
+            """설정된 지연과 오류율을 적용합니다. 오류를 보냈으면 True를 반환합니다."""
+            with config.random_lock:
+                delay = config.latency * config.random.uniform(0.5, 1.5) if config.latency else 0
+                failed = config.random.random() < config.error_rate
+            if delay:
+                time.sleep(delay)
+            if failed:
+                self._send(500, "<html><body>Internal Server Error</body></html>")
+                return True
+            return False
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            with config.requests_lock:
+                config.requests[url.path] += 1
+
+            if url.path == "/stats":
+                self._send(200, json.dumps(dict(config.requests)), "application/json")
+            elif url.path == "/release/itemSearch":
+                if self._simulate_network():
+                    return
+                page = int(query.get("page", ["1"])[0])
+                self._send(200, render_list_page(config, max(1, min(page, config.pages))))
+            elif url.path == "/release/itemDetail":
+                if self._simulate_network():
+                    return
+                n = _record_index(query.get("certNum", [""])[0])
+                if n is None or n >= config.total:
+                    self._send(404, "<html><body>Not Found</body></html>")
+                    return
+                self._send(200, render_detail_html(make_record(n, config.total)))
+            elif url.path == "/openapi/api/cert/certificationList.json":
+                if self._simulate_network():
+                    return
+                date_str = query.get("conditionValue", [""])[0]
+                result = {
+                    "resultCode": "2000",
+                    "resultMsg": "정상",
+                    "resultData": api_records_for_date(config, date_str),
+                }
+                body = json.dumps(result, ensure_ascii=False)
+                # 캐시 재검증(If-None-Match) 지원
+                etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    with config.requests_lock:
+                        config.requests["304"] += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self._send(200, body, "application/json; charset=utf-8", etag=etag)
+            else:
+                self._send(404, "<html><body>Not Found</body></html>")
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockSiteHandler
+
+
+def start_mock_site(port=0, host="127.0.0.1", **config_kwargs):
+    """모의 사이트를 백그라운드 쓰레드로 시작하고 (server, config)를 반환합니다."""
+    config = MockSiteConfig(**config_kwargs)
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="mock-site", daemon=True)
+    thread.start()
+    return server, config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 SafetyKorea 사이트")
+    parser.add_argument("--port", type=int, default=8808, help="포트 (기본값: 8808)")
+    parser.add_argument("--pages", type=int, default=20, help="목록 페이지 수 (기본값: 20)")
+    parser.add_argument("--latency", type=float, default=0.0, help="평균 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 시드")
+    args = parser.parse_args()
+
+    server, config = start_mock_site(
+        args.port, pages=args.pages, latency=args.latency, error_rate=args.error_rate, seed=args.seed
+    )
+    last_day = END_DATE - timedelta(days=(config.total - 1) // RECORDS_PER_DAY)
+    print(f"모의 사이트 실행 중: http://127.0.0.1:{server.server_address[1]} ({config.total}건)")
+    print(f"Open API 데이터 기간: {last_day:%Y%m%d} ~ {END_DATE:%Y%m%d}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""모의 사이트를 대상으로 크롤러/수집기를 실행하고 처리량, CPU, 메모리를 측정합니다.
+
+사용 예:
+    python -m bench.run_bench --targets mt api --pages 20 --workers 10 --latency 0.05
+    python -m bench.run_bench --targets mt mp sync --sleep 0 --timeout 600 --output bench/results/before.json
+    python -m bench.run_bench --targets mt http --pages 20 --workers 10
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from bench.corpus import END_DATE, RECORDS_PER_DAY
+from bench.mock_site import start_mock_site
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from kc_store import CertStore  # noqa: E402
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 종료 후 getrusage 로만 측정
+    psutil = None
+
+
+def build_command(target, args, api_years):
+    python = sys.executable
+    if target == "mt":
+        return [python, os.path.join(ROOT_DIR, "kc_crawl_mt.py"), "--threads", str(args.workers), "--metrics-port", "0"]
+    if target == "mt_list":
+        return [
+            python,
+            os.path.join(ROOT_DIR, "kc_crawl_mt.py"),
+            "--mode",
+            "list",
+            "--threads",
+            "2",
+            "--metrics-port",
+            "0",
+        ]
+    if target == "mp":
+        return [python, os.path.join(ROOT_DIR, "kc_crawl_mp.py"), "--processes", str(min(args.workers, 10))]
+    if target == "http":
+        # 브라우저 없이 같은 크롤러 코어를 HTTP 백엔드로 실행
+        return [
+            python,
+            os.path.join(ROOT_DIR, "kc_crawl.py"),
+            "--backend",
+            "http",
+            "--executor",
+            "thread",
+            "--workers",
+            str(args.workers),
+            "--metrics-port",
+            "0",
+        ]
+    if target == "sync":
+        return [python, os.path.join(ROOT_DIR, "test_sync.py"), "0", "--output", "output.json"]
+    if target == "api":
+        start_year, end_year = api_years
+        return [
+            python,
+            os.path.join(ROOT_DIR, "fetch_kc_cert.py"),
+            "--start-year",
+            str(start_year),
+            "--end-year",
+            str(end_year),
+            "--metrics-port",
+            "0",
+        ]
+    raise ValueError(f"Unknown target: {target}")
+
+
+def _sample_tree(proc, peak):
+    """프로세스 트리(크롬 포함)의 RSS 합과 CPU 시간을 측정합니다."""
+    try:
+        procs = [proc] + proc.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return peak, None
+    rss = 0
+    cpu = 0.0
+    for p in procs:
+        try:
+            rss += p.memory_info().rss
+            times = p.cpu_times()
+            cpu += times.user + times.system
+        except psutil.NoSuchProcess:
+            continue
+    return max(peak, rss), cpu
+
+
+def run_target(target, args, base_url, api_years):
+    """대상 하나를 임시 작업 디렉토리에서 실행하고 결과를 반환합니다."""
+    workdir = tempfile.mkdtemp(prefix=f"kc_bench_{target}_")
+    env = dict(os.environ)
+    env.update(
+        {
+            "SAFETYKOREA_BASE_URL": base_url,
+            "SAFETYKOREA_DETAIL_URL": f"{base_url}/release/itemDetail?certNum={{cert_num}}",
+            "SAFETYKOREA_API_URL": f"{base_url}/openapi/api/cert/certificationList.json",
+            "KC_SLEEP_TIME": str(args.sleep),
+            "PYTHONPATH": ROOT_DIR + os.pathsep + env.get("PYTHONPATH", ""),
+        }
+    )
+    command = build_command(target, args, api_years)
+    log_path = os.path.join(workdir, "stdout.log")
+    usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    started = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        process = subprocess.Popen(command, cwd=workdir, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        ps_proc = psutil.Process(process.pid) if psutil else None
+        peak_rss, cpu_seconds, timed_out = 0, None, False
+        while process.poll() is None:
+            if ps_proc:
+                peak_rss, cpu = _sample_tree(ps_proc, peak_rss)
+                cpu_seconds = cpu if cpu is not None else cpu_seconds
+            if time.perf_counter() - started > args.timeout:
+                timed_out = True
+                if ps_proc:
+                    for child in ps_proc.children(recursive=True):
+                        child.kill()
+                process.kill()
+                break
+            time.sleep(args.sample_interval)
+        process.wait()
+    elapsed = time.perf_counter() - started
+
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    if cpu_seconds is None:
+        cpu_seconds = (usage_after.ru_utime - usage_before.ru_utime) + (usage_after.ru_stime - usage_before.ru_stime)
+    if not peak_rss:
+        # ru_maxrss 는 가장 큰 자식 프로세스 하나의 값(KB)
+        peak_rss = usage_after.ru_maxrss * 1024
+
+    db_path = os.path.join(workdir, "data", "certificates.db")
+    records = 0
+    if os.path.exists(db_path):
+        with CertStore(db_path) as store:
+            counts = store.count()
+            # 목록 수집 모드는 상세 레코드 대신 목록 요약 건수로 측정
+            records = counts["summaries"] if target == "mt_list" else counts["total"]
+
+    return {
+        "target": target,
+        "command": " ".join(command[1:]),
+        "records": records,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(records / elapsed, 3) if elapsed else 0.0,
+        "cpu_seconds": round(cpu_seconds, 3),
+        "peak_rss_mb": round(peak_rss / 1024 / 1024, 1),
+        "exit_code": process.returncode,
+        "timed_out": timed_out,
+        "workdir": workdir,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 사이트 기반 크롤러 벤치마크")
+    parser.add_argument(
+        "--targets", nargs="+", default=["mt", "api"], choices=["mt", "mt_list", "mp", "sync", "http", "api"]
+    )
+    parser.add_argument("--pages", type=int, default=10, help="모의 사이트 목록 페이지 수 (기본값: 10)")
+    parser.add_argument("--workers", type=int, default=10, help="쓰레드/프로세스 수 (기본값: 10)")
+    parser.add_argument("--latency", type=float, default=0.0, help="모의 사이트 평균 응답 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모의 사이트 HTTP 500 비율")
+    parser.add_argument("--sleep", type=float, default=0.0, help="크롤러 고정 대기 시간 KC_SLEEP_TIME (기본값: 0)")
+    parser.add_argument("--timeout", type=float, default=900, help="대상별 최대 실행 시간 (초)")
+    parser.add_argument("--sample-interval", type=float, default=0.5, help="CPU/RSS 측정 간격 (초)")
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    server, config = start_mock_site(pages=args.pages, latency=args.latency, error_rate=args.error_rate)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    first_day = END_DATE - timedelta(days=(config.total - 1) // RECORDS_PER_DAY)
+    api_years = (first_day.year, END_DATE.year)
+    print(f"모의 사이트: {base_url} ({config.total}건, latency={args.latency}s, error_rate={args.error_rate})")
+
+    results = []
+    for target in args.targets:
+        print(f"\n==== {target} 실행 ====")
+        result = run_target(target, args, base_url, api_years)
+        results.append(result)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    server.shutdown()
+
+    print(f"\n{'target':<10} {'records':>8} {'sec':>9} {'rec/s':>8} {'cpu_s':>8} {'rss_mb':>8}")
+    for r in results:
+        print(
+            f"{r['target']:<10} {r['records']:>8} {r['elapsed_seconds']:>9.1f} {r['records_per_second']:>8.2f} "
+            f"{r['cpu_seconds']:>8.1f} {r['peak_rss_mb']:>8.1f}"
+        )
+
+    output = args.output or os.path.join(
+        ROOT_DIR, "bench", "results", f"run_bench_{datetime.now().strftime('%y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "config": vars(args),
+                "requests": dict(config.requests),
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=4,
+        )
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
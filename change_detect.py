@@ -0,0 +1,121 @@
+import argparse
+import hashlib
+import re
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# 인증 상태 변화를 판단하는 필드 (인증상태, 인증변경일자, 인증변경사유)
+FINGERPRINT_FIELDS = ("cert_state", "change_date", "change_reason")
+
+# 크롤러 상세 레코드/목록 요약(한글 키)과 Open API 레코드(camelCase 키)의 필드 매핑
+KOREAN_FIELD_MAP = {"인증상태": "cert_state", "인증변경일자": "change_date", "인증변경사유": "change_reason"}
+API_FIELD_MAP = {"certState": "cert_state", "certChgDate": "change_date", "certChgReason": "change_reason"}
+
+
+def _normalize(field: str, value) -> str:
+    value = "" if value is None else str(value).strip()
+    if field == "change_date":
+        digits = re.sub(r"\D", "", value)
+        return digits[:8] if len(digits) >= 8 else ""
+    return value
+
+
+def observed_fields(record: Mapping) -> Tuple[Optional[str], Dict[str, str]]:
+    """레코드에서 (인증번호, 관측된 지문 필드)를 추출합니다.
+
+    목록 요약, 상세 레코드, Open API 레코드를 모두 지원하며, 비어 있는 필드는 관측되지 않은 것으로 봅니다.
+    """
+    if "인증정보" in record:
+        source = record["인증정보"]
+        cert_num = source.get("인증번호")
+        mapping = KOREAN_FIELD_MAP
+    elif "certNum" in record:
+        source = record
+        cert_num = record.get("certNum")
+        mapping = API_FIELD_MAP
+    else:
+        source = record
+        cert_num = record.get("인증번호")
+        mapping = KOREAN_FIELD_MAP
+
+    observed = {}
+    for key, field in mapping.items():
+        value = _normalize(field, source.get(key))
+        if value:
+            observed[field] = value
+    return (cert_num.strip() if cert_num else None), observed
+
+
+def fingerprint(values: Mapping) -> str:
+    """지문 필드 값으로 해시를 계산합니다."""
+    payload = "\x1f".join(_normalize(field, values.get(field)) for field in FINGERPRINT_FIELDS)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def moved_fields(stored: Mapping, observed: Mapping) -> List[str]:
+    """저장된 지문과 비교해 값이 바뀐 필드 목록을 반환합니다. 관측되지 않은 필드는 비교하지 않습니다."""
+    return [
+        field
+        for field in FINGERPRINT_FIELDS
+        if field in observed and observed[field] != _normalize(field, stored[field])
+    ]
+
+
+class ChangeDetector:
+    """저장된 상세 데이터의 지문과 새 관측값을 비교해 상세 재수집 대상을 결정합니다."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def reason_for(self, record: Mapping, include_new: bool = True) -> Tuple[Optional[str], Optional[str]]:
+        """(인증번호, 재수집 사유)를 반환합니다. 재수집이 필요 없으면 사유는 None 입니다."""
+        cert_num, observed = observed_fields(record)
+        if not cert_num:
+            return None, None
+        stored = self.store.get_fingerprint(cert_num)
+        if stored is None:
+            return cert_num, ("new" if include_new else None)
+        moved = moved_fields(stored, observed)
+        if moved:
+            return cert_num, "changed:" + ",".join(moved)
+        return cert_num, None
+
+    def plan_refresh(self, records, include_new: bool = False) -> List[Tuple[str, str]]:
+        """관측된 레코드 중 상세 재수집이 필요한 것을 대기열에 넣고 (인증번호, 사유) 목록을 반환합니다."""
+        planned = []
+        for record in records:
+            cert_num, reason = self.reason_for(record, include_new)
+            if reason:
+                planned.append((cert_num, reason))
+        self.store.enqueue_details(planned)
+        return planned
+
+
+def main():
+    from kc_record import iter_chunks, iter_json_records
+    from kc_store import CertStore, DEFAULT_DB_PATH, IMPORT_CHUNK_ROWS
+
+    parser = argparse.ArgumentParser(description="인증 상태 변경 감지 및 상세 재수집 대기열 생성")
+    parser.add_argument("files", nargs="*", help="Open API 결과 JSON 파일 (certifications_{year}.json 등)")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    parser.add_argument("--summaries", action="store_true", help="DB에 저장된 목록 요약 정보도 다시 비교합니다.")
+    parser.add_argument("--include-new", action="store_true", help="상세 데이터가 없는 인증번호도 대기열에 넣습니다.")
+    args = parser.parse_args()
+
+    with CertStore(args.db) as store:
+        detector = ChangeDetector(store)
+        planned = []
+        for file_path in args.files:
+            total = 0
+            for chunk in iter_chunks(iter_json_records(file_path), IMPORT_CHUNK_ROWS):
+                planned += detector.plan_refresh(chunk, include_new=args.include_new)
+                total += len(chunk)
+            print(f"{file_path}: {total}건 비교")
+        if args.summaries:
+            planned += detector.plan_refresh(store.iter_list_summaries(), include_new=args.include_new)
+
+    changed = sum(1 for _, reason in planned if reason.startswith("changed"))
+    print(f"* 상세 재수집 대기: {len(planned)}건 (변경: {changed}건, 신규: {len(planned) - changed}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""워커별 크롤러 출력 파일을 인증번호 기준으로 합칩니다.
+
+파일들을 메모리에 한 번에 올리지 않고, 정해진 건수(run_size)씩 인증번호 순으로 정렬한 임시 파일(run)을 만든 뒤
+k-way 병합하면서 인증번호별로 인증변경일자가 가장 최근인 레코드 한 건만 내보냅니다 (외부 병합 정렬).
+인증변경일자가 같으면 나중에 읽은 레코드를 사용합니다 (kc_store 의 upsert 와 같은 규칙).
+
+사용 예:
+    python consolidate.py output/*.jsonl --output output/consolidated.jsonl
+    python consolidate.py --output output/consolidated.kcz  # 압축 블록 파일로 저장 (kc_pack)
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import os
+import tempfile
+from itertools import chain, groupby
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from kc_pack import PACK_SUFFIX, PackWriter
+from kc_record import iter_output_records
+from kc_store import normalize_date
+
+# 한 run 에 담는 레코드 수 (메모리에는 이 건수만큼의 JSON 문자열만 유지)
+RUN_SIZE = 200_000
+# 한 번에 병합하는 run 수. 이보다 많으면 여러 단계로 나눠서 병합 (열린 파일 수 제한)
+MERGE_FAN_IN = 64
+
+
+def _run_line(cert_key: str, change_date: str, seq: int, record_json: str) -> str:
+    # 인증번호/날짜/순번은 탭이 없고, json.dumps 는 문자열 안의 탭을 이스케이프하므로 탭으로 구분
+    return f"{cert_key}\t{change_date}\t{seq:012d}\t{record_json}\n"
+
+
+def _line_key(line: str) -> str:
+    return line[: line.index("\t")]
+
+
+def _line_rank(line: str):
+    """같은 인증번호 중 가장 큰 값이 최종 레코드 (인증변경일자, 읽은 순서)"""
+    _, change_date, seq, _ = line.split("\t", 3)
+    return change_date, seq
+
+
+def _line_json(line: str) -> str:
+    return line.split("\t", 3)[3].rstrip("\n")
+
+
+def _latest(lines: Iterable[str]) -> Iterator[str]:
+    """인증번호 순으로 정렬된 run 줄에서 인증번호별 최종 레코드만 남깁니다."""
+    for _, group in groupby(lines, key=_line_key):
+        yield max(group, key=_line_rank)
+
+
+class Consolidator:
+    """크롤러 출력 레코드들을 인증번호별 최신 레코드 하나씩으로 합칩니다.
+
+    records()/lines() 는 인증번호 순서로 레코드를 내보내며, 순회가 끝나면 임시 파일을 지웁니다.
+    순회 후 read/invalid/written/runs 에 처리 건수가 기록됩니다.
+    """
+
+    def __init__(self, records: Iterable[Dict], run_size: int = RUN_SIZE, tmp_dir: Optional[str] = None):
+        self.source = records
+        self.run_size = run_size
+        self.tmp_dir = tmp_dir
+        self.read = 0  # 읽은 레코드 수
+        self.invalid = 0  # 인증번호가 없어서 제외한 레코드 수
+        self.written = 0  # 내보낸 (중복 제거된) 레코드 수
+        self.runs = 0  # 처음 만든 run 수
+
+    @property
+    def duplicates(self) -> int:
+        return self.read - self.invalid - self.written
+
+    def _write_run(self, work_dir: str, buffer: Dict[str, str]) -> str:
+        path = os.path.join(work_dir, f"run-{self.runs:05d}.tsv")
+        self.runs += 1
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(buffer[key] for key in sorted(buffer))
+        return path
+
+    def _make_runs(self, work_dir: str) -> List[str]:
+        """레코드를 run_size 건씩 인증번호 순으로 정렬된 run 파일로 씁니다. run 안의 중복은 미리 제거합니다."""
+        runs = []
+        buffer: Dict[str, str] = {}
+        for record in self.source:
+            self.read += 1
+            cert_info = record.get("인증정보", {})
+            cert_num = (cert_info.get("인증번호") or "").strip()
+            if not cert_num:
+                self.invalid += 1
+                continue
+            key = cert_num.lower()
+            change_date = normalize_date(cert_info.get("인증변경일자"))
+            previous = buffer.get(key)
+            if previous is None or change_date >= _line_rank(previous)[0]:
+                buffer[key] = _run_line(key, change_date, self.read, json.dumps(record, ensure_ascii=False))
+            if len(buffer) >= self.run_size:
+                runs.append(self._write_run(work_dir, buffer))
+                buffer = {}
+        if buffer:
+            runs.append(self._write_run(work_dir, buffer))
+        return runs
+
+    def _merge(self, runs: List[str]) -> Iterator[str]:
+        files = [open(path, "r", encoding="utf-8") for path in runs]
+        try:
+            yield from _latest(heapq.merge(*files, key=_line_key))
+        finally:
+            for f in files:
+                f.close()
+
+    def _reduce_runs(self, work_dir: str, runs: List[str]) -> List[str]:
+        """run 이 MERGE_FAN_IN 개보다 많으면 MERGE_FAN_IN 개씩 병합해서 run 수를 줄입니다."""
+        level = 0
+        while len(runs) > MERGE_FAN_IN:
+            merged = []
+            for i in range(0, len(runs), MERGE_FAN_IN):
+                path = os.path.join(work_dir, f"merge-{level}-{i // MERGE_FAN_IN:05d}.tsv")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.writelines(self._merge(runs[i : i + MERGE_FAN_IN]))
+                for run in runs[i : i + MERGE_FAN_IN]:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            level += 1
+        return runs
+
+    def lines(self) -> Iterator[str]:
+        """인증번호별 최종 레코드를 JSON 문자열(줄바꿈 없음)로 내보냅니다."""
+        with tempfile.TemporaryDirectory(prefix="consolidate-", dir=self.tmp_dir) as work_dir:
+            runs = self._reduce_runs(work_dir, self._make_runs(work_dir))
+            for line in self._merge(runs):
+                self.written += 1
+                yield _line_json(line)
+
+    def records(self) -> Iterator[Dict]:
+        """인증번호별 최종 레코드를 dict 로 내보냅니다."""
+        for record_json in self.lines():
+            yield json.loads(record_json)
+
+
+def default_inputs(output_dir: str = "output") -> List[str]:
+    patterns = [os.path.join(output_dir, f"*{suffix}") for suffix in (".json", ".jsonl", PACK_SUFFIX)]
+    return sorted(path for pattern in patterns for path in glob.glob(pattern))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커별 크롤러 출력 파일을 인증번호별 최신 레코드로 합칩니다.")
+    parser.add_argument("files", nargs="*", help="합칠 JSON/JSONL/.kcz 파일 (기본값: output 디렉토리의 모든 파일)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="consolidated.jsonl",
+        help=f"결과 JSONL 파일, {PACK_SUFFIX} 로 끝나면 압축 블록 파일 (기본값: consolidated.jsonl)",
+    )
+    parser.add_argument("--run-size", type=int, default=RUN_SIZE, help=f"정렬 단위 레코드 수 (기본값: {RUN_SIZE})")
+    parser.add_argument(
+        "--tmp-dir", type=str, default=None, help="임시 run 파일 디렉토리 (기본값: 시스템 임시 디렉토리)"
+    )
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    paths = [path for path in (args.files or default_inputs()) if os.path.abspath(path) != output]
+    if not paths:
+        print("합칠 파일이 없습니다.")
+        return
+
+    consolidator = Consolidator(chain.from_iterable(map(iter_output_records, paths)), args.run_size, args.tmp_dir)
+    tmp_output = output + ".tmp"
+    if output.endswith(PACK_SUFFIX):
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)  # PackWriter 는 기존 파일에 이어서 쓰므로 이전 임시 파일 제거
+        with PackWriter(tmp_output) as writer:
+            for record in consolidator.records():
+                writer.write(record)
+    else:
+        with open(tmp_output, "w", encoding="utf-8") as f:
+            for record_json in consolidator.lines():
+                f.write(record_json + "\n")
+    os.replace(tmp_output, output)
+
+    print(f"* 입력 파일 {len(paths)}개, 레코드 {consolidator.read}건 (run {consolidator.runs}개)")
+    print(f"- 인증번호 없음: {consolidator.invalid}건")
+    print(f"- 중복 제거: {consolidator.duplicates}건")
+    print(f"- 저장: {consolidator.written}건 -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
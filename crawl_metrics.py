@@ -0,0 +1,240 @@
+import atexit
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+
+# 기본 지연시간 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: Tuple, extra: Optional[Dict[str, str]] = None) -> str:
+    items = list(key) + list((extra or {}).items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in items) + "}"
+
+
+class Counter:
+    """단조 증가하는 카운터입니다."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def total(self) -> float:
+        return sum(self._values.values())
+
+    def render(self):
+        with self._lock:
+            values = dict(self._values)
+        if not values:
+            yield f"{self.name} 0"
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(key)} {value:g}"
+
+    def summary(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(key)}: {value:g}"
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self, n_buckets: int):
+        self.counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram:
+    """누적 버킷 히스토그램입니다. 지연시간 측정에 사용합니다."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets) + 1)
+            series.counts[idx] += 1
+            series.sum += value
+            series.count += 1
+            series.max = max(series.max, value)
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록의 실행 시간을 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def quantile(self, q: float, **labels) -> float:
+        """버킷 경계 기준의 근사 분위수를 반환합니다."""
+        series = self._series.get(_label_key(labels))
+        if series is None or series.count == 0:
+            return 0.0
+        target = q * series.count
+        cumulative = 0
+        for bound, count in zip(self.buckets + (series.max,), series.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(bound, series.max)
+        return series.max
+
+    def render(self):
+        with self._lock:
+            items = sorted(self._series.items())
+            for key, series in items:
+                cumulative = 0
+                for bound, count in zip(self.buckets, series.counts):
+                    cumulative += count
+                    yield f"{self.name}_bucket{_format_labels(key, {'le': f'{bound:g}'})} {cumulative}"
+                yield f"{self.name}_bucket{_format_labels(key, {'le': '+Inf'})} {series.count}"
+                yield f"{self.name}_sum{_format_labels(key)} {series.sum:.6f}"
+                yield f"{self.name}_count{_format_labels(key)} {series.count}"
+
+    def summary(self):
+        with self._lock:
+            items = sorted(self._series.items())
+        for key, series in items:
+            if series.count == 0:
+                continue
+            labels = dict(key)
+            yield (
+                f"{self.name}{_format_labels(key)}: count={series.count} total={series.sum:.2f}s "
+                f"avg={series.sum / series.count:.3f}s p50<={self.quantile(0.5, **labels):g}s "
+                f"p95<={self.quantile(0.95, **labels):g}s max={series.max:.3f}s"
+            )
+
+
+class MetricsRegistry:
+    """이름으로 메트릭을 등록/조회하고 Prometheus 텍스트 형식으로 출력합니다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self.started_at = time.time()
+
+    def _get_or_create(self, cls, name, help_text, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets=buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition 형식으로 변환합니다."""
+        lines = []
+        uptime = time.time() - self.started_at
+        lines.append("# HELP process_uptime_seconds Seconds since the metrics registry was created.")
+        lines.append("# TYPE process_uptime_seconds gauge")
+        lines.append(f"process_uptime_seconds {uptime:.3f}")
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """사람이 읽기 쉬운 요약과 분당 처리량을 반환합니다."""
+        uptime = max(time.time() - self.started_at, 1e-9)
+        lines = [f"uptime: {uptime:.1f}s"]
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.summary())
+            if isinstance(metric, Counter) and metric.total():
+                lines.append(f"{metric.name} rate: {metric.total() * 60 / uptime:.2f}/min")
+        return "\n".join(lines)
+
+
+REGISTRY = MetricsRegistry()
+
+
+def timed(histogram: Histogram, **labels):
+    """함수 실행 시간을 히스토그램에 기록하는 데코레이터입니다."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_http_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY):
+    """/metrics(Prometheus), /summary(텍스트 요약)를 제공하는 HTTP 서버를 백그라운드 쓰레드로 실행합니다."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/metrics"):
+                body = registry.render().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path.startswith("/summary") or self.path == "/":
+                body = registry.summary().encode("utf-8")
+                content_type = "text/plain; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # 스크래핑 요청마다 콘솔에 출력하지 않음
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
+
+
+def dump_summary_at_exit(registry: MetricsRegistry = REGISTRY, output=print):
+    """프로세스 종료 시 메트릭 요약을 출력하도록 등록합니다."""
+    atexit.register(lambda: output("\n==== 크롤링 메트릭 요약 ====\n" + registry.summary()))
@@ -1,65 +1,293 @@
 import asyncio
 import aiohttp
+import argparse
+import calendar
+import contextlib
 import json
-from datetime import datetime, timedelta
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
 
-API_URL = "http://www.safetykorea.kr/openapi/api/cert/certificationList.json"
+import crawl_metrics
+from crawl_metrics import REGISTRY
+
+from http_cache import DEFAULT_CACHE_PATH, DEFAULT_TTL, HttpCache, cache_key
+from kc_store import CertStore, DEFAULT_DB_PATH
+from maker_index import update_index
+from reconcile import reconcile
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 디코딩
+    orjson = None
+
+API_URL = os.environ.get("SAFETYKOREA_API_URL", "http://www.safetykorea.kr/openapi/api/cert/certificationList.json")
 AUTH_KEY = "a5aa605a-1f01-4acd-b08d-21d425f8dc5a"
 
+# 전체 프로세스가 공유하는 초당 요청 한도와 프로세스별 동시 요청 수 (API 호출 한도에 맞춰 조정)
+DEFAULT_RATE = 20.0
+DEFAULT_CONCURRENCY = 16
+
+API_REQUESTS_TOTAL = REGISTRY.counter("api_requests_total", "Open API requests, by outcome.")
+API_RECORDS_TOTAL = REGISTRY.counter("api_records_total", "Records returned by the open API.")
+API_REQUEST_SECONDS = REGISTRY.histogram("api_request_seconds", "Open API request latency including decode.")
+
+
+def decode_json(body: bytes):
+    """응답 본문을 디코딩합니다. 이벤트 루프를 막지 않도록 executor 에서 호출합니다."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class RateBudget:
+    """여러 프로세스가 공유하는 초당 요청 한도입니다.
+
+    다음 요청 가능 시각을 공유 메모리에 두고, 요청마다 슬롯을 하나씩 예약합니다.
+    프로세스 풀의 initializer 인자로 넘겨서 공유합니다.
+    """
 
-async def fetch_cert_by_date(session, date_str):
+    def __init__(self, rate: float):
+        ctx = multiprocessing.get_context()
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = ctx.Value("d", 0.0, lock=False)
+        self.lock = ctx.Lock()
+
+    def reserve(self) -> float:
+        """다음 요청 슬롯을 예약하고, 슬롯까지 기다려야 하는 시간(초)을 반환합니다."""
+        if not self.interval:
+            return 0.0
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.next_slot.value)
+            self.next_slot.value = slot + self.interval
+        return slot - now
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def fetch_cert_by_date(session, date_str, budget=None, semaphore=None, samples=None, cache=None):
     headers = {"AuthKey": AUTH_KEY}
     params = {"conditionKey": "certDate", "conditionValue": date_str}
-    try:
-        async with session.get(API_URL, headers=headers, params=params) as response:
-            if response.status == 200:
-                result = await response.json()
-                if result.get("resultCode") == "2000":
+    key = cache_key(API_URL, params)
+    loop = asyncio.get_running_loop()
+    # 캐시(SQLite) 조회/저장은 디스크 I/O 가 동시 요청을 직렬화하지 않도록 executor 에서 실행
+    entry = await loop.run_in_executor(None, cache.get, key) if cache is not None else None
+    async with semaphore or contextlib.nullcontext():
+        started = time.perf_counter()
+        outcome = "exception"
+        try:
+            if entry is not None and cache.is_fresh(entry):
+                outcome = "cache_hit"
+                result = await loop.run_in_executor(None, decode_json, entry.body)
+                return result.get("resultData", [])
+            if cache is not None and cache.offline:
+                outcome = "cache_miss"
+                print(f"[{date_str}] 오프라인 모드: 캐시된 응답이 없습니다.")
+                return []
+
+            if budget is not None:
+                await budget.acquire()
+            headers.update(HttpCache.conditional_headers(entry))
+            async with session.get(API_URL, headers=headers, params=params) as response:
+                if response.status == 304 and entry is not None:
+                    # 변경 없음: 캐시된 응답을 그대로 사용
+                    await loop.run_in_executor(None, cache.revalidated, key, response.headers)
+                    outcome = "not_modified"
+                    result = await loop.run_in_executor(None, decode_json, entry.body)
                     return result.get("resultData", [])
+                if response.status == 200:
+                    body = await response.read()
+                    result = await loop.run_in_executor(None, decode_json, body)
+                    if result.get("resultCode") == "2000":
+                        outcome = "ok"
+                        records = result.get("resultData", [])
+                        API_RECORDS_TOTAL.inc(len(records))
+                        # 정상 응답만 캐시
+                        if cache is not None:
+                            await loop.run_in_executor(None, cache.put, key, str(response.url), body, response.headers)
+                        return records
+                    else:
+                        outcome = "api_error"
+                        print(f"[{date_str}] API 오류: {result.get('resultMsg')}")
                 else:
-                    print(f"[{date_str}] API 오류: {result.get('resultMsg')}")
-            else:
-                print(f"[{date_str}] HTTP 오류: {response.status}")
-    except Exception as e:
-        print(f"[{date_str}] 예외 발생: {e}")
+                    outcome = f"http_{response.status}"
+                    print(f"[{date_str}] HTTP 오류: {response.status}")
+        except Exception as e:
+            print(f"[{date_str}] 예외 발생: {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            API_REQUESTS_TOTAL.inc(outcome=outcome)
+            API_REQUEST_SECONDS.observe(elapsed)
+            if samples is not None:
+                samples.append((outcome, elapsed))
     return []
 
 
-async def fetch_certifications_for_year(year):
-    start_date = datetime(year, 1, 1)
-    end_date = datetime(year, 12, 31)
+async def fetch_date_range(
+    start_date, end_date, budget=None, concurrency=DEFAULT_CONCURRENCY, samples=None, cache=None
+):
+    """start_date ~ end_date (포함) 의 인증 데이터를 날짜별로 수집합니다."""
     dates = []
     current = start_date
     while current <= end_date:
         dates.append(current.strftime("%Y%m%d"))
         current += timedelta(days=1)
 
-    data_year = []
+    semaphore = asyncio.Semaphore(concurrency)
+    data = []
     async with aiohttp.ClientSession() as session:
-        tasks = [fetch_cert_by_date(session, date_str) for date_str in dates]
+        tasks = [fetch_cert_by_date(session, date_str, budget, semaphore, samples, cache) for date_str in dates]
         results = await asyncio.gather(*tasks)
         for date_str, daily_data in zip(dates, results):
             print(f"{date_str}에 {len(daily_data)}건의 데이터 수집됨")
-            data_year.extend(daily_data)
-    return data_year
-
-
-async def main():
-    current_year = datetime.now().year
-    all_years_data = {}
-    for year in range(2000, current_year + 1):
-        print(f"\n==== {year}년 데이터 수집 시작 ====")
-        data_year = await fetch_certifications_for_year(year)
-        all_years_data[year] = data_year
-        file_name = f"certifications_{year}.json"
-        with open(file_name, "w", encoding="utf-8") as f:
-            json.dump(data_year, f, ensure_ascii=False, indent=4)
-        print(f"{year}년: 총 {len(data_year)} 건의 데이터 저장됨. (파일명: {file_name})")
+            data.extend(daily_data)
+    return data
+
+
+async def fetch_certifications_for_year(year):
+    return await fetch_date_range(date(year, 1, 1), date(year, 12, 31))
+
+
+def make_shards(start_year, end_year):
+    """수집 기간을 월 단위 (시작일, 종료일) 구간으로 나눕니다."""
+    shards = []
+    for year in range(start_year, end_year + 1):
+        for month in range(1, 13):
+            last_day = calendar.monthrange(year, month)[1]
+            shards.append((date(year, month, 1), date(year, month, last_day)))
+    return shards
+
+
+_shard_budget = None
+_shard_concurrency = DEFAULT_CONCURRENCY
+_shard_cache = None
+
+
+def _init_shard_worker(budget, concurrency, cache_options=None):
+    global _shard_budget, _shard_concurrency, _shard_cache
+    _shard_budget = budget
+    _shard_concurrency = concurrency
+    # SQLite 커넥션은 프로세스 간에 공유할 수 없으므로 프로세스마다 캐시를 새로 엽니다.
+    _shard_cache = HttpCache(**cache_options) if cache_options else None
+
+
+def fetch_shard(shard):
+    """(프로세스 풀 작업) 날짜 구간 하나를 프로세스 자체 이벤트 루프로 수집합니다.
+
+    메트릭은 프로세스별로 따로 쌓이므로 요청 결과/지연을 함께 반환해 메인 프로세스에서 합산합니다.
+    """
+    start_date, end_date = shard
+    samples = []
+    records = asyncio.run(
+        fetch_date_range(start_date, end_date, _shard_budget, _shard_concurrency, samples, _shard_cache)
+    )
+    return records, samples
+
+
+def _save_year(store, db_path, year, data_year):
+    accepted = store.upsert_api_records(data_year)
+    print(f"{year}년: {accepted}건 DB 저장/갱신됨 ({db_path})")
+    # 상태가 바뀌었거나 상세 데이터(제조공장 목록, 연관 인증 번호)가 아직 없는 인증번호를 브라우저 수집 대기열에 추가
+    stats = reconcile(store, data_year)
+    print(f"{year}년: 상세 수집 대상 - 상태 변경 {stats['changed']}건, 상세 데이터 없음 {stats['gaps']}건")
+    file_name = f"certifications_{year}.json"
+    with open(file_name, "w", encoding="utf-8") as f:
+        json.dump(data_year, f, ensure_ascii=False, indent=4)
+    print(f"{year}년: 총 {len(data_year)} 건의 데이터 저장됨. (파일명: {file_name})")
+
+
+def main(
+    db_path=DEFAULT_DB_PATH,
+    start_year=2000,
+    end_year=None,
+    workers=None,
+    rate=DEFAULT_RATE,
+    concurrency=DEFAULT_CONCURRENCY,
+    cache_options=None,
+):
+    """수집 기간을 월 단위로 나눠 프로세스 풀에서 수집하고, 연도별로 합쳐서 저장합니다.
+
+    모든 프로세스는 하나의 요청 한도(rate, 초당 요청 수)를 공유합니다.
+    cache_options 는 HttpCache 인자(dict)이며, None 이면 응답을 캐시하지 않습니다.
+    """
+    end_year = end_year or datetime.now().year
+    shards = make_shards(start_year, end_year)
+    workers = min(workers or os.cpu_count() or 1, len(shards))
+    print(f"{start_year}~{end_year}년 {len(shards)}개 구간 수집 (프로세스 {workers}개, 초당 {rate}건)")
+
+    all_years_data = {year: [] for year in range(start_year, end_year + 1)}
+    store = CertStore(db_path)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_shard_worker, initargs=(RateBudget(rate), concurrency, cache_options)
+    ) as pool:
+        # map 은 구간 순서대로 결과를 돌려주므로, 12월 구간이 도착하면 해당 연도가 완료된 것
+        for (start_date, end_date), (records, samples) in zip(shards, pool.map(fetch_shard, shards)):
+            year = start_date.year
+            all_years_data[year].extend(records)
+            API_RECORDS_TOTAL.inc(len(records))
+            for outcome, elapsed in samples:
+                API_REQUESTS_TOTAL.inc(outcome=outcome)
+                API_REQUEST_SECONDS.observe(elapsed)
+            if end_date.month == 12:
+                print(f"\n==== {year}년 데이터 수집 완료 ====")
+                _save_year(store, db_path, year, all_years_data[year])
 
     with open("certifications_all_years.json", "w", encoding="utf-8") as f:
         json.dump(all_years_data, f, ensure_ascii=False, indent=4)
+    store.close()
     print("\n모든 연도 데이터 저장 완료.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="KC 인증 Open API 수집기")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    parser.add_argument(
+        "--metrics-port", type=int, default=9109, help="메트릭 HTTP 포트 (기본값: 9109, 0이면 비활성화)"
+    )
+    parser.add_argument("--start-year", type=int, default=2000, help="수집 시작 연도 (기본값: 2000)")
+    parser.add_argument("--end-year", type=int, default=None, help="수집 종료 연도 (기본값: 올해)")
+    parser.add_argument("--workers", type=int, default=None, help="수집 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"전체 초당 요청 수 한도 (기본값: {DEFAULT_RATE}, 0이면 무제한)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"프로세스별 동시 요청 수 (기본값: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache", type=str, default=DEFAULT_CACHE_PATH, help=f"응답 캐시 경로 (기본값: {DEFAULT_CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help=f"캐시 유효 시간(초) (기본값: {DEFAULT_TTL}, 0이면 항상 재검증)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 사용하지 않습니다.")
+    parser.add_argument("--offline", action="store_true", help="네트워크 요청 없이 캐시된 응답만 사용합니다.")
+    parser.add_argument(
+        "--index", type=str, default=None, help="수집이 끝난 뒤 증분 갱신할 검색 인덱스 파일 (예: data/maker_index.bin)"
+    )
+    args = parser.parse_args()
+
+    cache_options = None
+    if not args.no_cache:
+        cache_options = {"path": args.cache, "ttl": args.cache_ttl, "offline": args.offline}
+
+    if args.metrics_port:
+        crawl_metrics.start_http_server(args.metrics_port)
+    crawl_metrics.dump_summary_at_exit()
+    main(args.db, args.start_year, args.end_year, args.workers, args.rate, args.concurrency, cache_options)
+    if args.index:
+        update_index(args.db, args.index)
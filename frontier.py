@@ -0,0 +1,120 @@
+import argparse
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from kc_store import CertStore, DEFAULT_DB_PATH, normalize_date
+
+# 연관 인증 번호를 상세 수집 대기열에 넣을 때 사용하는 사유
+RELATED_REASON = "related"
+
+# 우선순위 가중치: 유효한 인증 > 최근 인증 > 중국 제조
+ACTIVE_STATES = {"적합"}
+ACTIVE_WEIGHT = 3.0
+RECENCY_WEIGHT = 2.0
+RECENCY_YEARS = 10  # 이보다 오래된 인증은 최근성 점수 0
+CHINA_WEIGHT = 1.0
+CHINA_COUNTRIES = {"중국", "CHINA", "CN"}
+
+
+def _recency(value: Optional[str], today: Optional[date] = None) -> float:
+    """인증(변경)일자가 최근일수록 1에 가까운 값을 반환합니다."""
+    digits = normalize_date(value)
+    if not digits:
+        return 0.0
+    try:
+        day = datetime.strptime(digits, "%Y%m%d").date()
+    except ValueError:
+        return 0.0
+    age_years = ((today or date.today()) - day).days / 365.25
+    return max(0.0, 1.0 - max(0.0, age_years) / RECENCY_YEARS)
+
+
+def priority(state: Optional[str] = None, cert_date: Optional[str] = None, countries=(), today=None) -> float:
+    """인증 상태, 인증(변경)일자, 제조국으로 수집 우선순위를 계산합니다. 클수록 먼저 수집합니다."""
+    score = 0.0
+    if state and state.strip() in ACTIVE_STATES:
+        score += ACTIVE_WEIGHT
+    score += RECENCY_WEIGHT * _recency(cert_date, today)
+    if any((country or "").strip().upper() in CHINA_COUNTRIES for country in countries):
+        score += CHINA_WEIGHT
+    return round(score, 4)
+
+
+def related_leads(record: Mapping, today=None) -> List[Tuple[str, str, float, None]]:
+    """상세 레코드의 연관 인증 번호를 (인증번호, 사유, 우선순위, 상세 링크) 목록으로 반환합니다.
+
+    연관 인증의 인증일자와 제조국은 알 수 없으므로, 같은 제품군일 가능성이 높은 원본 레코드의 값을 사용합니다.
+    """
+    cert_info = record.get("인증정보", {})
+    source = cert_info.get("인증번호", "")
+    cert_date = cert_info.get("인증변경일자") or cert_info.get("인증일자")
+    countries = [factory.get("제조국") for factory in record.get("제조공장", [])]
+
+    leads = []
+    for related in record.get("연관 인증 번호", []):
+        cert_num = (related.get("인증번호") or "").strip()
+        if not cert_num or cert_num.lower() == source.lower():
+            continue
+        score = priority(related.get("인증상태"), cert_date, countries, today)
+        leads.append((cert_num, f"{RELATED_REASON}:{source}", score, None))
+    return leads
+
+
+def expand(store: CertStore, record: Mapping, seen: Optional[Set[str]] = None) -> int:
+    """상세 레코드의 연관 인증 번호 중 아직 수집하지 않은 것을 대기열에 넣고 새로 추가된 건수를 반환합니다.
+
+    seen 은 크롤러가 메모리에 가진 수집 완료 인증번호(소문자) 집합이며, DB에 상세 데이터가 있는 것도 건너뜁니다.
+    """
+    leads = [lead for lead in related_leads(record) if seen is None or lead[0].lower() not in seen]
+    if not leads:
+        return 0
+    return store.enqueue_frontier(leads)
+
+
+def seed(store: CertStore) -> Dict[str, int]:
+    """저장된 상세 데이터 전체의 연관 인증 번호로 대기열을 채웁니다."""
+    seen = store.cert_numbers(detail_only=True)
+    records = added = 0
+    for record in store.iter_details():
+        records += 1
+        added += expand(store, record, seen)
+    return {"records": records, "added": added}
+
+
+def stats(store: CertStore) -> Dict[str, int]:
+    """대기열을 사유별로 집계합니다."""
+    reasons = Counter()
+    claimed = 0
+    for row in store.conn.execute("SELECT reason, claimed_by FROM detail_queue"):
+        reasons[row["reason"].split(":", 1)[0]] += 1
+        claimed += row["claimed_by"] is not None
+    return {"total": sum(reasons.values()), "claimed": claimed, **{f"reason[{k}]": v for k, v in reasons.items()}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연관 인증 번호 기반 상세 수집 대기열(frontier) 관리")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("seed", help="저장된 상세 데이터의 연관 인증 번호로 대기열을 채웁니다.")
+    top_parser = subparsers.add_parser("top", help="우선순위가 높은 대기열 항목을 출력합니다.")
+    top_parser.add_argument("--limit", type=int, default=20, help="출력할 항목 수 (기본값: 20)")
+    subparsers.add_parser("stats", help="대기열을 사유별로 집계합니다.")
+    args = parser.parse_args()
+
+    with CertStore(args.db) as store:
+        if args.command == "seed":
+            result = seed(store)
+            print(f"* 상세 레코드 {result['records']}건에서 연관 인증 {result['added']}건을 대기열에 추가")
+        elif args.command == "top":
+            for row in store.detail_queue(args.limit):
+                print(f"{row['priority']:>6.2f}  {row['cert_num']}\t{row['reason']}")
+        result = stats(store)
+        print(f"* 상세 수집 대기열: {result['total']}건 (수집 중 {result['claimed']}건)")
+        for key, count in result.items():
+            if key.startswith("reason["):
+                print(f"  - {key[7:-1]}: {count}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Mapping, NamedTuple, Optional
+
+DEFAULT_CACHE_PATH = "data/http_cache.db"
+DEFAULT_TTL = 24 * 60 * 60  # 1일
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2GB
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key             TEXT PRIMARY KEY,
+    url             TEXT NOT NULL,
+    body            BLOB NOT NULL,
+    size            INTEGER NOT NULL,
+    etag            TEXT,
+    last_modified   TEXT,
+    fetched_at      REAL NOT NULL,
+    accessed_at     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class CacheEntry(NamedTuple):
+    key: str
+    url: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+def cache_key(url: str, params: Optional[Mapping] = None) -> str:
+    """URL과 요청 파라미터(순서 무시)로 캐시 키를 만듭니다."""
+    payload = json.dumps([url, sorted((params or {}).items())], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """SQLite 기반 HTTP 응답 캐시입니다.
+
+    - ttl(초) 이내의 응답은 네트워크 요청 없이 사용합니다.
+    - ttl 이 지난 응답은 ETag/Last-Modified 가 있으면 조건부 요청(304)으로 재검증합니다.
+    - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다 (LRU).
+    - offline 모드에서는 오래된 응답도 그대로 사용하고, 캐시에 없으면 네트워크 요청을 하지 않습니다.
+
+    CertStore 와 마찬가지로 WAL 모드를 사용하므로 여러 쓰레드/프로세스가 같은 파일을 공유할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        offline: bool = False,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """캐시된 응답을 조회하고 마지막 사용 시각을 갱신합니다."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT key, url, body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(*row)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """네트워크 요청 없이 사용할 수 있는 응답인지 확인합니다."""
+        return self.offline or time.time() - entry.fetched_at < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """재검증용 조건부 요청 헤더를 반환합니다."""
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def put(self, key: str, url: str, body: bytes, headers: Optional[Mapping] = None):
+        """응답을 저장하고, 크기 한도를 넘으면 LRU 순서로 삭제합니다."""
+        headers = headers or {}
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, url, body, size, etag, last_modified, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, url, body, len(body), headers.get("ETag"), headers.get("Last-Modified"), now, now),
+            )
+            self._evict()
+
+    def revalidated(self, key: str, headers: Optional[Mapping] = None):
+        """304 응답을 받은 경우 캐시된 응답의 수집 시각(과 검증 헤더)을 갱신합니다."""
+        headers = headers or {}
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                UPDATE responses SET
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified),
+                    fetched_at = ?,
+                    accessed_at = ?
+                WHERE key = ?
+                """,
+                (headers.get("ETag"), headers.get("Last-Modified"), now, now, key),
+            )
+
+    def _evict(self):
+        (total,) = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        removed = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            removed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", removed)
+
+    def stats(self) -> Dict[str, float]:
+        """저장된 응답 수와 크기를 집계합니다."""
+        count, size, stale = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(fetched_at < ?), 0) FROM responses",
+            (time.time() - self.ttl,),
+        ).fetchone()
+        return {"entries": count, "bytes": size, "stale": stale}
+
+    def clear(self, stale_only: bool = False):
+        """캐시를 비웁니다. stale_only 이면 ttl 이 지난 응답만 삭제합니다."""
+        with self._lock, self.conn:
+            if stale_only:
+                self.conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.ttl,))
+            else:
+                self.conn.execute("DELETE FROM responses")
+        self.conn.execute("VACUUM")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 응답 캐시 관리")
+    parser.add_argument(
+        "--cache", type=str, default=DEFAULT_CACHE_PATH, help=f"캐시 DB 경로 (기본값: {DEFAULT_CACHE_PATH})"
+    )
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL, help=f"캐시 유효 시간(초) (기본값: {DEFAULT_TTL})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="캐시 사용량을 출력합니다.")
+    clear_parser = subparsers.add_parser("clear", help="캐시를 비웁니다.")
+    clear_parser.add_argument("--stale", action="store_true", help="유효 시간이 지난 응답만 삭제합니다.")
+    args = parser.parse_args()
+
+    with HttpCache(args.cache, ttl=args.ttl) as cache:
+        if args.command == "clear":
+            cache.clear(stale_only=args.stale)
+        stats = cache.stats()
+    print(
+        f"* 캐시 응답: {stats['entries']}건, {stats['bytes'] / 1024 / 1024:.1f}MB "
+        f"(유효 시간 지남: {stats['stale']}건)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import pandas as pd
-import json
 import glob
 import os
 
+from kc_record import iter_chunks, iter_json_records
+
+# 레코드를 이 건수만큼 모아서 DataFrame 을 만듦 (파일 전체를 json.load 로 읽지 않도록)
+CHUNK_ROWS = 10000
+
 
 def clean_factory_name(name: str) -> str:
     """제조공장명을 정제합니다."""
@@ -13,23 +17,23 @@ def clean_factory_name(name: str) -> str:
     return cleaned
 
 
+def iter_records(paths):
+    """JSON 파일들의 레코드를 하나씩 읽습니다."""
+    for json_file in paths:
+        print(f"Processing {json_file}...")
+        yield from iter_json_records(json_file)
+
+
 # JSON 파일 경로와 저장할 CSV 파일 경로 설정
-json_files = glob.glob("data/kc/*.json")  # data/kc 디렉토리의 모든 JSON 파일
+json_files = glob.glob("data/kc/*.json") + glob.glob("data/kc/*.kcz")  # data/kc 디렉토리의 모든 JSON/.kcz 파일
 csv_file = "data/kc/combined_certifications.csv"  # 출력할 CSV 파일 이름
 chinese_csv_file = "data/kc/chinese_factories.csv"  # 중국 제조공장만 저장할 CSV 파일 이름
 
-# 모든 데이터를 저장할 리스트
-all_data = []
-
-# 각 JSON 파일 처리
-for json_file in json_files:
-    print(f"Processing {json_file}...")
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        all_data.extend(data)  # JSON 파일의 데이터를 리스트에 추가
-
-# DataFrame으로 변환
-df = pd.json_normalize(all_data)
+# 각 JSON 파일의 레코드를 CHUNK_ROWS 건씩 DataFrame 으로 변환한 뒤 합침 (입력 파일이 없으면 빈 DataFrame)
+chunks = [pd.json_normalize(chunk) for chunk in iter_chunks(iter_records(json_files), CHUNK_ROWS)]
+df = (
+    pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=["certNum", "makerName", "makerCntryName"])
+)
 
 # makerName 클렌징
 df["makerName"] = df["makerName"].apply(clean_factory_name)
@@ -0,0 +1,484 @@
+import os
+import random
+import re
+import time
+from urllib.parse import quote, urljoin
+
+import kc_chrome
+from crawl_metrics import REGISTRY
+from kc_wait import WAIT_SECONDS, SmartWait
+
+# selenium/requests/bs4 는 시간이 오래 걸리므로 해당 백엔드를 처음 만들 때 import 합니다.
+# (HTTP 백엔드 워커는 selenium 을, 워커를 실행만 하는 메인 프로세스는 어느 것도 로드하지 않음)
+webdriver = Options = Service = By = WebDriverWait = EC = None
+requests = BeautifulSoup = None
+
+
+def _import_selenium():
+    global webdriver, Options, Service, By, WebDriverWait, EC
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+    except ImportError as e:  # selenium 이 없으면 HTTP 백엔드만 사용 가능
+        raise RuntimeError("selenium 이 설치되어 있지 않습니다. --backend http 를 사용하세요.") from e
+
+
+def _import_http():
+    global requests, BeautifulSoup
+    import requests
+    from bs4 import BeautifulSoup
+
+
+# 고정 대기 시간 (초). 스크립트마다 달랐던 기본값(2초/7초)은 실행 스크립트가 --sleep 으로 지정
+SLEEP_TIME = float(os.environ.get("KC_SLEEP_TIME", 7))
+
+# 벤치마크 등에서 모의 사이트를 가리킬 수 있도록 환경변수로 재정의 가능
+BASE_URL = os.environ.get("SAFETYKOREA_BASE_URL", "https://www.safetykorea.kr")
+# 목록 행의 onclick 정보가 없는 인증번호(Open API/연관 인증 번호로만 알고 있는 경우)의 상세 페이지 주소 ({cert_num} 포함)
+# 실제 사이트에서 인증번호로 바로 여는 주소는 확인되지 않아 기본값이 없습니다. 이런 인증번호를 수집하려면 반드시 지정해야 하며,
+# 모의 사이트(bench/mock_site.py)는 {SAFETYKOREA_BASE_URL}/release/itemDetail?certNum={cert_num} 을 사용합니다.
+DETAIL_URL = os.environ.get("SAFETYKOREA_DETAIL_URL")
+DETAIL_URL_MISSING = (
+    "목록 행 onclick 정보가 없는 인증번호는 상세 페이지 주소를 알 수 없습니다. "
+    "SAFETYKOREA_DETAIL_URL 환경변수에 상세 페이지 주소를 지정하세요. (예: https://.../상세주소?certNum={cert_num})"
+)
+LIST_URL = f"{BASE_URL}/release/itemSearch"
+# HTTP 백엔드가 목록 페이지를 직접 요청할 때 사용하는 주소 ({page} 포함)
+# 기본값은 모의 사이트(bench/mock_site.py)의 page 쿼리 방식이며 실제 사이트에서는 확인되지 않았습니다.
+LIST_PAGE_URL = os.environ.get("SAFETYKOREA_LIST_PAGE_URL", f"{LIST_URL}?page={{page}}")
+
+SLEEP_SECONDS = REGISTRY.counter("kc_sleep_seconds_total", "Time spent in fixed time.sleep calls.")
+
+# 프록시 리스트 설정
+PROXY_LIST = [
+    # "222.96.176.71:3128",
+    # "211.225.214.241:80"
+]
+# User-Agent 랜덤 설정
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
+]
+
+# 목록 행 onclick 스크립트에서 상세 페이지 주소를 추출 (예: location.href='/release/itemDetail?certNum=...')
+ONCLICK_HREF_PATTERN = re.compile(r"location\.href\s*=\s*['\"]([^'\"]+)['\"]")
+PAGE_PARAM_PATTERN = re.compile(r"page=(\d+)")
+
+# Selenium 백엔드의 상세 페이지 요청 방식
+DETAIL_MODES = ("fetch", "tab", "click")
+
+# 목록 페이지의 쿠키/세션으로 상세 페이지 HTML을 요청 (목록 페이지는 그대로 유지)
+FETCH_DETAIL_JS = """
+var url = arguments[0], done = arguments[arguments.length - 1];
+fetch(url, {credentials: 'include'})
+    .then(function (r) { return r.text().then(function (body) { done({status: r.status, body: body}); }); })
+    .catch(function (e) { done({status: 0, body: String(e)}); });
+"""
+
+
+def pause(seconds):
+    """고정 대기 시간을 메트릭에 기록하며 대기합니다."""
+    if seconds:
+        time.sleep(seconds)
+        SLEEP_SECONDS.inc(seconds)
+
+
+def is_window_closed(error) -> bool:
+    """브라우저 창이 닫혀서 발생한 오류인지 확인합니다."""
+    message = str(error)
+    return "no such window" in message or "target window already closed" in message
+
+
+def detail_url(cert_num, detail_link=None, from_link_only=False):
+    """목록 행 onclick 의 상세 페이지 주소를 반환합니다.
+
+    onclick 에 주소가 없으면 DETAIL_URL 을 사용하고, from_link_only 이면 None 을 반환합니다.
+    DETAIL_URL 이 지정되지 않았으면 RuntimeError 를 발생시킵니다.
+    """
+    match = ONCLICK_HREF_PATTERN.search(detail_link or "")
+    if match:
+        return urljoin(LIST_URL, match.group(1))
+    if from_link_only:
+        return None
+    if DETAIL_URL is None:
+        raise RuntimeError(DETAIL_URL_MISSING)
+    return DETAIL_URL.format(cert_num=quote(cert_num))
+
+
+def random_us_proxy():
+    _import_http()
+
+    proxy_url = "https://www.us-proxy.org/"
+
+    res = requests.get(proxy_url)
+    soup = BeautifulSoup(res.text, "lxml")
+
+    table = soup.find("tbody")
+    rows = table.find_all("tr")
+    proxy_server_list = []
+
+    for row in rows:
+        https = row.find("td", attrs={"class": "hx"})
+        if https.text == "yes":
+            ip = row.find_all("td")[0].text
+            port = row.find_all("td")[1].text
+            server = f"{ip}:{port}"
+            proxy_server_list.append(server)
+
+    proxy_server = random.choices(proxy_server_list)[0]
+    return proxy_server
+
+
+def get_random_proxy() -> str:
+    """쓰레드 인덱스에 따라 프록시를 할당합니다."""
+    if not PROXY_LIST:
+        return None
+    return random.choice(PROXY_LIST)
+
+
+class SeleniumBackend:
+    """크롬 브라우저로 목록/상세 페이지를 여는 fetch 백엔드입니다.
+
+    클릭/뒤로 가기 후에는 고정 대기 없이 SmartWait 로 페이지가 준비되는 즉시 진행합니다.
+    요청 간격 조절(--sleep)은 크롤러 코어가 담당합니다.
+
+    상세 페이지는 detail_mode 에 따라 요청합니다.
+    - fetch: 목록 페이지에서 fetch() 로 상세 HTML만 받아옵니다. 목록 페이지를 떠나지 않으므로 요청 1번입니다.
+    - tab: 보조 탭에서 상세 페이지를 열고, 목록 탭은 그대로 둡니다.
+    - click: 행을 클릭하고 뒤로 가기로 목록에 돌아옵니다 (상세 주소를 알 수 없는 행도 이 방식으로 처리).
+    """
+
+    name = "selenium"
+
+    def __init__(self, index, logger, headless=True, detail_mode="fetch", profile_dir=None, user_data_dir=None):
+        _import_selenium()
+        self.logger = logger
+        chrome_options = Options()
+
+        # --fast-start: 미리 데운 템플릿을 복제한 워커별 프로필 사용 (user_data_dir 는 템플릿을 만들 때 사용)
+        if profile_dir and user_data_dir is None:
+            user_data_dir = kc_chrome.clone_profile(profile_dir, index)
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+        if headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--window-size=1920,1080")
+
+        # 프록시 설정
+        proxy = get_random_proxy()
+        if proxy:
+            chrome_options.add_argument(f"--proxy-server={proxy}")
+
+        # 기타 크롬 옵션 설정
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-infobars")
+        chrome_options.add_argument("--disable-notifications")
+
+        chrome_options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
+
+        try:
+            self.driver = self._start_driver(chrome_options, profile_dir)
+            if proxy:
+                self.logger.info(f"Thread {index} using proxy: {proxy}")
+        except Exception as e:
+            self.logger.error(f"브라우저 초기화 실패: {e}")
+            raise
+        # 멈췄을 때 감독(kc_supervisor)이 종료할 chromedriver 프로세스 (하위에 Chrome 이 실행됨)
+        self.browser_pid = self.driver.service.process.pid
+        self.waits = SmartWait(self.driver)
+        self.detail_mode = detail_mode
+        self.list_handle = None
+        self.detail_handle = None  # tab 모드의 보조 탭
+        self.left_list = False  # click 방식으로 목록 페이지를 떠났는지 여부
+
+    def _start_driver(self, chrome_options, profile_dir):
+        """브라우저를 띄웁니다. profile_dir 에 캐시된 chromedriver 가 있으면 드라이버 탐색 없이 바로 사용합니다."""
+        driver_path = kc_chrome.load_driver_path(profile_dir) if profile_dir else None
+        if driver_path:
+            try:
+                return webdriver.Chrome(service=Service(executable_path=driver_path), options=chrome_options)
+            except Exception as e:
+                # Chrome 이 업데이트되어 캐시된 드라이버와 버전이 맞지 않는 경우 등
+                self.logger.warning(f"캐시된 chromedriver 로 실행하지 못해 다시 찾습니다: {e}")
+                kc_chrome.forget_driver_path(profile_dir)
+        driver = webdriver.Chrome(options=chrome_options)
+        if profile_dir:
+            kc_chrome.save_driver_path(profile_dir, driver.service.path)
+        return driver
+
+    def wait_for_element(self, by, value, wait_type="presence", timeout=10):
+        """요소가 나타날 때까지 대기합니다."""
+        wait = WebDriverWait(self.driver, timeout)
+        with WAIT_SECONDS.time(wait_type=wait_type):
+            if wait_type == "presence":
+                return wait.until(EC.presence_of_element_located((by, value)))
+            elif wait_type == "clickable":
+                return wait.until(EC.element_to_be_clickable((by, value)))
+            elif wait_type == "invisible":
+                return wait.until(EC.invisibility_of_element_located((by, value)))
+            elif wait_type == "all_present":
+                return wait.until(EC.presence_of_all_elements_located((by, value)))
+
+    def _rows(self):
+        self.waits.list_ready()
+        return self.driver.find_elements(By.CSS_SELECTOR, "table.tb_list tr[onclick]")
+
+    def _click_and_wait(self, element):
+        """목록 페이지를 바꾸는 요소를 클릭하고 새 목록이 준비될 때까지 기다립니다."""
+        token = self.waits.mark()
+        element.click()
+        self.waits.list_changed(token)
+
+    def open_list(self):
+        self.driver.get(LIST_URL)
+        self.waits.list_ready()
+
+    def list_html(self):
+        """현재 목록 페이지의 HTML을 반환합니다. 목록이 준비될 때까지 기다립니다."""
+        self.waits.list_ready()
+        return self.driver.page_source
+
+    def page_buttons(self):
+        """페이지 버튼 영역에 표시된 {페이지 번호: 요소}를 반환합니다."""
+        elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'page')]/ul/li/*")
+        return {int(el.text.strip()): el for el in elements if el.text.strip().isdigit()}
+
+    def go_to_last_page(self, on_step=None):
+        """마지막 페이지로 이동하고 페이지 번호를 반환합니다."""
+        self._click_and_wait(self.wait_for_element(By.XPATH, "//a[@title='마지막 페이지']", "clickable"))
+        if on_step is not None:
+            on_step()
+        return max(self.page_buttons())
+
+    def go_to_page(self, target, on_step=None):
+        """목록 페이지 번호 target 으로 이동합니다.
+
+        target 이 현재 표시된 10페이지 블록 밖이면 블록 끝 번호와 다음/이전 버튼으로 블록 단위로 건너뛰고,
+        블록 안에 들어오면 번호 버튼을 클릭합니다. 먼 페이지로 이동하는 동안 감독(kc_supervisor)이 멈춘 것으로
+        판단하지 않도록 블록을 건널 때마다 on_step(하트비트)을 호출합니다.
+        """
+        while True:
+            self.waits.list_ready()
+            buttons = self.page_buttons()
+            if not buttons:
+                raise RuntimeError("페이지 버튼을 찾을 수 없습니다.")
+
+            if target in buttons:
+                button = buttons[target]
+                # 현재 페이지 번호는 링크가 아니거나 'on' 클래스로 표시됨
+                if button.tag_name == "a" and "on" not in (button.get_attribute("class") or "").split():
+                    self._click_and_wait(button)
+                return
+
+            if target > max(buttons):
+                edge, step_title = buttons[max(buttons)], "다음 페이지"
+            else:
+                edge, step_title = buttons[min(buttons)], "이전 페이지"
+            if edge.tag_name == "a" and "on" not in (edge.get_attribute("class") or "").split():
+                self._click_and_wait(edge)
+            self._click_and_wait(self.wait_for_element(By.XPATH, f"//a[@title='{step_title}']", "clickable"))
+            if on_step is not None:
+                on_step()
+            self.logger.info(f"페이지 이동 중: {target} 페이지 방향 ({min(buttons)}~{max(buttons)} 블록 통과)")
+
+    def step(self, direction):
+        """다음(이전) 페이지로 이동합니다. 더 이동할 페이지가 없으면 False 를 반환합니다."""
+        step_title = "다음 페이지" if direction == "forward" else "이전 페이지"
+        self.waits.list_ready()
+        if not self.driver.find_elements(By.XPATH, f"//a[@title='{step_title}']"):
+            return False
+        # 목록이 새 페이지로 교체될 때까지 대기
+        self._click_and_wait(self.wait_for_element(By.XPATH, f"//a[@title='{step_title}']", "clickable"))
+        return True
+
+    def _fetch_detail(self, url):
+        """목록 페이지 안에서 fetch() 로 상세 페이지 HTML을 받아옵니다."""
+        self.driver.set_script_timeout(self.waits.tracker.timeout("detail"))
+        with WAIT_SECONDS.time(wait_type="fetch"):
+            result = self.driver.execute_async_script(FETCH_DETAIL_JS, url)
+        if result["status"] != 200:
+            raise RuntimeError(f"상세 페이지 요청 실패 ({result['status']}): {url}")
+        return result["body"]
+
+    def _tab_detail(self, url):
+        """보조 탭에서 상세 페이지를 열고 HTML을 반환합니다. 반환 후에는 목록 탭으로 돌아갑니다."""
+        self.list_handle = self.driver.current_window_handle
+        if self.detail_handle not in self.driver.window_handles:
+            self.driver.switch_to.new_window("tab")
+            self.detail_handle = self.driver.current_window_handle
+        else:
+            self.driver.switch_to.window(self.detail_handle)
+        try:
+            self.driver.get(url)
+            self.waits.detail_ready()
+            return self.driver.page_source
+        finally:
+            self.driver.switch_to.window(self.list_handle)
+
+    def _request_detail(self, url):
+        if self.detail_mode == "tab":
+            return self._tab_detail(url)
+        return self._fetch_detail(url)
+
+    def open_row_detail(self, row_index, summary):
+        """현재 목록 페이지의 row_index 번째 행의 상세 페이지 HTML을 반환합니다."""
+        url = detail_url(summary["인증번호"], summary.get("detail_link"), from_link_only=True)
+        if self.detail_mode != "click" and url is not None:
+            return self._request_detail(url)
+        self._rows()[row_index].click()
+        self.left_list = True
+        self.waits.detail_ready()
+        return self.driver.page_source
+
+    def back(self):
+        """행 클릭으로 상세 페이지에 들어갔으면 목록 페이지로 돌아갑니다."""
+        if not self.left_list:
+            return
+        self.driver.back()
+        self.left_list = False
+        self.waits.list_ready()
+
+    def open_detail(self, cert_num, detail_link=None):
+        """인증번호의 상세 페이지를 열고 HTML을 반환합니다.
+
+        fetch/tab 모드에서는 onclick 의 주소(없으면 DETAIL_URL)를 요청하고,
+        click 모드에서는 onclick 스크립트를 목록 페이지에서 그대로 실행하거나 DETAIL_URL 로 직접 이동합니다.
+        """
+        if self.detail_mode != "click":
+            # fetch() 가 사이트 쿠키를 쓰도록 사이트 페이지에서 요청
+            if not self.driver.current_url.startswith(BASE_URL):
+                self.open_list()
+            return self._request_detail(detail_url(cert_num, detail_link))
+
+        if detail_link:
+            if "/release/itemSearch" not in self.driver.current_url:
+                self.open_list()
+            self.driver.execute_script(detail_link)
+        else:
+            self.driver.get(detail_url(cert_num))
+        self.waits.detail_ready()
+        return self.driver.page_source
+
+    def close(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            if not is_window_closed(e):
+                raise
+
+
+class HttpBackend:
+    """브라우저 없이 requests 로 목록/상세 페이지를 요청하는 fetch 백엔드입니다.
+
+    목록 페이지는 LIST_PAGE_URL(page 쿼리), 상세 페이지는 목록 행 onclick 의 주소 또는 DETAIL_URL 로 요청합니다.
+    LIST_PAGE_URL 의 기본값은 모의 사이트 기준입니다. 사이트가 페이지 이동을 스크립트(POST)로만 처리하면
+    SAFETYKOREA_LIST_PAGE_URL/SAFETYKOREA_DETAIL_URL 로 GET 으로 접근 가능한 주소를 지정하거나 Selenium 백엔드를 사용합니다.
+    """
+
+    name = "http"
+
+    def __init__(self, index, logger, timeout=30):
+        _import_http()
+        self.logger = logger
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = random.choice(USER_AGENTS)
+        proxy = get_random_proxy()
+        if proxy:
+            self.session.proxies = {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+            self.logger.info(f"Thread {index} using proxy: {proxy}")
+        self.page = 1
+        self.html = None
+        self.browser_pid = None  # 요청은 timeout 으로 끝나므로 종료할 브라우저가 없음
+
+    def _get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        return response.text
+
+    def _load_page(self, page):
+        self.html = self._get(LIST_PAGE_URL.format(page=page))
+        self.page = page
+
+    def open_list(self):
+        self._load_page(1)
+
+    def list_html(self):
+        return self.html
+
+    def _link(self, title):
+        """현재 목록 페이지에서 title 속성이 일치하는 페이지 링크의 페이지 번호를 반환합니다."""
+        soup = BeautifulSoup(self.html, "html.parser")
+        link = soup.find("a", attrs={"title": title})
+        match = PAGE_PARAM_PATTERN.search(link.get("href", "")) if link else None
+        return int(match.group(1)) if match else None
+
+    def go_to_last_page(self, on_step=None):
+        last_page = self._link("마지막 페이지")
+        if last_page is None:
+            raise RuntimeError("마지막 페이지 링크를 찾을 수 없습니다.")
+        self._load_page(last_page)
+        return last_page
+
+    def go_to_page(self, target, on_step=None):
+        """페이지를 직접 요청하므로 요청 한 번으로 이동합니다. (on_step 은 호출할 필요 없음)"""
+        self._load_page(target)
+
+    def step(self, direction):
+        target = self._link("다음 페이지" if direction == "forward" else "이전 페이지")
+        if target is None:
+            return False
+        self._load_page(target)
+        return True
+
+    def open_row_detail(self, row_index, summary):
+        return self.open_detail(summary["인증번호"], summary.get("detail_link"))
+
+    def back(self):
+        """목록 페이지 HTML을 그대로 유지하므로 돌아갈 필요가 없습니다."""
+
+    def open_detail(self, cert_num, detail_link=None):
+        return self._get(detail_url(cert_num, detail_link))
+
+    def close(self):
+        self.session.close()
+
+
+BACKENDS = {
+    "selenium": SeleniumBackend,
+    "http": HttpBackend,
+}
+
+
+def preload(backend):
+    """백엔드가 사용하는 모듈을 미리 import 합니다.
+
+    워커 프로세스를 fork 로 만들 때 메인 프로세스에서 호출하면 자식 프로세스가 import 결과를 물려받습니다.
+    """
+    _import_http()
+    if backend == "selenium":
+        _import_selenium()
+
+
+def warm_up_chrome(profile_dir, logger, headless=True):
+    """--fast-start 준비: 템플릿 프로필이 없으면 목록 페이지를 한 번 열어서 만들고 chromedriver 경로를 캐시합니다."""
+    if kc_chrome.has_template(profile_dir) and kc_chrome.load_driver_path(profile_dir):
+        return
+    logger.info(f"Chrome 템플릿 프로필을 준비합니다: {kc_chrome.template_dir(profile_dir)}")
+    backend = SeleniumBackend(
+        "warmup", logger, headless=headless, profile_dir=profile_dir, user_data_dir=kc_chrome.template_dir(profile_dir)
+    )
+    try:
+        backend.open_list()
+    finally:
+        backend.close()
@@ -0,0 +1,80 @@
+"""Chrome 빠른 시작(--fast-start) 지원
+
+- chromedriver 경로 캐시: Selenium Manager 가 브라우저를 띄울 때마다 드라이버를 찾는 대신,
+  처음 찾은 경로를 profile_dir/chromedriver.json 에 저장해 두고 다음부터는 바로 사용합니다.
+- 미리 데운 프로필: profile_dir/template 에 목록 페이지를 한 번 열어 둔 프로필(디스크 캐시, 쿠키)을 만들고,
+  워커마다 profile_dir/worker-{index} 로 복제해서 --user-data-dir 로 사용합니다.
+  복제한 프로필은 다음 실행에서도 그대로 사용하므로 워커별 캐시가 계속 유지됩니다.
+"""
+
+import glob
+import json
+import os
+import shutil
+from typing import Optional
+
+DEFAULT_PROFILE_DIR = os.path.join("data", "chrome")
+DRIVER_CACHE_FILE = "chromedriver.json"
+
+# 실행 중인 Chrome 의 잠금 파일과 크래시 보고서는 복제하지 않음
+LOCK_PATTERNS = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile")
+CLONE_IGNORE = shutil.ignore_patterns(*LOCK_PATTERNS, "Crashpad", "*.tmp")
+
+
+def template_dir(profile_dir: str) -> str:
+    return os.path.abspath(os.path.join(profile_dir, "template"))
+
+
+def worker_dir(profile_dir: str, index: int) -> str:
+    return os.path.abspath(os.path.join(profile_dir, f"worker-{index}"))
+
+
+def has_template(profile_dir: str) -> bool:
+    return os.path.isdir(template_dir(profile_dir))
+
+
+def load_driver_path(profile_dir: str) -> Optional[str]:
+    """캐시된 chromedriver 경로를 반환합니다. 캐시가 없거나 파일이 사라졌으면 None"""
+    try:
+        with open(os.path.join(profile_dir, DRIVER_CACHE_FILE), "r", encoding="utf-8") as f:
+            path = json.load(f).get("path")
+    except (OSError, ValueError):
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def save_driver_path(profile_dir: str, path: str):
+    os.makedirs(profile_dir, exist_ok=True)
+    with open(os.path.join(profile_dir, DRIVER_CACHE_FILE), "w", encoding="utf-8") as f:
+        json.dump({"path": path}, f)
+
+
+def forget_driver_path(profile_dir: str):
+    """캐시된 chromedriver 로 브라우저를 띄우지 못했을 때(Chrome 업데이트 등) 캐시를 지웁니다."""
+    try:
+        os.remove(os.path.join(profile_dir, DRIVER_CACHE_FILE))
+    except OSError:
+        pass
+
+
+def _remove_locks(path: str):
+    # 비정상 종료된 Chrome 이 남긴 잠금 파일이 있으면 같은 프로필로 다시 실행할 수 없음
+    for pattern in LOCK_PATTERNS:
+        for lock in glob.glob(os.path.join(path, pattern)):
+            try:
+                os.remove(lock)
+            except OSError:
+                pass
+
+
+def clone_profile(profile_dir: str, index: int) -> str:
+    """워커용 프로필 디렉토리를 준비하고 경로를 반환합니다. 없으면 템플릿(없으면 빈 프로필)에서 복제합니다."""
+    path = worker_dir(profile_dir, index)
+    if not os.path.isdir(path):
+        template = template_dir(profile_dir)
+        if os.path.isdir(template):
+            shutil.copytree(template, path, ignore=CLONE_IGNORE)
+        else:
+            os.makedirs(path, exist_ok=True)
+    _remove_locks(path)
+    return path
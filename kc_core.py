@@ -0,0 +1,603 @@
+from enum import Enum
+from datetime import datetime
+from urllib.parse import quote
+
+import frontier
+from crawl_metrics import REGISTRY, timed
+from http_cache import HttpCache, cache_key
+from kc_backends import BACKENDS, LIST_URL, SLEEP_TIME, is_window_closed, pause
+from kc_record import CertRecord, load_cert_numbers
+from kc_sinks import build_sinks
+from kc_store import CertStore, DEFAULT_DB_PATH
+from log_pipeline import get_worker_logger
+
+# frontier 모드에서 한 번에 가져가는 대기열 항목 수와, 대기열이 비었을 때 다시 확인하는 횟수/간격(초)
+FRONTIER_BATCH = 10
+FRONTIER_IDLE_POLLS = 3
+FRONTIER_IDLE_SECONDS = 5
+
+# 같은 단계에서 연속으로 실패하면 복구(목록 페이지 재진입)를 시도하는 최대 횟수
+MAX_RETRIES = 3
+
+# 상세 페이지 캐시 키의 기준 주소 (요청 주소가 아니라 인증번호별 캐시 항목을 구분하는 이름)
+DETAIL_CACHE_URL = f"{LIST_URL}#detail"
+
+# 크롤링 메트릭
+ROWS_TOTAL = REGISTRY.counter("kc_rows_total", "Rows handled by process_row, by result.")
+PAGES_TOTAL = REGISTRY.counter("kc_pages_total", "List pages moved to, by direction.")
+PROCESS_ROW_SECONDS = REGISTRY.histogram("kc_process_row_seconds", "Time spent in process_row.")
+PARSE_DETAIL_SECONDS = REGISTRY.histogram("kc_parse_detail_seconds", "Time spent parsing a detail page.")
+PARSE_LIST_SECONDS = REGISTRY.histogram("kc_parse_list_seconds", "Time spent parsing a whole list page.")
+LIST_ROWS_TOTAL = REGISTRY.counter("kc_list_rows_total", "Summary rows harvested from list pages.")
+DETAIL_QUEUED_TOTAL = REGISTRY.counter("kc_detail_queued_total", "Certificates queued for detail fetch, by reason.")
+SAVE_SECONDS = REGISTRY.histogram("kc_save_seconds", "Time spent writing a record to the sinks.")
+NAVIGATION_SECONDS = REGISTRY.histogram("kc_navigation_seconds", "Time spent on page navigation, by action.")
+DETAIL_CACHE_TOTAL = REGISTRY.counter("kc_detail_cache_total", "Detail page cache lookups, by result.")
+
+
+class CrawlState(Enum):
+    """목록 페이지 순회 크롤링(crawl_pages)의 상태"""
+
+    OPEN = "open"  # 목록 페이지 열기, 기존 데이터/체크포인트 로드
+    POSITION = "position"  # 체크포인트 페이지(없으면 시작 페이지)로 이동
+    ROW = "row"  # 현재 페이지의 담당 행 수집 및 커밋
+    ADVANCE = "advance"  # 다음(이전) 페이지로 이동하고 페이지 커서 기록
+    RECOVER = "recover"  # 오류 후 목록 페이지를 다시 열고 체크포인트 페이지로 복귀
+    DONE = "done"
+
+
+class SafetyKoreaCrawler:
+    """크롤러 공통 로직입니다.
+
+    페이지 이동/상세 페이지 조회는 fetch 백엔드(kc_backends), 레코드 저장은 sink(kc_sinks)에 맡기고,
+    파싱, 중복 확인, 캐시, 체크포인트, 상태 머신은 백엔드/실행 방식과 관계없이 여기에서 한 번만 구현합니다.
+    """
+
+    def __init__(
+        self,
+        index,
+        backend="selenium",
+        sinks=("sqlite", "jsonl"),
+        db_path=DEFAULT_DB_PATH,
+        output_dir="output",
+        output=None,
+        cache_options=None,
+        sleep_time=SLEEP_TIME,
+        backend_options=None,
+        expand_related=True,
+        heartbeat=None,
+    ):
+        self.index = index
+        self.logger = get_worker_logger(index)
+        self.sleep_time = sleep_time
+        self.expand_related = expand_related
+        self.backend = BACKENDS[backend](index, self.logger, **(backend_options or {}))
+        # 진행할 때마다 호출해서 감독(kc_supervisor)에 살아 있음을 알림
+        self.heartbeat = heartbeat
+        if heartbeat is not None:
+            heartbeat.attach(self.backend.browser_pid)
+        # 크롤링 결과: finished(끝까지 수집), interrupted(사용자 중단), failed(그 외 종료, 감독이 재시작)
+        self.outcome = "failed"
+
+        # 수집한 레코드는 메모리에 쌓지 않고 sink 에 바로 기록하며, 메모리에는 인증번호 집합만 유지
+        self.collected = 0
+        self.existing_cert_numbers = set()
+        self.page = 0  # 현재 목록 페이지 번호
+        self.direction = "forward"
+        self.worker = f"worker-{index}"  # 체크포인트 키 (crawl_pages 에서 방향-인덱스로 설정)
+        self.store = CertStore(db_path)
+        self.sinks = build_sinks(sinks, self.store, self.logger, output_dir, index, output)
+        # 상세 페이지 HTML 캐시 (크래시 후 재시작 시 같은 페이지를 다시 열지 않도록)
+        self.cache = HttpCache(**cache_options) if cache_options else None
+
+    def load_existing_data(self):
+        """기존 출력 파일과 DB에서 이미 수집한 인증번호를 로드합니다. 레코드 내용은 메모리에 올리지 않습니다."""
+        paths = [path for sink in self.sinks for path in sink.existing_paths()]
+        own_cert_numbers = load_cert_numbers(*paths)
+        self.collected = len(own_cert_numbers)
+        if own_cert_numbers:
+            self.logger.info(f"기존 데이터 {self.collected}개 로드 완료")
+        else:
+            self.logger.info("새로운 데이터 파일을 생성합니다.")
+
+        # 다른 워커/크롤러가 이미 DB에 저장한 인증번호도 건너뜀
+        self.existing_cert_numbers = own_cert_numbers | self.store.cert_numbers(detail_only=True)
+
+    @timed(SAVE_SECONDS)
+    def save_record(self, data, checkpoint=None):
+        """레코드 한 건을 모든 sink 에 기록합니다.
+
+        checkpoint=(worker, direction, page) 이면 체크포인트도 함께 커밋합니다.
+        SQLite sink 가 있으면 레코드와 체크포인트가 한 트랜잭션으로 커밋됩니다.
+        """
+        record = CertRecord.from_detail(data)
+        handled = False
+        for sink in self.sinks:
+            handled |= sink.write(record, data, checkpoint)
+        if checkpoint is not None and not handled:
+            self.store.save_checkpoint(*checkpoint)
+        self.logger.info(f"{self.collected}개의 데이터 저장 완료")
+        if self.expand_related:
+            # 연관 인증 번호 중 아직 수집하지 않은 것을 우선순위와 함께 대기열에 추가
+            added = frontier.expand(self.store, data, self.existing_cert_numbers)
+            if added:
+                DETAIL_QUEUED_TOTAL.inc(added, reason=frontier.RELATED_REASON)
+
+    def _beat(self):
+        if self.heartbeat is not None:
+            self.heartbeat(self.collected)
+
+    def _move_page(self, delta):
+        """현재 페이지 위치를 갱신하고 로그 컨텍스트에 반영합니다."""
+        self._set_page(self.page + delta)
+
+    def _set_page(self, page):
+        self.page = page
+        self.logger.bind(page=page)
+
+    def _sleep(self, seconds=None):
+        pause(self.sleep_time if seconds is None else seconds)
+
+    def _detail_cache_key(self, cert_num):
+        # 상세 페이지 주소(onclick 또는 DETAIL_URL)와 관계없이 인증번호로 찾음
+        return cache_key(DETAIL_CACHE_URL, {"certNum": cert_num.lower()})
+
+    def cached_detail(self, cert_num):
+        """캐시된 상세 페이지를 파싱해 반환합니다. 캐시에 없거나 유효 시간이 지났으면 None 을 반환합니다."""
+        if self.cache is None:
+            return None
+        entry = self.cache.get(self._detail_cache_key(cert_num))
+        if entry is None or not self.cache.is_fresh(entry):
+            DETAIL_CACHE_TOTAL.inc(result="miss")
+            return None
+        DETAIL_CACHE_TOTAL.inc(result="hit")
+        return self.parse_detail_page(entry.body.decode("utf-8"))
+
+    def _cache_detail(self, cert_num, html_content):
+        if self.cache is not None:
+            url = f"{DETAIL_CACHE_URL}?certNum={quote(cert_num)}"
+            self.cache.put(self._detail_cache_key(cert_num), url, html_content.encode("utf-8"))
+
+    @timed(PARSE_DETAIL_SECONDS)
+    def parse_detail_page(self, html_content):
+        """상세 페이지의 데이터를 파싱합니다."""
+        # bs4 는 파싱할 때 처음 import (워커를 실행만 하는 메인 프로세스는 로드하지 않음)
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html_content, "html.parser")
+        return {
+            "인증정보": self._parse_key_value_table(soup, "인증정보 상세"),
+            "제품정보": self._parse_key_value_table(soup, "제품정보 상세"),
+            "제조공장": self._parse_list_table(soup, "제조공장 상세", ["번호", "제조공장", "제조국"]),
+            "연관 인증 번호": self._parse_list_table(soup, "연관 인증 번호 상세", ["번호", "인증번호", "인증상태"]),
+        }
+
+    @timed(PARSE_LIST_SECONDS)
+    def parse_list_page(self, html_content):
+        """목록 페이지(table.tb_list)의 모든 행을 요약 정보로 파싱합니다."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html_content, "html.parser")
+        table = soup.select_one("table.tb_list")
+        if table is None:
+            return []
+
+        header_row = table.find("tr")
+        headers = [th.get_text(strip=True) for th in header_row.find_all("th")] if header_row else []
+
+        summaries = []
+        for row in table.select("tr[onclick]"):
+            cols = [td.get_text(strip=True) for td in row.find_all("td")]
+            if not cols:
+                continue
+            summary = {headers[idx] if idx < len(headers) else f"col_{idx}": value for idx, value in enumerate(cols)}
+            # 마지막 열을 인증번호로 사용
+            summary["인증번호"] = cols[-1]
+            summary["detail_link"] = row.get("onclick")
+            summaries.append(summary)
+        return summaries
+
+    def _parse_key_value_table(self, soup, caption_text):
+        """키-값 테이블을 파싱합니다."""
+        data = {}
+        caption = soup.find("caption", string=lambda t: t and caption_text in t)
+        if caption:
+            table = caption.find_parent("table")
+            for row in table.find_all("tr"):
+                for th in row.find_all("th"):
+                    key = th.get_text(strip=True)
+                    td = th.find_next_sibling("td")
+                    value = td.get_text(strip=True) if td else ""
+                    data[key] = value
+        return data
+
+    def _parse_list_table(self, soup, caption_text, header_keys):
+        """리스트 형태의 테이블을 파싱합니다."""
+        items = []
+        caption = soup.find("caption", string=lambda t: t and caption_text in t)
+        if caption:
+            table = caption.find_parent("table")
+            for row in table.find_all("tr")[1:]:  # Skip header row
+                cols = row.find_all(["th", "td"])
+                if len(cols) >= len(header_keys):
+                    item = {}
+                    for idx, key in enumerate(header_keys):
+                        value = (
+                            cols[idx].find("a").get_text(strip=True)
+                            if cols[idx].find("a")
+                            else cols[idx].get_text(strip=True)
+                        )
+                        item[key] = value
+                    items.append(item)
+        return items
+
+    @timed(PROCESS_ROW_SECONDS)
+    def process_row(self, row_index):
+        """현재 목록 페이지의 row_index 번째 행을 수집하고 커밋합니다."""
+        try:
+            summaries = self.parse_list_page(self.backend.list_html())
+
+            # row_index가 10 이상이면 mod 10으로 변환
+            actual_index = row_index % 10
+
+            # 행 개수 확인 및 인덱스 검증
+            if actual_index >= len(summaries):
+                self.logger.error(f"Invalid row index: {actual_index}, Total rows: {len(summaries)}")
+                return
+
+            summary = summaries[actual_index]
+            cert_number = summary["인증번호"].strip().lower()
+
+            # 이미 수집한 인증번호라도 상태 변경이 감지되어 대기열에 있으면 다시 수집
+            refresh = cert_number in self.existing_cert_numbers and self.store.is_queued(cert_number)
+            if cert_number in self.existing_cert_numbers and not refresh:
+                ROWS_TOTAL.inc(result="skipped")
+                self.logger.info(f"Skip existing cert number: {cert_number}", extra={"cert_num": cert_number})
+                return
+
+            # 상태 변경으로 재수집하는 경우에는 캐시된(이전) 페이지를 사용하지 않음
+            data = None if refresh else self.cached_detail(cert_number)
+            navigated = data is None
+            if navigated:
+                # 커밋 전에 중단되면 재시작 시 이 인증번호를 다시 수집
+                self.store.save_checkpoint(self.worker, self.direction, self.page, in_flight=cert_number)
+                self._sleep()
+                with NAVIGATION_SECONDS.time(action="detail"):
+                    html_content = self.backend.open_row_detail(actual_index, summary)
+                data = self.parse_detail_page(html_content)
+                self._cache_detail(cert_number, html_content)
+
+            if "인증정보" in data and "인증번호" in data["인증정보"]:
+                cert_number = data["인증정보"]["인증번호"].lower()
+                if cert_number not in self.existing_cert_numbers or refresh:
+                    self.collected += 1
+                    # 레코드 저장과 체크포인트 갱신을 함께 커밋. 저장에 실패하면 예외가 전파되어 체크포인트가 넘어가지 않음
+                    self.save_record(data, (self.worker, self.direction, self.page))
+                    self.existing_cert_numbers.add(cert_number)
+                    ROWS_TOTAL.inc(result="refreshed" if refresh else "added")
+                    self.logger.info(
+                        f"Added new cert number: {cert_number} [{self.collected}] (actual_index: {actual_index})",
+                        extra={"cert_num": cert_number},
+                    )
+
+            # 백엔드가 목록 페이지 준비를 감지하므로 뒤로 가기 전에는 고정 대기하지 않음
+            if navigated:
+                with NAVIGATION_SECONDS.time(action="back"):
+                    self.backend.back()
+        except Exception as e:
+            ROWS_TOTAL.inc(result="error")
+            if is_window_closed(e):
+                self.logger.error("브라우저 창이 닫혔습니다. 크롤링을 종료합니다.")
+                raise SystemExit("Browser window closed")
+            self.logger.error(f"Row processing error: {e}")
+            raise
+
+    def close(self):
+        """백엔드(브라우저 등)와 저장소를 정리합니다."""
+        try:
+            self.backend.close()
+        except Exception as e:
+            self.logger.error(f"브라우저 종료 중 오류 발생: {e}")
+        finally:
+            for sink in self.sinks:
+                sink.close()
+            self.store.close()
+            if self.cache is not None:
+                self.cache.close()
+
+    def _state_open(self):
+        self.backend.open_list()
+        self.load_existing_data()
+        return CrawlState.POSITION
+
+    def _state_position(self):
+        """체크포인트 페이지로 이동합니다. 체크포인트가 없으면 시작 페이지(첫/마지막 페이지)에서 시작합니다."""
+        checkpoint = self.store.get_checkpoint(self.worker)
+
+        if self.direction == "forward":
+            self._set_page(1)
+        else:
+            self._set_page(self.backend.go_to_last_page(on_step=self._beat))
+
+        if checkpoint is not None:
+            target = checkpoint["page"]
+            self.logger.info(
+                f"체크포인트에서 재개: {target} 페이지 (커밋 {checkpoint['committed']}건, "
+                f"수집 중이던 인증번호: {checkpoint['in_flight'] or '-'})"
+            )
+        elif self.collected:
+            # 체크포인트 도입 전 데이터 파일만 있는 경우: 페이지당 1건 수집 기준으로 위치 추정
+            offset = self.collected
+            target = self.page + offset if self.direction == "forward" else max(1, self.page - offset)
+            self.logger.info(f"기존 데이터 {offset}개 기준으로 {target} 페이지부터 시작합니다.")
+        else:
+            target = self.page
+
+        if target != self.page:
+            with NAVIGATION_SECONDS.time(action="jump"):
+                self.backend.go_to_page(target, on_step=self._beat)
+            self._set_page(target)
+        self.store.save_checkpoint(self.worker, self.direction, self.page)
+        return CrawlState.ROW
+
+    def _state_row(self):
+        self.process_row(self.index)
+        return CrawlState.ADVANCE
+
+    def _state_advance(self):
+        """다음(이전) 페이지로 이동하고, 이동이 끝난 뒤에 페이지 커서를 기록합니다."""
+        with NAVIGATION_SECONDS.time(action="next" if self.direction == "forward" else "prev"):
+            moved = self.backend.step(self.direction)
+        if not moved:
+            self.logger.info("마지막 페이지에 도달하여 크롤링을 종료합니다.")
+            return CrawlState.DONE
+        PAGES_TOTAL.inc(direction=self.direction)
+        self._move_page(1 if self.direction == "forward" else -1)
+        self.store.save_checkpoint(self.worker, self.direction, self.page)
+        self._sleep()
+        return CrawlState.ROW
+
+    def _recover(self):
+        """목록 페이지를 다시 열고 체크포인트 페이지로 돌아갑니다."""
+        self._sleep()
+        self.backend.open_list()
+        checkpoint = self.store.get_checkpoint(self.worker)
+        target = checkpoint["page"] if checkpoint is not None else 1
+        if target != 1:
+            self.backend.go_to_page(target, on_step=self._beat)
+        self._set_page(target)
+
+    def _give_up_row(self):
+        """반복해서 실패한 행의 인증번호는 상세 수집 대기열로 넘기고 다음 페이지로 진행합니다."""
+        checkpoint = self.store.get_checkpoint(self.worker)
+        in_flight = checkpoint["in_flight"] if checkpoint is not None else None
+        if in_flight:
+            self.store.enqueue_details([(in_flight, "failed")])
+        self.logger.error(
+            f"{self.page} 페이지 행 수집에 {MAX_RETRIES}회 실패하여 건너뜁니다. (대기열로 이동: {in_flight or '-'})"
+        )
+
+    def crawl_pages(self, index, direction="forward"):
+        """목록 페이지를 한 방향으로 순회하면서 각 페이지의 담당 행(index % 10)을 수집합니다.
+
+        CrawlState 상태 머신으로 동작하며 페이지 커서와 수집 중인 인증번호를 DB 체크포인트에 기록합니다.
+        레코드 저장과 체크포인트 갱신은 한 트랜잭션으로 커밋되므로, 재시작하면 중단된 페이지에서
+        커밋된 레코드는 다시 수집하지 않고 커밋되지 않은 레코드만 다시 수집합니다.
+        """
+        self.direction = direction
+        self.worker = f"{direction}-{index}"
+        handlers = {
+            CrawlState.OPEN: self._state_open,
+            CrawlState.POSITION: self._state_position,
+            CrawlState.ROW: self._state_row,
+            CrawlState.ADVANCE: self._state_advance,
+        }
+        state, resume, failures = CrawlState.OPEN, CrawlState.ROW, 0
+        try:
+            while state is not CrawlState.DONE:
+                try:
+                    if state is CrawlState.RECOVER:
+                        if resume is not CrawlState.OPEN:
+                            self._recover()
+                        state = resume
+                        continue
+                    next_state = handlers[state]()
+                    if state in (CrawlState.ROW, CrawlState.ADVANCE):
+                        failures = 0
+                    state = next_state
+                    self._beat()
+                except SystemExit:
+                    self.logger.info("브라우저가 닫혀 크롤링을 종료합니다.")
+                    break
+                except Exception as e:
+                    failures += 1
+                    self.logger.error(f"{state.value} 단계 오류 ({failures}/{MAX_RETRIES}): {e}")
+                    if failures <= MAX_RETRIES:
+                        if state is not CrawlState.RECOVER:
+                            resume = CrawlState.OPEN if state is CrawlState.POSITION else state
+                        state = CrawlState.RECOVER
+                    elif state is CrawlState.ROW:
+                        self._give_up_row()
+                        state, resume, failures = CrawlState.RECOVER, CrawlState.ADVANCE, 0
+                    else:
+                        self.logger.error("복구에 실패하여 크롤링을 종료합니다.")
+                        break
+            if state is CrawlState.DONE:
+                self.outcome = "finished"
+
+        except KeyboardInterrupt:
+            self.outcome = "interrupted"
+            self.logger.info("사용자에 의해 중단되었습니다.")
+        except Exception as e:
+            self.logger.error(f"예상치 못한 오류: {e}")
+        finally:
+            self.close()
+
+    def crawl_forward(self, index):
+        """앞으로 이동하면서 크롤링을 실행합니다."""
+        self.crawl_pages(index, "forward")
+
+    def crawl_backward(self, index):
+        """뒤로 이동하면서 크롤링을 실행합니다."""
+        self.crawl_pages(index, "backward")
+
+    def crawl_list_only(self, direction="forward"):
+        """상세 페이지를 열지 않고 목록 페이지의 모든 행을 한 번에 수집합니다.
+
+        새로 발견되었거나 상태가 바뀐 인증번호만 DB의 상세 수집 대기열(detail_queue)에 넣습니다.
+        """
+        run_started = datetime.now().isoformat(timespec="seconds")
+        try:
+            self.backend.open_list()
+            if direction == "backward":
+                self.backend.go_to_last_page(on_step=self._beat)
+                self._sleep()
+
+            while True:
+                summaries = self.parse_list_page(self.backend.list_html())
+                cert_numbers = [summary["인증번호"] for summary in summaries]
+
+                # 반대 방향 워커가 이번 실행에서 이미 수집한 페이지에 도달하면 종료
+                if self.store.seen_since(cert_numbers, run_started):
+                    self.logger.info("이미 수집된 페이지에 도달하여 목록 수집을 종료합니다.")
+                    self.outcome = "finished"
+                    break
+
+                queued = self.store.record_list_summaries(summaries)
+                LIST_ROWS_TOTAL.inc(len(summaries))
+                for _, reason in queued:
+                    DETAIL_QUEUED_TOTAL.inc(reason=reason)
+                self.logger.info(f"목록 {len(summaries)}건 저장, 상세 수집 대기 {len(queued)}건")
+                self._beat()
+
+                try:
+                    with NAVIGATION_SECONDS.time(action="next" if direction == "forward" else "prev"):
+                        moved = self.backend.step(direction)
+                    if not moved:
+                        self.logger.info("마지막 페이지에 도달하여 목록 수집을 종료합니다.")
+                        self.outcome = "finished"
+                        break
+                    PAGES_TOTAL.inc(direction=direction)
+                    self._move_page(1 if direction == "forward" else -1)
+                    self._sleep()
+                except Exception as e:
+                    self.logger.error(f"Navigation error: {e}")
+                    break
+
+        except KeyboardInterrupt:
+            self.outcome = "interrupted"
+            self.logger.info("사용자에 의해 중단되었습니다.")
+        except Exception as e:
+            self.logger.error(f"예상치 못한 오류: {e}")
+        finally:
+            self.close()
+
+    def _collect_queued(self, item):
+        """대기열 항목 하나의 상세 페이지를 수집해 저장합니다. 저장했으면 True 를 반환합니다.
+
+        브라우저 창이 닫혔으면 SystemExit 을 발생시킵니다.
+        """
+        cert_num = item["cert_num"]
+        refresh = item["reason"].startswith("changed")
+        try:
+            data = None if refresh else self.cached_detail(cert_num)
+            if data is None:
+                self._sleep()
+                with NAVIGATION_SECONDS.time(action="detail"):
+                    html_content = self.backend.open_detail(cert_num, item["detail_link"])
+                data = self.parse_detail_page(html_content)
+                self._cache_detail(cert_num, html_content)
+        except Exception as e:
+            ROWS_TOTAL.inc(result="error")
+            if is_window_closed(e):
+                self.logger.error("브라우저 창이 닫혔습니다. 크롤링을 종료합니다.")
+                raise SystemExit("Browser window closed")
+            self.logger.error(f"상세 페이지 수집 오류: {e}", extra={"cert_num": cert_num})
+            return False
+
+        if not data["인증정보"].get("인증번호"):
+            ROWS_TOTAL.inc(result="error")
+            self.logger.error(f"상세 페이지에 인증정보가 없습니다: {cert_num}", extra={"cert_num": cert_num})
+            return False
+
+        self.collected += 1
+        self.save_record(data)
+        self.existing_cert_numbers.add(cert_num.lower())
+        # SQLite sink 는 반영된 경우에만 대기열에서 제거하므로, 파일 sink 만 쓰는 경우에만 직접 제거
+        if not any(sink.name == "sqlite" for sink in self.sinks):
+            self.store.dequeue_detail(cert_num)
+        ROWS_TOTAL.inc(result="refreshed" if refresh else "added")
+        self.logger.info(
+            f"Added queued cert number: {cert_num} ({item['reason']}) [{self.collected}]",
+            extra={"cert_num": cert_num},
+        )
+        return True
+
+    def crawl_queue(self, items):
+        """상세 수집 대기열(detail_queue)에 있는 인증번호의 상세 페이지만 수집합니다.
+
+        목록 페이지를 순회하지 않으므로 Open API/목록 수집으로 채울 수 없는 인증번호에만 백엔드를 사용합니다.
+        """
+        try:
+            self.backend.open_list()
+            self.load_existing_data()
+
+            for item in items:
+                # 다른 워커/크롤러가 이미 수집한 경우
+                if not self.store.is_queued(item["cert_num"]):
+                    ROWS_TOTAL.inc(result="skipped")
+                    continue
+                self._collect_queued(item)
+                self._beat()
+            self.outcome = "finished"
+
+        except SystemExit:
+            pass
+        except KeyboardInterrupt:
+            self.outcome = "interrupted"
+            self.logger.info("사용자에 의해 중단되었습니다.")
+        except Exception as e:
+            self.logger.error(f"예상치 못한 오류: {e}")
+        finally:
+            self.close()
+
+    def crawl_frontier(self, batch_size=FRONTIER_BATCH):
+        """대기열을 우선순위 순서로 가져가며 수집합니다.
+
+        수집한 레코드의 연관 인증 번호가 계속 대기열에 추가되므로, 워커들은 대기열이 빌 때까지
+        DB에서 우선순위가 가장 높은 항목을 batch_size 건씩 가져갑니다 (claim_queue).
+        대기열이 비어도 다른 워커가 항목을 추가할 수 있으므로 FRONTIER_IDLE_POLLS 번 더 확인한 뒤 종료합니다.
+        """
+        self.worker = f"frontier-{self.index}"
+        idle = 0
+        try:
+            self.backend.open_list()
+            self.load_existing_data()
+            # 이전 실행에서 이 워커가 가져간 채 끝나지 않은 항목을 다시 가져올 수 있도록 풀어줌
+            self.store.release_claims(self.worker)
+
+            while idle <= FRONTIER_IDLE_POLLS:
+                items = self.store.claim_queue(self.worker, batch_size)
+                self._beat()
+                if not items:
+                    idle += 1
+                    self._sleep(max(self.sleep_time, FRONTIER_IDLE_SECONDS))
+                    continue
+                idle = 0
+                for item in items:
+                    self._collect_queued(dict(item))
+                    self._beat()
+            self.logger.info("상세 수집 대기열이 비어 있어 수집을 종료합니다.")
+            self.outcome = "finished"
+
+        except SystemExit:
+            pass
+        except KeyboardInterrupt:
+            self.outcome = "interrupted"
+            self.logger.info("사용자에 의해 중단되었습니다.")
+        except Exception as e:
+            self.logger.error(f"예상치 못한 오류: {e}")
+        finally:
+            # 수집하지 못한 항목은 다음 실행에서 다시 가져갈 수 있도록 풀어줌
+            self.store.release_claims(self.worker)
+            self.close()
@@ -0,0 +1,307 @@
+"""Safety Korea 통합 크롤러 CLI.
+
+실행 방식(--executor), fetch 백엔드(--backend), 저장 sink(--sink)를 골라서 같은 크롤러 코어(kc_core)를 실행합니다.
+
+사용 예:
+    python kc_crawl.py --executor thread --backend selenium --workers 10
+    python kc_crawl.py --executor thread --backend http --workers 20 --sleep 1
+    python kc_crawl.py --mode queue --backend http --sink sqlite
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import time
+
+import crawl_metrics
+from http_cache import DEFAULT_CACHE_PATH, DEFAULT_TTL
+from kc_backends import BACKENDS, DETAIL_MODES, DETAIL_URL, DETAIL_URL_MISSING, SLEEP_TIME, preload, warm_up_chrome
+from kc_chrome import DEFAULT_PROFILE_DIR
+from kc_core import SafetyKoreaCrawler
+from kc_executors import EXECUTORS, WorkerSpec
+from kc_sinks import SINKS
+from kc_store import CertStore, DEFAULT_DB_PATH
+from kc_supervisor import MAX_RESTARTS, STALL_TIMEOUT, Watchdog, run_with_restarts
+from log_pipeline import LOGGER_NAME, get_worker_logger, start_logging, stop_logging
+from maker_index import update_index
+
+MAX_WORKERS = 20
+
+
+def run_worker(spec: WorkerSpec, options: dict) -> str:
+    """워커 하나에서 실행될 크롤러 함수 (프로세스 실행기에서도 쓸 수 있도록 모듈 최상위에 정의)
+
+    크롤링 결과(finished, interrupted, failed)를 반환합니다. 크롤러를 만들지 못한 경우에도 failed 입니다.
+    """
+    logger = get_worker_logger(spec.index)
+    try:
+        crawler = SafetyKoreaCrawler(
+            spec.index,
+            backend=options["backend"],
+            sinks=options["sinks"],
+            db_path=options["db_path"],
+            output_dir=options["output_dir"],
+            output=options["output"],
+            cache_options=options["cache_options"],
+            sleep_time=options["sleep_time"],
+            backend_options=options["backend_options"],
+            expand_related=options["expand_related"],
+            heartbeat=options.get("heartbeat"),
+        )
+        crawler.logger.info(
+            f"Start Crawling - backend: {options['backend']}, sinks: {','.join(options['sinks'])} "
+            f"(direction: {spec.direction}, idx: {spec.index}, mode: {spec.mode})"
+        )
+
+        if spec.mode == "list":
+            crawler.crawl_list_only(spec.direction)
+        elif spec.mode == "queue":
+            crawler.crawl_queue(list(spec.items))
+        elif spec.mode == "frontier":
+            crawler.crawl_frontier()
+        else:
+            crawler.crawl_pages(spec.index if spec.row_index is None else spec.row_index, spec.direction)
+
+    except Exception as e:
+        logger.error(f"오류 발생 - {e}")
+        return "failed"
+    return crawler.outcome
+
+
+def run_supervised_worker(spec: WorkerSpec, options: dict) -> str:
+    """감독(kc_supervisor) 아래에서 워커를 실행합니다. 중단되면 백오프 후 체크포인트에서 다시 시작합니다."""
+    return run_with_restarts(run_worker, spec, options)
+
+
+def plan_workers(workers, mode="detail", direction="auto", row_index=None, queue_items=()):
+    """모드에 맞게 워커 실행 정보 목록을 만듭니다."""
+    specs = []
+    for i in range(workers):
+        if direction != "auto":
+            worker_direction = direction
+        elif mode == "list":
+            # 목록 수집 모드는 앞/뒤 방향 워커 2개가 가운데에서 만날 때까지 수집
+            worker_direction = "forward" if i == 0 else "backward"
+        else:
+            worker_direction = "forward" if i // 10 == 1 else "backward"
+        specs.append(WorkerSpec(i, worker_direction, mode, row_index, tuple(queue_items[i::workers])))
+    return specs
+
+
+def build_parser(description="Safety Korea 데이터 크롤러"):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--executor",
+        choices=sorted(EXECUTORS),
+        default="thread",
+        help="워커 실행 방식 (기본값: thread). asyncio 는 비동기 I/O 가 아니라 thread 에 --concurrency 제한을 더한 별칭",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="selenium",
+        help=(
+            "페이지 요청 방식 (기본값: selenium). http 는 목록 페이지를 ?page=N 주소로 직접 요청하는데, "
+            "이 주소는 모의 사이트(bench/mock_site.py) 기준으로 실제 사이트에서는 확인되지 않았습니다 "
+            "(SAFETYKOREA_LIST_PAGE_URL 로 재정의)"
+        ),
+    )
+    parser.add_argument(
+        "--sink",
+        nargs="+",
+        choices=sorted(SINKS),
+        default=["sqlite", "jsonl"],
+        help="수집한 레코드 저장 위치 (기본값: sqlite jsonl)",
+    )
+    parser.add_argument("--workers", type=int, default=10, help=f"실행할 워커 수 (기본값: 10, 최대 {MAX_WORKERS})")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="asyncio 실행기에서 동시에 실행할 워커 수 (기본값: 워커 수)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["detail", "list", "queue", "frontier"],
+        default="detail",
+        help=(
+            "detail: 행마다 상세 페이지 수집 (기본값), list: 목록 페이지 요약만 수집하고 상세 수집 대기열 생성, "
+            "queue: 상세 수집 대기열(reconcile.py/list 모드로 생성)의 인증번호만 수집, "
+            "frontier: 대기열을 우선순위 순서로 수집하며 연관 인증 번호로 대기열을 계속 확장"
+        ),
+    )
+    parser.add_argument(
+        "--expand-related",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="수집한 레코드의 연관 인증 번호를 상세 수집 대기열에 추가 (기본값: 사용)",
+    )
+    parser.add_argument(
+        "--supervise",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="워커 하트비트를 감시하고, 멈추거나 중단된 워커를 백오프 후 재시작 (기본값: 사용)",
+    )
+    parser.add_argument(
+        "--stall-timeout",
+        type=float,
+        default=STALL_TIMEOUT,
+        help=f"이 시간(초) 동안 진행이 없는 워커의 브라우저를 종료하고 재시작 (기본값: {STALL_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--max-restarts", type=int, default=MAX_RESTARTS, help=f"워커별 최대 연속 재시작 횟수 (기본값: {MAX_RESTARTS})"
+    )
+    parser.add_argument(
+        "--direction",
+        choices=["auto", "forward", "backward"],
+        default="auto",
+        help="목록 페이지 순회 방향 (기본값: auto - 워커 인덱스에 따라 결정)",
+    )
+    parser.add_argument("--row-index", type=int, default=None, help="모든 워커가 수집할 목록 행 (기본값: 워커 인덱스)")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    parser.add_argument("--output-dir", type=str, default="output", help="JSONL 출력 디렉토리 (기본값: output)")
+    parser.add_argument("--output", type=str, default=None, help="JSONL 출력 파일 경로 (워커가 1개일 때만 사용)")
+    parser.add_argument(
+        "--metrics-port", type=int, default=9108, help="메트릭 HTTP 포트 (기본값: 9108, 0이면 비활성화)"
+    )
+    parser.add_argument(
+        "--cache", type=str, default=DEFAULT_CACHE_PATH, help=f"상세 페이지 캐시 경로 (기본값: {DEFAULT_CACHE_PATH})"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help=f"캐시 유효 시간(초) (기본값: {DEFAULT_TTL}, 0이면 비활성화)",
+    )
+    parser.add_argument(
+        "--sleep", type=float, default=SLEEP_TIME, help=f"페이지 이동 간 고정 대기 시간(초) (기본값: {SLEEP_TIME})"
+    )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="브라우저를 화면 없이 실행 (selenium 백엔드, 기본값: 사용)",
+    )
+    parser.add_argument(
+        "--detail-mode",
+        choices=list(DETAIL_MODES),
+        default="fetch",
+        help=(
+            "selenium 백엔드의 상세 페이지 요청 방식. fetch: 목록 페이지에서 fetch() 로 요청 (기본값), "
+            "tab: 보조 탭에서 열기, click: 행 클릭 후 뒤로 가기"
+        ),
+    )
+    parser.add_argument(
+        "--fast-start",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="selenium 백엔드: chromedriver 경로를 캐시하고, 미리 데운 Chrome 프로필을 워커마다 복제해서 사용",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=DEFAULT_PROFILE_DIR,
+        help=f"--fast-start 의 템플릿/워커별 Chrome 프로필과 드라이버 캐시 위치 (기본값: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--index", type=str, default=None, help="수집이 끝난 뒤 증분 갱신할 검색 인덱스 파일 (예: data/maker_index.bin)"
+    )
+    return parser
+
+
+def main(argv=None, parser=None):
+    """선택한 실행 방식/백엔드/sink 로 크롤러를 실행합니다."""
+    args = (parser or build_parser()).parse_args(argv)
+    run(args)
+
+
+def run(args):
+    cache_options = {"path": args.cache, "ttl": args.cache_ttl} if args.cache_ttl > 0 else None
+
+    if args.metrics_port:
+        crawl_metrics.start_http_server(args.metrics_port)
+        print(f"메트릭 엔드포인트: http://127.0.0.1:{args.metrics_port}/metrics")
+    crawl_metrics.dump_summary_at_exit()
+
+    executor = EXECUTORS[args.executor](args.concurrency)
+    log_queue = multiprocessing.Queue() if executor.uses_process_logging else None
+    log_queue, log_listener = start_logging(log_queue=log_queue)
+    if executor.uses_process_logging:
+        executor.log_queue = log_queue
+
+    workers = args.workers
+    if workers > MAX_WORKERS:
+        print(f"경고: 워커 수는 최대 {MAX_WORKERS}개까지만 지원됩니다. {MAX_WORKERS}개로 제한합니다.")
+        workers = MAX_WORKERS
+
+    # 목록 수집 모드는 한 페이지의 모든 행을 처리하므로 앞/뒤 방향 워커 2개면 충분
+    if args.mode == "list" and workers > 2:
+        print("목록 수집 모드에서는 워커를 2개(앞/뒤 방향)까지만 사용합니다.")
+        workers = 2
+
+    # 대기열 모드는 대기열을 워커 수만큼 나눠서 각 워커에 할당
+    queue_items = []
+    if args.mode == "queue":
+        with CertStore(args.db) as store:
+            queue_items = [dict(row) for row in store.detail_queue()]
+        print(f"상세 수집 대기열: {len(queue_items)}건")
+        if not queue_items:
+            stop_logging(log_listener)
+            return
+        workers = min(workers, len(queue_items))
+
+    # 대기열 항목(Open API/연관 인증 번호)은 대부분 onclick 정보가 없어 SAFETYKOREA_DETAIL_URL 이 있어야 수집 가능
+    if DETAIL_URL is None and (args.mode == "frontier" or any(not item["detail_link"] for item in queue_items)):
+        stop_logging(log_listener)
+        raise SystemExit(DETAIL_URL_MISSING)
+
+    if args.output and workers > 1:
+        print("--output 은 워커가 1개일 때만 사용할 수 있습니다. 워커별 파일로 저장합니다.")
+        args.output = None
+
+    backend_options = {}
+    if args.backend == "selenium":
+        backend_options = {"headless": args.headless, "detail_mode": args.detail_mode}
+        if args.fast_start:
+            warm_up_chrome(args.profile_dir, logging.getLogger(f"{LOGGER_NAME}.chrome"), args.headless)
+            backend_options["profile_dir"] = args.profile_dir
+
+    # fork 로 만드는 워커 프로세스는 메인 프로세스의 import 결과를 물려받으므로 한 번만 import
+    if args.executor == "process" and multiprocessing.get_start_method() == "fork":
+        preload(args.backend)
+
+    options = {
+        "backend": args.backend,
+        "sinks": tuple(args.sink),
+        "db_path": args.db,
+        "output_dir": args.output_dir,
+        "output": args.output,
+        "cache_options": cache_options,
+        "sleep_time": args.sleep,
+        "backend_options": backend_options,
+        "expand_related": args.expand_related,
+    }
+    specs = plan_workers(workers, args.mode, args.direction, args.row_index, queue_items)
+
+    target, watchdog = run_worker, None
+    if args.supervise:
+        run_id = f"{os.getpid()}-{int(time.time())}"
+        options["supervisor"] = {"run_id": run_id, "max_restarts": args.max_restarts}
+        watchdog = Watchdog(args.db, run_id, args.stall_timeout)
+        watchdog.start()
+        target = run_supervised_worker
+
+    try:
+        executor.run(target, specs, options)
+        if args.index:
+            update_index(args.db, args.index)
+    except KeyboardInterrupt:
+        print("\n사용자에 의해 중단되었습니다.")
+        print("프로그램이 종료되었습니다.")
+    finally:
+        if watchdog is not None:
+            watchdog.stop()
+        stop_logging(log_listener)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+from typing import List, NamedTuple, Optional
+
+from log_pipeline import configure_worker
+
+
+class WorkerSpec(NamedTuple):
+    """워커 하나의 실행 정보"""
+
+    index: int
+    direction: str = "forward"
+    mode: str = "detail"
+    row_index: Optional[int] = None  # 목록 페이지에서 수집할 행 (None 이면 index)
+    items: tuple = ()  # 대기열 모드에서 수집할 대기열 항목
+
+
+class ThreadExecutor:
+    """워커마다 쓰레드를 하나씩 실행합니다."""
+
+    name = "thread"
+    uses_process_logging = False
+
+    def __init__(self, concurrency=None):
+        pass
+
+    def run(self, target, specs: List[WorkerSpec], options):
+        threads = []
+        for spec in specs:
+            t = Thread(target=target, args=(spec, options), name=f"worker-{spec.index}")
+            t.start()
+            threads.append(t)
+            print(f"Thread {spec.index} started (direction: {spec.direction}, idx: {spec.index})")
+
+        # 모든 쓰레드 종료 대기
+        for t in threads:
+            t.join()
+
+
+def _process_entry(target, spec, options, log_queue):
+    # 자식 프로세스의 로그는 큐를 통해 메인 프로세스의 로그 쓰레드가 기록
+    configure_worker(log_queue)
+    target(spec, options)
+
+
+class ProcessExecutor:
+    """워커마다 프로세스를 하나씩 실행합니다. 로그는 multiprocessing.Queue 로 메인 프로세스에 모읍니다."""
+
+    name = "process"
+    uses_process_logging = True
+
+    def __init__(self, concurrency=None):
+        self.log_queue = None
+
+    def run(self, target, specs: List[WorkerSpec], options):
+        processes = []
+        try:
+            for spec in specs:
+                p = multiprocessing.Process(target=_process_entry, args=(target, spec, options, self.log_queue))
+                p.start()
+                processes.append(p)
+                print(f"Process {spec.index} started (direction: {spec.direction}, idx: {spec.index})")
+
+            # 모든 프로세스 종료 대기
+            for p in processes:
+                p.join()
+        except KeyboardInterrupt:
+            # 실행 중인 모든 프로세스 종료
+            for p in processes:
+                if p.is_alive():
+                    p.terminate()
+                    p.join()
+            raise
+
+
+class AsyncioExecutor:
+    """thread 실행기에 동시 실행 워커 수 제한(concurrency)을 더한 별칭입니다.
+
+    크롤러 코어와 fetch 백엔드가 모두 블로킹 I/O 를 사용하므로 각 워커는 asyncio.to_thread 로 쓰레드에서 실행됩니다.
+    비동기 I/O 로 요청하는 것이 아니므로 thread 실행기와 처리량을 비교하는 용도로는 쓰지 않습니다.
+    """
+
+    name = "asyncio"
+    uses_process_logging = False
+
+    def __init__(self, concurrency=None):
+        self.concurrency = concurrency
+
+    def run(self, target, specs: List[WorkerSpec], options):
+        asyncio.run(self._run(target, specs, options))
+
+    async def _run(self, target, specs, options):
+        limit = self.concurrency or len(specs) or 1
+        semaphore = asyncio.Semaphore(limit)
+        # 기본 executor 의 쓰레드 수(CPU 수 + 4)가 워커 수보다 적으면 워커가 대기하므로 크기를 맞춤
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=limit))
+
+        async def run_one(spec):
+            async with semaphore:
+                print(f"Task {spec.index} started (direction: {spec.direction}, idx: {spec.index})")
+                await asyncio.to_thread(target, spec, options)
+
+        await asyncio.gather(*(run_one(spec) for spec in specs))
+
+
+EXECUTORS = {
+    "thread": ThreadExecutor,
+    "process": ProcessExecutor,
+    "asyncio": AsyncioExecutor,
+}
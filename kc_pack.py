@@ -0,0 +1,328 @@
+"""크롤러 출력용 압축 블록 파일 (.kcz)
+
+레코드를 BLOCK_RECORDS 건씩 모아 한 블록으로 압축해서 파일 끝에 추가합니다.
+- 블록 안의 레코드는 dict 키를 블록의 키 사전(fields)의 번호로 바꾼 JSON 이므로 '인증정보', '제조공장' 같은 긴 키가 반복되지 않습니다.
+  ({"인증정보": {"인증번호": ...}} -> {"0": {"1": ...}}, 읽을 때 json 디코더의 object_pairs_hook 으로 키를 되돌림)
+- 압축은 zstandard 가 설치되어 있으면 zstd, 없으면 zlib 을 사용합니다. 블록마다 코덱을 기록하므로 섞여 있어도 읽을 수 있습니다.
+- 블록 헤더 다음에는 압축하지 않은 메타데이터(인증번호 목록, 키 사전)가 있어서, 압축을 풀지 않고 헤더만 훑어
+  인증번호 -> (블록, 순번) 색인을 만들 수 있습니다. (인증번호 조회 시 해당 블록 하나만 압축 해제)
+- 쓰는 도중 중단되어 잘린 마지막 블록은 읽을 때 무시하고, 다시 추가할 때 잘라냅니다.
+
+블록 구조:
+    "KCZ1" | 코덱(u8) | 레코드 수(u32) | 메타 길이(u32) | 본문 길이(u32) | 메타(JSON) | 본문(압축된 JSONL)
+
+사용 예:
+    python kc_pack.py convert output/*.jsonl --output output/all.kcz
+    python kc_pack.py get output/all.kcz SU071234-12001
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import zlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard 가 없으면 표준 라이브러리 zlib 으로 압축
+    zstandard = None
+
+PACK_SUFFIX = ".kcz"
+# 쓰기 중인 블록에 아직 들어가지 않은 레코드를 보관하는 저널 (JSONL)
+JOURNAL_SUFFIX = ".pending.jsonl"
+
+BLOCK_MAGIC = b"KCZ1"
+BLOCK_HEADER = struct.Struct("<4sBIII")
+CODEC_ZLIB, CODEC_ZSTD = 1, 2
+CODEC_NAMES = {CODEC_ZLIB: "zlib", CODEC_ZSTD: "zstd"}
+
+# 한 블록에 담는 레코드 수 (인증번호로 한 건을 읽을 때 압축을 푸는 단위)
+BLOCK_RECORDS = 256
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+SEPARATORS = (",", ":")
+
+
+def default_codec() -> int:
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def _compress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd 로 압축된 파일입니다. zstandard 패키지를 설치하세요.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    raise ValueError(f"알 수 없는 압축 코덱: {codec}")
+
+
+def record_key(record: Dict) -> str:
+    """레코드의 인증번호 (상세 페이지 레코드 또는 Open API 레코드)"""
+    cert_info = record.get("인증정보")
+    if isinstance(cert_info, dict):
+        return (cert_info.get("인증번호") or "").strip()
+    return (record.get("certNum") or "").strip()
+
+
+class _KeyTable:
+    """블록 하나의 키 사전. dict 키를 처음 나온 순서의 번호(문자열)로 바꿉니다."""
+
+    def __init__(self):
+        self.fields: List[str] = []
+        self._ids: Dict[str, str] = {}
+
+    def _id(self, key: str) -> str:
+        field_id = self._ids.get(key)
+        if field_id is None:
+            field_id = self._ids[key] = str(len(self.fields))
+            self.fields.append(key)
+        return field_id
+
+    def encode(self, value):
+        if isinstance(value, dict):
+            return {self._id(key): self.encode(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        return value
+
+
+class Block(NamedTuple):
+    offset: int
+    codec: int
+    keys: List[str]
+    fields: Dict[str, str]  # 필드 번호 -> 키
+    payload_offset: int
+    payload_length: int
+
+    @property
+    def end(self) -> int:
+        return self.payload_offset + self.payload_length
+
+
+def iter_blocks(f) -> Iterator[Block]:
+    """파일의 블록 헤더와 메타데이터를 읽습니다. 본문은 읽지 않고 건너뜁니다."""
+    size = os.fstat(f.fileno()).st_size
+    offset = 0
+    while offset + BLOCK_HEADER.size <= size:
+        f.seek(offset)
+        magic, codec, count, meta_length, payload_length = BLOCK_HEADER.unpack(f.read(BLOCK_HEADER.size))
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"{getattr(f, 'name', '')}: {offset} 위치의 블록이 손상되었습니다.")
+        payload_offset = offset + BLOCK_HEADER.size + meta_length
+        if payload_offset + payload_length > size:
+            return  # 쓰는 도중 중단된 마지막 블록
+        meta = json.loads(f.read(meta_length))
+        fields = {str(field_id): sys.intern(key) for field_id, key in enumerate(meta["fields"])}
+        yield Block(offset, codec, meta["keys"], fields, payload_offset, payload_length)
+        offset = payload_offset + payload_length
+
+
+def read_block(f, block: Block) -> List[Dict]:
+    """블록 하나의 압축을 풀어 레코드 목록을 반환합니다."""
+    f.seek(block.payload_offset)
+    fields = block.fields
+    decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: {fields[key]: value for key, value in pairs})
+    text = _decompress(block.codec, f.read(block.payload_length)).decode("utf-8")
+    return [decoder.decode(line) for line in text.split("\n")]
+
+
+def iter_pack_records(path: str) -> Iterator[Dict]:
+    """.kcz 파일의 레코드를 블록 단위로 압축을 풀면서 순서대로 읽습니다."""
+    with open(path, "rb") as f:
+        for block in iter_blocks(f):
+            yield from read_block(f, block)
+
+
+def iter_pack_keys(path: str) -> Iterator[str]:
+    """.kcz 파일의 인증번호만 읽습니다. 블록 본문의 압축은 풀지 않습니다."""
+    with open(path, "rb") as f:
+        for block in iter_blocks(f):
+            yield from block.keys
+
+
+class PackWriter:
+    """레코드를 .kcz 파일 끝에 블록 단위로 추가합니다.
+
+    journal=True 이면 블록에 들어가기 전의 레코드를 저널 파일에 한 줄씩 바로 기록해 두고,
+    다시 열 때 저널의 레코드를 이어서 씁니다. (크롤러처럼 한 건씩 저장하면서 중단될 수 있는 경우)
+    """
+
+    def __init__(self, path: str, block_records: int = BLOCK_RECORDS, codec: Optional[int] = None, journal=False):
+        self.path = path
+        self.block_records = block_records
+        self.codec = codec or default_codec()
+        self.journal_path = path + JOURNAL_SUFFIX if journal else None
+        self.blocks = 0  # 이번에 쓴 블록 수
+        self._pending: List[Dict] = []
+        self._f = open(path, "a+b")
+        # 이전 실행이 블록을 쓰는 도중 중단되었으면 잘린 블록을 제거
+        valid = 0
+        for block in iter_blocks(self._f):
+            valid = block.end
+        self._f.truncate(valid)
+        self._journal = None
+        if self.journal_path:
+            self._recover_journal()
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+    def _recover_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    self._pending.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # 쓰는 도중 중단된 마지막 줄
+        # 블록을 다 쓴 뒤에 저널을 지움 (그 사이에 중단되면 다음에 같은 레코드를 한 번 더 쓰고, 나중 레코드가 사용됨)
+        self.flush()
+        os.remove(self.journal_path)
+
+    def write(self, record: Dict):
+        self._pending.append(record)
+        if self._journal is not None:
+            self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal.flush()
+        if len(self._pending) >= self.block_records:
+            self.flush()
+
+    def flush(self):
+        """모아 둔 레코드를 블록 하나로 압축해서 씁니다."""
+        if not self._pending:
+            return
+        table = _KeyTable()
+        lines = (
+            json.dumps(table.encode(record), ensure_ascii=False, separators=SEPARATORS) for record in self._pending
+        )
+        payload = _compress(self.codec, "\n".join(lines).encode("utf-8"))
+        meta = {"keys": [record_key(record) for record in self._pending], "fields": table.fields}
+        meta = json.dumps(meta, ensure_ascii=False, separators=SEPARATORS).encode("utf-8")
+        header = BLOCK_HEADER.pack(BLOCK_MAGIC, self.codec, len(self._pending), len(meta), len(payload))
+        self._f.write(header + meta + payload)
+        self._f.flush()
+        self.blocks += 1
+        self._pending = []
+        if self._journal is not None:
+            self._journal.truncate(0)
+
+    def close(self):
+        self.flush()
+        self._f.close()
+        if self._journal is not None:
+            self._journal.close()
+            os.remove(self.journal_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PackReader:
+    """인증번호로 .kcz 파일의 레코드를 조회합니다.
+
+    열 때 블록 헤더만 읽어 색인을 만들고, get() 은 해당 블록 하나의 압축만 풉니다.
+    같은 인증번호가 여러 번 있으면 파일에서 나중에 쓴 레코드를 반환합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        self.blocks = list(iter_blocks(self._f))
+        self._index: Dict[str, Tuple[int, int]] = {}
+        for block_id, block in enumerate(self.blocks):
+            for position, key in enumerate(block.keys):
+                if key:
+                    self._index[key.lower()] = (block_id, position)
+        self._cached: Tuple[int, List[Dict]] = (-1, [])
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, cert_num: str) -> bool:
+        return cert_num.lower() in self._index
+
+    def cert_numbers(self) -> set:
+        return set(self._index)
+
+    def get(self, cert_num: str) -> Optional[Dict]:
+        location = self._index.get(cert_num.lower())
+        if location is None:
+            return None
+        block_id, position = location
+        if self._cached[0] != block_id:
+            self._cached = (block_id, read_block(self._f, self.blocks[block_id]))
+        return self._cached[1][position]
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main():
+    from kc_record import iter_output_records
+
+    parser = argparse.ArgumentParser(description="크롤러 출력 압축 블록 파일(.kcz) 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert_parser = subparsers.add_parser("convert", help="JSON/JSONL 파일을 .kcz 파일로 변환합니다.")
+    convert_parser.add_argument("files", nargs="+", help="변환할 JSON/JSONL/.kcz 파일")
+    convert_parser.add_argument("--output", type=str, required=True, help="출력 .kcz 파일 (기존 파일에 이어서 씀)")
+    convert_parser.add_argument(
+        "--block-records", type=int, default=BLOCK_RECORDS, help=f"블록당 레코드 수 (기본값: {BLOCK_RECORDS})"
+    )
+
+    get_parser = subparsers.add_parser("get", help="인증번호로 레코드를 조회합니다.")
+    get_parser.add_argument("file", help=".kcz 파일")
+    get_parser.add_argument("cert_nums", nargs="+", help="조회할 인증번호")
+
+    stats_parser = subparsers.add_parser("stats", help=".kcz 파일 정보를 출력합니다.")
+    stats_parser.add_argument("files", nargs="+", help=".kcz 파일")
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        count, source_size = 0, 0
+        with PackWriter(args.output, args.block_records) as writer:
+            for path in args.files:
+                source_size += os.path.getsize(path)
+                for record in iter_output_records(path):
+                    writer.write(record)
+                    count += 1
+        size = os.path.getsize(args.output)
+        print(f"* {len(args.files)}개 파일, 레코드 {count}건 -> {args.output} ({CODEC_NAMES[writer.codec]})")
+        print(f"- 크기: {source_size / 1024 / 1024:.1f}MB -> {size / 1024 / 1024:.1f}MB")
+    elif args.command == "get":
+        with PackReader(args.file) as reader:
+            for cert_num in args.cert_nums:
+                record = reader.get(cert_num)
+                if record is None:
+                    print(f"{cert_num}: 없음")
+                else:
+                    print(json.dumps(record, ensure_ascii=False, indent=4))
+    else:
+        for path in args.files:
+            with open(path, "rb") as f:
+                blocks = list(iter_blocks(f))
+            codecs = ",".join(sorted({CODEC_NAMES.get(block.codec, str(block.codec)) for block in blocks})) or "-"
+            records = sum(len(block.keys) for block in blocks)
+            size = os.path.getsize(path)
+            print(f"{path}: 블록 {len(blocks)}개, 레코드 {records}건, {size / 1024 / 1024:.1f}MB ({codecs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from kc_pack import PACK_SUFFIX, iter_pack_keys, iter_pack_records
+
+try:
+    import ijson
+except ImportError:  # ijson 이 없으면 json.JSONDecoder.raw_decode 로 배열을 나눠서 디코딩
+    ijson = None
+
+# JSON 배열 파일을 스트리밍으로 읽을 때 한 번에 읽는 문자 수
+STREAM_CHUNK_SIZE = 1 << 16
+
+# 배열 원소 뒤에 올 수 있는 문자. 이 외의 문자가 이어지면 원소가 버퍼 경계에서 잘린 것
+_ARRAY_DELIMITERS = " \t\r\n,]"
+
+logger = logging.getLogger(__name__)
+
+# 키 순서가 같은 레코드들이 하나의 키 튜플(intern 된 문자열)을 공유하도록 보관
+_SCHEMAS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _schema(keys) -> Tuple[str, ...]:
+    keys = tuple(keys)
+    schema = _SCHEMAS.get(keys)
+    if schema is None:
+        schema = tuple(sys.intern(key) for key in keys)
+        _SCHEMAS[schema] = schema
+    return schema
+
+
+@dataclass(frozen=True, slots=True)
+class Factory:
+    """제조공장 상세 테이블의 행"""
+
+    number: str
+    name: str
+    country: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"번호": self.number, "제조공장": self.name, "제조국": self.country}
+
+
+@dataclass(frozen=True, slots=True)
+class RelatedCert:
+    """연관 인증 번호 상세 테이블의 행"""
+
+    number: str
+    cert_num: str
+    state: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"번호": self.number, "인증번호": self.cert_num, "인증상태": self.state}
+
+
+@dataclass(frozen=True, slots=True)
+class CertRecord:
+    """상세 페이지 레코드 한 건의 메모리 절약형 표현입니다.
+
+    인증정보/제품정보는 dict 대신 (공유 키 튜플, 값 튜플)로 저장하고,
+    제조공장/연관 인증 번호는 __slots__ 레코드의 튜플로 저장합니다.
+    to_detail() 은 parse_detail_page 와 같은 형식의 dict 를 돌려줍니다.
+    """
+
+    cert_keys: Tuple[str, ...]
+    cert_values: Tuple[str, ...]
+    product_keys: Tuple[str, ...]
+    product_values: Tuple[str, ...]
+    factories: Tuple[Factory, ...] = ()
+    related: Tuple[RelatedCert, ...] = ()
+
+    @classmethod
+    def from_detail(cls, item: Dict) -> "CertRecord":
+        cert_info = item.get("인증정보", {})
+        product_info = item.get("제품정보", {})
+        return cls(
+            cert_keys=_schema(cert_info.keys()),
+            cert_values=tuple(cert_info.values()),
+            product_keys=_schema(product_info.keys()),
+            product_values=tuple(product_info.values()),
+            factories=tuple(
+                Factory(f.get("번호", ""), f.get("제조공장", ""), f.get("제조국", "")) for f in item.get("제조공장", [])
+            ),
+            related=tuple(
+                RelatedCert(r.get("번호", ""), r.get("인증번호", ""), r.get("인증상태", ""))
+                for r in item.get("연관 인증 번호", [])
+            ),
+        )
+
+    def cert_field(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        try:
+            return self.cert_values[self.cert_keys.index(key)]
+        except ValueError:
+            return default
+
+    @property
+    def cert_num(self) -> str:
+        return self.cert_field("인증번호", "")
+
+    def to_detail(self) -> Dict:
+        return {
+            "인증정보": dict(zip(self.cert_keys, self.cert_values)),
+            "제품정보": dict(zip(self.product_keys, self.product_values)),
+            "제조공장": [factory.to_dict() for factory in self.factories],
+            "연관 인증 번호": [related.to_dict() for related in self.related],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_detail(), ensure_ascii=False)
+
+
+def append_jsonl(path: str, record: CertRecord):
+    """레코드 한 건을 JSONL 파일 끝에 추가합니다. 기존 내용은 다시 쓰지 않습니다."""
+    line = (record.to_json() + "\n").encode("utf-8")
+    with open(path, "a+b") as f:
+        # 이전 실행이 줄 중간에서 중단되었으면 잘린 줄과 이어붙지 않도록 줄을 바꿈
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+
+
+class _JsonStream:
+    """텍스트 파일을 STREAM_CHUNK_SIZE 씩 읽으며 JSON 값을 하나씩 디코딩하는 버퍼입니다."""
+
+    def __init__(self, f):
+        self.f = f
+        self.decoder = json.JSONDecoder()
+        self.buf, self.pos, self.eof = "", 0, False
+
+    def _read_more(self):
+        # 이미 처리한 부분은 버리고 더 읽음 (큰 값은 읽는 양을 늘려서 반복 디코딩을 줄임)
+        chunk = self.f.read(max(STREAM_CHUNK_SIZE, len(self.buf) - self.pos))
+        self.eof = not chunk
+        self.buf, self.pos = self.buf[self.pos :] + chunk, 0
+
+    def peek(self, skip: str = " \t\r\n") -> str:
+        """skip 에 있는 문자를 건너뛰고 다음 문자를 반환합니다. 파일 끝이면 빈 문자열을 반환합니다."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos : self.pos + 1]
+            self._read_more()
+
+    def expect(self, char: str, message: str):
+        if self.peek() != char:
+            raise ValueError(message)
+        self.pos += 1
+
+    def decode(self, delimiters: str = _ARRAY_DELIMITERS):
+        """현재 위치의 JSON 값을 디코딩합니다.
+
+        숫자는 버퍼 경계에서 잘려도 디코딩되므로 ("12345." -> 12345, "-3e" -> -3),
+        값 뒤에 구분 문자(delimiters)가 오는 경우에만 완전한 값으로 보고, 그렇지 않으면 더 읽은 뒤 다시 디코딩합니다.
+        """
+        while True:
+            if self.pos < len(self.buf):
+                try:
+                    value, end = self.decoder.raw_decode(self.buf, self.pos)
+                except json.JSONDecodeError:
+                    if self.eof:
+                        raise
+                else:
+                    if self.eof or (end < len(self.buf) and self.buf[end] in delimiters):
+                        self.pos = end
+                        return value
+            elif self.eof:
+                raise ValueError("JSON 값이 끝나지 않았습니다.")
+            self._read_more()
+
+
+def _iter_json_array(stream: _JsonStream) -> Iterator:
+    """현재 위치의 JSON 배열 원소를 하나씩 디코딩합니다."""
+    stream.expect("[", "JSON 배열 형식이 아닙니다.")
+    while True:
+        # 원소 사이의 공백과 쉼표 건너뛰기
+        char = stream.peek(" \t\r\n,")
+        if char == "]":
+            stream.pos += 1
+            return
+        if not char:
+            raise ValueError("JSON 배열이 닫히지 않았습니다.")
+        yield stream.decode()
+
+
+def _iter_json_items(f) -> Iterator:
+    """텍스트 파일의 최상위 JSON 배열 원소를 하나씩 디코딩합니다. 파일 전체를 메모리에 올리지 않습니다.
+
+    certifications_all_years.json 처럼 {키: [레코드]} 형식이면 각 배열의 원소를 차례로 디코딩합니다.
+    """
+    stream = _JsonStream(f)
+    if stream.peek() != "{":
+        yield from _iter_json_array(stream)
+        return
+    stream.pos += 1
+    while (char := stream.peek(" \t\r\n,")) != "}":
+        if not char:
+            raise ValueError("JSON 객체가 닫히지 않았습니다.")
+        stream.decode(" \t\r\n:")  # 키 (연도)
+        stream.expect(":", "JSON 객체 형식이 아닙니다.")
+        yield from _iter_json_array(stream)
+
+
+def _first_char(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return _JsonStream(f).peek()
+
+
+def iter_json_records(path: str) -> Iterator[Dict]:
+    """JSON 배열, {키: [레코드]} 형식의 JSON 객체, JSONL 또는 압축 블록(.kcz) 파일의 레코드를 하나씩 읽습니다.
+
+    배열 파일도 파일 전체를 파싱하지 않고 원소 단위로 디코딩하므로, 메모리 사용량은 레코드 한 건 크기 정도이고
+    첫 레코드부터 바로 처리할 수 있습니다. ijson 이 설치되어 있으면 최상위 배열 파일은 ijson 으로 읽습니다.
+    JSONL 에서 디코딩되지 않는 줄(저장 도중 중단되어 잘린 마지막 줄 등)은 건너뛰고 경고 로그를 남깁니다.
+    """
+    if path.endswith(PACK_SUFFIX):
+        yield from iter_pack_records(path)
+    elif path.endswith(".jsonl"):
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"{path}:{line_no} 디코딩할 수 없는 줄을 건너뜁니다: {e}")
+    elif ijson is not None and _first_char(path) == "[":
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _iter_json_items(f)
+
+
+def iter_output_records(path: str) -> Iterator[Dict]:
+    """크롤러 출력 파일(JSON 배열, JSONL 또는 .kcz)의 레코드를 순회합니다."""
+    return iter_json_records(path)
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    """items 를 size 개씩 묶어서 반환합니다. (DataFrame 을 나눠서 만들 때 사용)"""
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+
+def _iter_cert_numbers(path: str) -> Iterator[str]:
+    """출력 파일의 인증번호만 읽습니다. .kcz 파일이나 ijson 으로 읽는 배열 파일은 레코드 dict 를 만들지 않습니다."""
+    if path.endswith(PACK_SUFFIX):
+        yield from iter_pack_keys(path)
+        return
+    if ijson is not None and not path.endswith(".jsonl"):
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item.인증정보.인증번호")
+        return
+    for item in iter_json_records(path):
+        yield item.get("인증정보", {}).get("인증번호")
+
+
+def load_cert_numbers(*paths: str) -> set:
+    """출력 파일들에 저장된 인증번호를 소문자 집합으로 반환합니다. 없는 파일은 무시합니다."""
+    cert_numbers = set()
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        for cert_num in _iter_cert_numbers(path):
+            if cert_num:
+                cert_numbers.add(cert_num.lower())
+    return cert_numbers
@@ -0,0 +1,125 @@
+import os
+
+from kc_pack import PACK_SUFFIX, PackWriter
+from kc_record import append_jsonl
+
+
+class SqliteSink:
+    """상세 레코드를 인증 DB(CertStore)에 저장하는 sink 입니다.
+
+    체크포인트가 주어지면 레코드와 체크포인트를 한 트랜잭션으로 커밋합니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, store, logger):
+        self.store = store
+        self.logger = logger
+
+    def existing_paths(self):
+        return []
+
+    def write(self, record, data, checkpoint=None) -> bool:
+        """레코드를 저장합니다. 체크포인트까지 커밋했으면 True 를 반환합니다."""
+        if checkpoint is None:
+            self.store.upsert_detail(data)
+            return False
+        self.store.commit_detail(*checkpoint, data)
+        return True
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """상세 레코드를 워커별 JSONL 파일 끝에 한 줄씩 추가하는 sink 입니다."""
+
+    name = "jsonl"
+
+    def __init__(self, store, logger, output_dir="output", index=0, path=None):
+        self.logger = logger
+        if path is None:
+            os.makedirs(output_dir, exist_ok=True)
+            path = f"{output_dir}/{index}.jsonl"
+            self.legacy_path = f"{output_dir}/{index}.json"  # 이전 버전의 JSON 배열 출력
+        else:
+            self.legacy_path = os.path.splitext(path)[0] + ".json"
+        self.path = path
+        # output/0.jsonl -> output/backup_0.jsonl
+        self.backup_path = os.path.join(os.path.dirname(path), f"backup_{os.path.basename(path)}")
+
+    def existing_paths(self):
+        return [self.legacy_path, self.path, self.backup_path]
+
+    def write(self, record, data, checkpoint=None) -> bool:
+        try:
+            append_jsonl(self.path, record)
+        except Exception as e:
+            self.logger.error(f"데이터 저장 중 오류 발생: {e}")
+            self._save_backup(record)
+        return False
+
+    def _save_backup(self, record):
+        """백업 파일 저장을 시도합니다. 백업도 실패하면 예외를 다시 발생시킵니다."""
+        try:
+            append_jsonl(self.backup_path, record)
+            self.logger.info("데이터가 backup 파일로 저장되었습니다.")
+        except Exception as e:
+            self.logger.error(f"데이터 저장에 완전히 실패했습니다: {e}")
+            raise
+
+    def close(self):
+        pass
+
+
+class PackSink:
+    """상세 레코드를 워커별 압축 블록 파일(.kcz, kc_pack)에 기록하는 sink 입니다.
+
+    블록에 모이기 전의 레코드는 저널 파일에 바로 기록되므로, 중단되어도 다음 실행에서 이어서 블록으로 씁니다.
+    JSONL sink 와 마찬가지로 SQLite 트랜잭션 밖에서 쓰므로, 재시작 시에는 existing_cert_numbers 로 중복을 거릅니다.
+    쓰기에 실패하면 예외를 다시 발생시켜 체크포인트가 넘어가지 않게 합니다.
+    """
+
+    name = "kcz"
+
+    def __init__(self, store, logger, output_dir="output", index=0, path=None):
+        self.logger = logger
+        if path is None:
+            os.makedirs(output_dir, exist_ok=True)
+            path = f"{output_dir}/{index}{PACK_SUFFIX}"
+        else:
+            path = os.path.splitext(path)[0] + PACK_SUFFIX
+        self.path = path
+        self.writer = PackWriter(path, journal=True)
+
+    def existing_paths(self):
+        return [self.path, self.writer.journal_path]
+
+    def write(self, record, data, checkpoint=None) -> bool:
+        try:
+            self.writer.write(record.to_detail())
+        except Exception as e:
+            self.logger.error(f"데이터 저장 중 오류 발생: {e}")
+            raise
+        return False
+
+    def close(self):
+        self.writer.close()
+
+
+SINKS = {
+    "sqlite": SqliteSink,
+    "jsonl": JsonlSink,
+    "kcz": PackSink,
+}
+
+
+def build_sinks(names, store, logger, output_dir="output", index=0, output=None):
+    """이름 목록으로 sink 들을 생성합니다."""
+    sinks = []
+    for name in names:
+        if name in ("jsonl", "kcz"):
+            sinks.append(SINKS[name](store, logger, output_dir, index, output))
+        else:
+            sinks.append(SINKS[name](store, logger))
+    return sinks
@@ -0,0 +1,738 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from change_detect import FINGERPRINT_FIELDS, ChangeDetector, fingerprint, observed_fields
+from kc_pack import JOURNAL_SUFFIX, PACK_SUFFIX
+from kc_record import iter_chunks, iter_json_records
+
+DEFAULT_DB_PATH = "data/certificates.db"
+
+# JSON 파일을 DB로 가져오거나 비교할 때 한 번에 처리(한 트랜잭션으로 저장)하는 레코드 수
+IMPORT_CHUNK_ROWS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS certificates (
+    cert_num        TEXT PRIMARY KEY COLLATE NOCASE,
+    cert_organ      TEXT,
+    cert_div        TEXT,
+    cert_state      TEXT,
+    cert_date       TEXT,
+    change_date     TEXT NOT NULL DEFAULT '',
+    change_reason   TEXT,
+    recall          TEXT,
+    product_name    TEXT,
+    model_name      TEXT,
+    brand_name      TEXT,
+    category        TEXT,
+    detail_info     TEXT,
+    derived_models  TEXT,
+    import_div      TEXT,
+    maker_name      TEXT,
+    maker_country   TEXT,
+    has_detail      INTEGER NOT NULL DEFAULT 0,
+    has_api         INTEGER NOT NULL DEFAULT 0,
+    detail_json     TEXT,
+    api_json        TEXT,
+    updated_at      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_certificates_maker ON certificates (maker_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_certificates_cert_date ON certificates (cert_date);
+CREATE INDEX IF NOT EXISTS idx_certificates_change_date ON certificates (change_date);
+
+CREATE TABLE IF NOT EXISTS factories (
+    cert_num        TEXT NOT NULL COLLATE NOCASE REFERENCES certificates (cert_num) ON DELETE CASCADE,
+    seq             INTEGER NOT NULL,
+    factory_name    TEXT,
+    country         TEXT,
+    PRIMARY KEY (cert_num, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_factories_name ON factories (factory_name COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS related_certs (
+    cert_num        TEXT NOT NULL COLLATE NOCASE REFERENCES certificates (cert_num) ON DELETE CASCADE,
+    related_num     TEXT NOT NULL COLLATE NOCASE,
+    related_state   TEXT,
+    PRIMARY KEY (cert_num, related_num)
+);
+CREATE INDEX IF NOT EXISTS idx_related_certs_related ON related_certs (related_num);
+
+-- 목록 페이지에서 수집한 요약 정보 (상세 페이지를 열지 않고 수집)
+CREATE TABLE IF NOT EXISTS list_summaries (
+    cert_num        TEXT PRIMARY KEY COLLATE NOCASE,
+    summary_json    TEXT NOT NULL,
+    summary_hash    TEXT NOT NULL,
+    detail_link     TEXT,
+    first_seen      TEXT NOT NULL,
+    last_seen       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_list_summaries_last_seen ON list_summaries (last_seen);
+
+-- 마지막으로 수집한 상세 데이터의 상태 지문 (인증상태, 인증변경일자, 인증변경사유)
+CREATE TABLE IF NOT EXISTS fingerprints (
+    cert_num        TEXT PRIMARY KEY COLLATE NOCASE,
+    cert_state      TEXT NOT NULL DEFAULT '',
+    change_date     TEXT NOT NULL DEFAULT '',
+    change_reason   TEXT NOT NULL DEFAULT '',
+    fingerprint     TEXT NOT NULL,
+    updated_at      TEXT NOT NULL
+);
+
+-- 크롤러 워커별 체크포인트 (페이지 커서, 수집 중인 인증번호)
+CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+    worker          TEXT PRIMARY KEY,
+    direction       TEXT NOT NULL,
+    page            INTEGER NOT NULL,
+    in_flight       TEXT,
+    committed       INTEGER NOT NULL DEFAULT 0,
+    updated_at      TEXT NOT NULL
+);
+
+-- 상세 페이지 수집이 필요한 인증번호 (priority 가 높은 것부터 수집, claimed_by 는 수집 중인 워커)
+CREATE TABLE IF NOT EXISTS detail_queue (
+    cert_num        TEXT PRIMARY KEY COLLATE NOCASE,
+    reason          TEXT NOT NULL,
+    detail_link     TEXT,
+    enqueued_at     TEXT NOT NULL,
+    priority        REAL NOT NULL DEFAULT 0,
+    claimed_by      TEXT,
+    claimed_at      TEXT
+);
+"""
+
+# 이전 버전 DB에 없는 컬럼 (테이블, 컬럼, 정의)
+MIGRATIONS = [
+    ("detail_queue", "priority", "REAL NOT NULL DEFAULT 0"),
+    ("detail_queue", "claimed_by", "TEXT"),
+    ("detail_queue", "claimed_at", "TEXT"),
+]
+
+# 컬럼 추가 후에 만드는 인덱스
+POST_MIGRATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_detail_queue_priority ON detail_queue (priority DESC, enqueued_at);
+"""
+
+# 수집 중으로 표시된 뒤 이 시간(초)이 지나도록 완료되지 않은 대기열 항목은 다른 워커가 다시 가져감
+CLAIM_TIMEOUT = 10 * 60
+
+# 인증변경일자가 같거나 더 최신인 경우에만 갱신하고, 비어 있는 값으로 기존 값을 덮어쓰지 않음.
+# 상세 데이터 없이 더 최신 레코드(Open API)가 들어오면 기존 detail_json 은 이전 버전이므로
+# has_detail 을 0 으로 내려 상세 수집 대상에 다시 포함시킴 (detail_json 은 다시 수집할 때까지 유지)
+UPSERT_SQL = """
+INSERT INTO certificates (
+    cert_num, cert_organ, cert_div, cert_state, cert_date, change_date, change_reason, recall,
+    product_name, model_name, brand_name, category, detail_info, derived_models, import_div,
+    maker_name, maker_country, has_detail, has_api, detail_json, api_json, updated_at
+) VALUES (
+    :cert_num, :cert_organ, :cert_div, :cert_state, :cert_date, :change_date, :change_reason, :recall,
+    :product_name, :model_name, :brand_name, :category, :detail_info, :derived_models, :import_div,
+    :maker_name, :maker_country, :has_detail, :has_api, :detail_json, :api_json, :updated_at
+)
+ON CONFLICT (cert_num) DO UPDATE SET
+    cert_organ = COALESCE(NULLIF(excluded.cert_organ, ''), cert_organ),
+    cert_div = COALESCE(NULLIF(excluded.cert_div, ''), cert_div),
+    cert_state = COALESCE(NULLIF(excluded.cert_state, ''), cert_state),
+    cert_date = COALESCE(NULLIF(excluded.cert_date, ''), cert_date),
+    change_date = excluded.change_date,
+    change_reason = COALESCE(NULLIF(excluded.change_reason, ''), change_reason),
+    recall = COALESCE(NULLIF(excluded.recall, ''), recall),
+    product_name = COALESCE(NULLIF(excluded.product_name, ''), product_name),
+    model_name = COALESCE(NULLIF(excluded.model_name, ''), model_name),
+    brand_name = COALESCE(NULLIF(excluded.brand_name, ''), brand_name),
+    category = COALESCE(NULLIF(excluded.category, ''), category),
+    detail_info = COALESCE(NULLIF(excluded.detail_info, ''), detail_info),
+    derived_models = COALESCE(NULLIF(excluded.derived_models, ''), derived_models),
+    import_div = COALESCE(NULLIF(excluded.import_div, ''), import_div),
+    maker_name = COALESCE(NULLIF(excluded.maker_name, ''), maker_name),
+    maker_country = COALESCE(NULLIF(excluded.maker_country, ''), maker_country),
+    has_detail = CASE
+        WHEN excluded.has_detail = 1 THEN 1
+        WHEN excluded.change_date > certificates.change_date THEN 0
+        ELSE has_detail
+    END,
+    has_api = MAX(has_api, excluded.has_api),
+    detail_json = COALESCE(excluded.detail_json, detail_json),
+    api_json = COALESCE(excluded.api_json, api_json),
+    updated_at = excluded.updated_at
+WHERE excluded.change_date >= certificates.change_date
+"""
+
+
+def normalize_date(value) -> str:
+    """'2023-05-12', '2023.05.12', '20230512' 등을 'YYYYMMDD' 형식으로 통일합니다."""
+    if not value:
+        return ""
+    digits = re.sub(r"\D", "", str(value))
+    return digits[:8] if len(digits) >= 8 else ""
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def summary_hash(summary: Dict) -> str:
+    """목록 요약 정보의 변경 여부를 비교하기 위한 해시를 계산합니다."""
+    payload = json.dumps(summary, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _row_from_detail(item: Dict) -> Optional[Dict]:
+    """크롤러 상세 페이지 레코드를 certificates 행으로 변환합니다."""
+    cert_info = item.get("인증정보", {})
+    product_info = item.get("제품정보", {})
+    cert_num = cert_info.get("인증번호", "").strip()
+    if not cert_num:
+        return None
+
+    # 상세 페이지에는 제조사 항목이 없으므로 첫 번째 제조공장을 대표 제조사로 사용
+    factories = item.get("제조공장", [])
+    first_factory = factories[0] if factories else {}
+
+    return {
+        "cert_num": cert_num,
+        "cert_organ": cert_info.get("인증기관", ""),
+        "cert_div": cert_info.get("인증구분", ""),
+        "cert_state": cert_info.get("인증상태", ""),
+        "cert_date": normalize_date(cert_info.get("인증일자")),
+        "change_date": normalize_date(cert_info.get("인증변경일자")),
+        "change_reason": cert_info.get("인증변경사유", ""),
+        "recall": cert_info.get("리콜현황(모델명)", ""),
+        "product_name": product_info.get("품목명", ""),
+        "model_name": product_info.get("모델명", ""),
+        "brand_name": product_info.get("브랜드명", ""),
+        "category": product_info.get("제품분류코드", ""),
+        "detail_info": product_info.get("상세정보", ""),
+        "derived_models": product_info.get("파생모델", ""),
+        "import_div": "",
+        "maker_name": first_factory.get("제조공장", ""),
+        "maker_country": first_factory.get("제조국", ""),
+        "has_detail": 1,
+        "has_api": 0,
+        "detail_json": json.dumps(item, ensure_ascii=False),
+        "api_json": None,
+    }
+
+
+def _row_from_api(item: Dict) -> Optional[Dict]:
+    """Open API(certificationList.json) 레코드를 certificates 행으로 변환합니다."""
+    cert_num = (item.get("certNum") or "").strip()
+    if not cert_num:
+        return None
+
+    derived = item.get("derivationModels") or ""
+    if isinstance(derived, list):
+        derived = ", ".join(str(model) for model in derived)
+
+    return {
+        "cert_num": cert_num,
+        "cert_organ": item.get("certOrganName", ""),
+        "cert_div": item.get("certDiv", ""),
+        "cert_state": item.get("certState", ""),
+        "cert_date": normalize_date(item.get("certDate")),
+        "change_date": normalize_date(item.get("certChgDate")),
+        "change_reason": item.get("certChgReason", ""),
+        "recall": "",
+        "product_name": item.get("productName", ""),
+        "model_name": item.get("modelName", ""),
+        "brand_name": item.get("brandName", ""),
+        "category": item.get("categoryName", ""),
+        "detail_info": "",
+        "derived_models": derived,
+        "import_div": item.get("importDiv", ""),
+        "maker_name": item.get("makerName", ""),
+        "maker_country": item.get("makerCntryName", ""),
+        "has_detail": 0,
+        "has_api": 1,
+        "detail_json": None,
+        "api_json": json.dumps(item, ensure_ascii=False),
+    }
+
+
+class CertStore:
+    """인증 데이터를 저장하는 SQLite 기반 저장소입니다.
+
+    쓰레드마다 별도의 CertStore 인스턴스(커넥션)를 사용하는 것을 전제로 하며,
+    WAL 모드를 사용하므로 여러 쓰레드/프로세스가 같은 DB 파일에 동시에 기록할 수 있습니다.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+        self._migrate()
+        self._backfill_fingerprints()
+        self.detector = ChangeDetector(self)
+
+    def _migrate(self):
+        """이전 버전 DB에 새 컬럼을 추가합니다."""
+        # 여러 워커가 같은 DB를 동시에 열어도 컬럼을 한 번만 추가하도록 쓰기 잠금을 먼저 잡음
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table, column, definition in MIGRATIONS:
+                columns = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.executescript(POST_MIGRATION_SCHEMA)
+
+    def _backfill_fingerprints(self):
+        """지문 테이블이 추가되기 전에 저장된 상세 데이터의 지문을 채웁니다."""
+        if self.conn.execute("SELECT 1 FROM fingerprints LIMIT 1").fetchone():
+            return
+        with self._lock, self.conn:
+            for (detail_json,) in self.conn.execute(
+                "SELECT detail_json FROM certificates WHERE detail_json IS NOT NULL"
+            ).fetchall():
+                self._set_fingerprint(json.loads(detail_json))
+
+    def _set_fingerprint(self, item: Dict):
+        cert_num, observed = observed_fields(item)
+        values = {field: observed.get(field, "") for field in FINGERPRINT_FIELDS}
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO fingerprints (cert_num, cert_state, change_date, change_reason, fingerprint, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                cert_num,
+                values["cert_state"],
+                values["change_date"],
+                values["change_reason"],
+                fingerprint(values),
+                _now(),
+            ),
+        )
+
+    def close(self):
+        """DB 커넥션을 닫습니다."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _upsert(self, row: Dict, factories: List[tuple], related: List[tuple]) -> bool:
+        """한 건을 upsert 하고, 갱신된 경우 하위 테이블을 교체합니다."""
+        row["updated_at"] = _now()
+        cursor = self.conn.execute(UPSERT_SQL, row)
+        if cursor.rowcount == 0:
+            return False
+
+        cert_num = row["cert_num"]
+        if factories:
+            self.conn.execute("DELETE FROM factories WHERE cert_num = ?", (cert_num,))
+            self.conn.executemany(
+                "INSERT INTO factories (cert_num, seq, factory_name, country) VALUES (?, ?, ?, ?)",
+                [(cert_num, seq, name, country) for seq, name, country in factories],
+            )
+        if related:
+            self.conn.execute("DELETE FROM related_certs WHERE cert_num = ?", (cert_num,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO related_certs (cert_num, related_num, related_state) VALUES (?, ?, ?)",
+                [(cert_num, num, state) for num, state in related],
+            )
+        return True
+
+    def upsert_detail(self, item: Dict) -> bool:
+        """크롤러 상세 페이지 레코드를 저장합니다. 저장(갱신)되었으면 True를 반환합니다."""
+        return self.upsert_details([item]) == 1
+
+    def _upsert_detail_item(self, item: Dict) -> bool:
+        row = _row_from_detail(item)
+        if row is None:
+            return False
+        factories = [
+            (seq, factory.get("제조공장", ""), factory.get("제조국", ""))
+            for seq, factory in enumerate(item.get("제조공장", []), start=1)
+        ]
+        related = [
+            (rel.get("인증번호", ""), rel.get("인증상태", ""))
+            for rel in item.get("연관 인증 번호", [])
+            if rel.get("인증번호")
+        ]
+        accepted = self._upsert(row, factories, related)
+        if accepted:
+            self._set_fingerprint(item)
+            # 상세 데이터를 반영했으므로 대기열에서 제거.
+            # 저장된 것보다 오래된 페이지였으면 대기열에 남겨 두어 다음 실행(또는 CLAIM_TIMEOUT 후)에 다시 수집
+            self.conn.execute("DELETE FROM detail_queue WHERE cert_num = ?", (row["cert_num"],))
+        return accepted
+
+    def upsert_details(self, items) -> int:
+        """크롤러 상세 페이지 레코드 여러 건을 한 트랜잭션으로 저장합니다."""
+        accepted = 0
+        with self._lock, self.conn:
+            for item in items:
+                accepted += self._upsert_detail_item(item)
+        return accepted
+
+    def get_checkpoint(self, worker: str) -> Optional[sqlite3.Row]:
+        """워커의 마지막 체크포인트를 조회합니다."""
+        return self.conn.execute("SELECT * FROM crawl_checkpoints WHERE worker = ?", (worker,)).fetchone()
+
+    def _save_checkpoint(self, worker: str, direction: str, page: int, in_flight: Optional[str], committed: int = 0):
+        self.conn.execute(
+            """
+            INSERT INTO crawl_checkpoints (worker, direction, page, in_flight, committed, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (worker) DO UPDATE SET
+                direction = excluded.direction,
+                page = excluded.page,
+                in_flight = excluded.in_flight,
+                committed = committed + excluded.committed,
+                updated_at = excluded.updated_at
+            """,
+            (worker, direction, page, in_flight, committed, _now()),
+        )
+
+    def save_checkpoint(self, worker: str, direction: str, page: int, in_flight: Optional[str] = None):
+        """워커의 페이지 커서와 수집 중인 인증번호를 기록합니다."""
+        with self._lock, self.conn:
+            self._save_checkpoint(worker, direction, page, in_flight)
+
+    def commit_detail(self, worker: str, direction: str, page: int, item: Dict) -> bool:
+        """상세 레코드 저장과 체크포인트 갱신(수집 중 표시 해제)을 한 트랜잭션으로 처리합니다.
+
+        둘 중 하나만 반영되는 경우가 없으므로, 재시작하면 커밋된 레코드는 건너뛰고
+        커밋되지 않은 인증번호(in_flight)는 다시 수집합니다.
+        """
+        with self._lock, self.conn:
+            accepted = self._upsert_detail_item(item)
+            self._save_checkpoint(worker, direction, page, None, committed=1)
+        return accepted
+
+    def clear_checkpoint(self, worker: str):
+        """워커의 체크포인트를 삭제합니다 (처음부터 다시 수집)."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM crawl_checkpoints WHERE worker = ?", (worker,))
+
+    def upsert_api_records(self, items) -> int:
+        """Open API 레코드 여러 건을 한 트랜잭션으로 저장합니다."""
+        accepted = 0
+        with self._lock, self.conn:
+            for item in items:
+                row = _row_from_api(item)
+                if row is None:
+                    continue
+                factories = [
+                    (seq, factory.get("makerName", ""), factory.get("makerCntryName", ""))
+                    for seq, factory in enumerate(item.get("factories") or [], start=1)
+                ]
+                related = [
+                    (rel.get("certNum", ""), rel.get("certState", ""))
+                    for rel in item.get("similarCertifications") or []
+                    if rel.get("certNum")
+                ]
+                accepted += self._upsert(row, factories, related)
+        return accepted
+
+    def has_cert(self, cert_num: str, detail_only: bool = False) -> bool:
+        """인증번호가 저장되어 있는지 확인합니다."""
+        sql = "SELECT 1 FROM certificates WHERE cert_num = ?"
+        if detail_only:
+            sql += " AND has_detail = 1"
+        return self.conn.execute(sql, (cert_num,)).fetchone() is not None
+
+    def get(self, cert_num: str) -> Optional[sqlite3.Row]:
+        """인증번호로 최신 레코드를 조회합니다."""
+        return self.conn.execute("SELECT * FROM certificates WHERE cert_num = ?", (cert_num,)).fetchone()
+
+    def cert_numbers(self, detail_only: bool = False) -> set:
+        """저장된 인증번호 집합을 소문자로 반환합니다."""
+        sql = "SELECT cert_num FROM certificates"
+        if detail_only:
+            sql += " WHERE has_detail = 1"
+        return {row[0].lower() for row in self.conn.execute(sql)}
+
+    def find_by_maker(self, maker_name: str) -> List[sqlite3.Row]:
+        """제조사명(대소문자 무시)으로 인증 목록을 조회합니다."""
+        return self.conn.execute(
+            "SELECT * FROM certificates WHERE maker_name = ? COLLATE NOCASE ORDER BY change_date DESC",
+            (maker_name,),
+        ).fetchall()
+
+    def factories(self, cert_num: str) -> List[sqlite3.Row]:
+        """인증번호의 제조공장 목록을 조회합니다."""
+        return self.conn.execute(
+            "SELECT seq, factory_name, country FROM factories WHERE cert_num = ? ORDER BY seq", (cert_num,)
+        ).fetchall()
+
+    def related_certs(self, cert_num: str) -> List[sqlite3.Row]:
+        """인증번호의 연관 인증 번호 목록을 조회합니다."""
+        return self.conn.execute(
+            "SELECT related_num, related_state FROM related_certs WHERE cert_num = ?", (cert_num,)
+        ).fetchall()
+
+    def iter_details(self) -> Iterator[Dict]:
+        """상세 페이지 원본 레코드(최신 버전)를 크롤러 출력 형식으로 순회합니다."""
+        for (detail_json,) in self.conn.execute(
+            "SELECT detail_json FROM certificates WHERE detail_json IS NOT NULL ORDER BY cert_num"
+        ):
+            yield json.loads(detail_json)
+
+    def iter_api_records(self) -> Iterator[Dict]:
+        """Open API 원본 레코드(최신 버전)를 순회합니다."""
+        for (api_json,) in self.conn.execute(
+            "SELECT api_json FROM certificates WHERE api_json IS NOT NULL ORDER BY cert_num"
+        ):
+            yield json.loads(api_json)
+
+    def get_fingerprint(self, cert_num: str) -> Optional[sqlite3.Row]:
+        """마지막으로 수집한 상세 데이터의 상태 지문을 조회합니다."""
+        return self.conn.execute("SELECT * FROM fingerprints WHERE cert_num = ?", (cert_num,)).fetchone()
+
+    def record_list_summaries(self, summaries: List[Dict]) -> List[tuple]:
+        """목록 페이지 요약 정보를 저장하고, 상세 수집이 필요한 (인증번호, 사유) 목록을 반환합니다.
+
+        상세 데이터가 없는 새 인증번호와, 저장된 상세 데이터의 지문과 비교해
+        인증상태/인증변경일자가 바뀐 인증번호만 큐에 넣습니다.
+        """
+        queued = []
+        now = _now()
+        with self._lock, self.conn:
+            for summary in summaries:
+                cert_num = (summary.get("인증번호") or "").strip()
+                if not cert_num:
+                    continue
+                detail_link = summary.get("detail_link")
+                fields = {key: value for key, value in summary.items() if key != "detail_link"}
+                new_hash = summary_hash(fields)
+
+                _, reason = self.detector.reason_for(fields, include_new=True)
+
+                self.conn.execute(
+                    """
+                    INSERT INTO list_summaries (cert_num, summary_json, summary_hash, detail_link, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (cert_num) DO UPDATE SET
+                        summary_json = excluded.summary_json,
+                        summary_hash = excluded.summary_hash,
+                        detail_link = COALESCE(excluded.detail_link, detail_link),
+                        last_seen = excluded.last_seen
+                    """,
+                    (cert_num, json.dumps(fields, ensure_ascii=False), new_hash, detail_link, now, now),
+                )
+                if reason:
+                    self._enqueue_detail(cert_num, reason, detail_link, now)
+                    queued.append((cert_num, reason))
+        return queued
+
+    def _enqueue_detail(self, cert_num: str, reason: str, detail_link: Optional[str], now: str):
+        self.conn.execute(
+            """
+            INSERT INTO detail_queue (cert_num, reason, detail_link, enqueued_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT (cert_num) DO UPDATE SET
+                reason = excluded.reason,
+                detail_link = COALESCE(excluded.detail_link, detail_link)
+            """,
+            (cert_num, reason, detail_link, now),
+        )
+
+    def enqueue_details(self, planned: List[tuple], detail_link: Optional[str] = None):
+        """(인증번호, 사유) 목록을 상세 수집 대기열에 넣습니다."""
+        now = _now()
+        with self._lock, self.conn:
+            for cert_num, reason in planned:
+                self._enqueue_detail(cert_num, reason, detail_link, now)
+
+    def enqueue_frontier(self, planned: List[tuple]) -> int:
+        """(인증번호, 사유, 우선순위, 상세 링크) 목록을 대기열에 넣고 새로 추가된 건수를 반환합니다.
+
+        이미 상세 데이터가 있는 인증번호는 건너뜁니다. 이미 대기열에 있으면 사유는 그대로 두고
+        우선순위만 더 높은 값으로 올립니다.
+        """
+        now = _now()
+        added = 0
+        with self._lock, self.conn:
+            for cert_num, reason, priority, detail_link in planned:
+                if self.conn.execute(
+                    "SELECT 1 FROM certificates WHERE cert_num = ? AND has_detail = 1", (cert_num,)
+                ).fetchone():
+                    continue
+                if self.conn.execute("SELECT 1 FROM detail_queue WHERE cert_num = ?", (cert_num,)).fetchone() is None:
+                    added += 1
+                self.conn.execute(
+                    """
+                    INSERT INTO detail_queue (cert_num, reason, detail_link, enqueued_at, priority)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (cert_num) DO UPDATE SET
+                        priority = MAX(priority, excluded.priority),
+                        detail_link = COALESCE(detail_link, excluded.detail_link)
+                    WHERE excluded.priority > priority OR detail_link IS NULL
+                    """,
+                    (cert_num, reason, detail_link, now, priority),
+                )
+        return added
+
+    def claim_queue(self, worker: str, limit: int = 10) -> List[sqlite3.Row]:
+        """우선순위가 높은 대기열 항목을 limit 건 가져오고 worker 가 수집 중인 것으로 표시합니다.
+
+        수집 중으로 표시된 항목(자신이 표시한 것 포함)은 CLAIM_TIMEOUT 이 지나기 전까지 다시 가져오지 않으므로,
+        수집에 실패한 항목을 같은 실행에서 곧바로 반복하지 않습니다.
+        """
+        now = datetime.now()
+        stale = datetime.fromtimestamp(now.timestamp() - CLAIM_TIMEOUT).isoformat(timespec="seconds")
+        with self._lock:
+            # 여러 프로세스가 같은 항목을 가져가지 않도록 쓰기 잠금을 먼저 잡음
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.conn.execute(
+                    """
+                    SELECT cert_num, reason, detail_link, enqueued_at, priority FROM detail_queue
+                    WHERE claimed_by IS NULL OR claimed_at < ?
+                    ORDER BY priority DESC, enqueued_at, cert_num LIMIT ?
+                    """,
+                    (stale, limit),
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE detail_queue SET claimed_by = ?, claimed_at = ? WHERE cert_num = ?",
+                    [(worker, now.isoformat(timespec="seconds"), row["cert_num"]) for row in rows],
+                )
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+        return rows
+
+    def release_claims(self, worker: str):
+        """worker 가 수집 중으로 표시한 대기열 항목을 다른 워커가 가져갈 수 있도록 풀어줍니다."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE detail_queue SET claimed_by = NULL, claimed_at = NULL WHERE claimed_by = ?", (worker,)
+            )
+
+    def is_queued(self, cert_num: str) -> bool:
+        """인증번호가 상세 수집 대기열에 있는지 확인합니다."""
+        return self.conn.execute("SELECT 1 FROM detail_queue WHERE cert_num = ?", (cert_num,)).fetchone() is not None
+
+    def iter_list_summaries(self) -> Iterator[Dict]:
+        """저장된 목록 요약 정보를 순회합니다."""
+        for summary_json, cert_num in self.conn.execute("SELECT summary_json, cert_num FROM list_summaries"):
+            summary = json.loads(summary_json)
+            summary.setdefault("인증번호", cert_num)
+            yield summary
+
+    def seen_since(self, cert_nums: List[str], since: str) -> bool:
+        """모든 인증번호의 목록 요약이 since 이후에 갱신되었는지 확인합니다."""
+        if not cert_nums:
+            return False
+        placeholders = ",".join("?" for _ in cert_nums)
+        (count,) = self.conn.execute(
+            f"SELECT COUNT(*) FROM list_summaries WHERE last_seen >= ? AND cert_num IN ({placeholders})",
+            (since, *cert_nums),
+        ).fetchone()
+        return count == len(set(num.lower() for num in cert_nums))
+
+    def detail_queue(self, limit: Optional[int] = None) -> List[sqlite3.Row]:
+        """상세 수집 대기열을 우선순위가 높은 것부터, 같으면 먼저 들어온 순서로 조회합니다."""
+        sql = (
+            "SELECT cert_num, reason, detail_link, enqueued_at, priority FROM detail_queue "
+            "ORDER BY priority DESC, enqueued_at, cert_num"
+        )
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.conn.execute(sql).fetchall()
+
+    def dequeue_detail(self, cert_num: str):
+        """상세 데이터를 수집한 인증번호를 대기열에서 제거합니다."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM detail_queue WHERE cert_num = ?", (cert_num,))
+
+    def count(self) -> Dict[str, int]:
+        """저장된 레코드 수를 집계합니다."""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(has_detail), 0), COALESCE(SUM(has_api), 0) FROM certificates"
+        ).fetchone()
+        (summaries,) = self.conn.execute("SELECT COUNT(*) FROM list_summaries").fetchone()
+        return {"total": row[0], "detail": row[1], "api": row[2], "summaries": summaries}
+
+
+def _import_file(store: CertStore, file_path: str):
+    total = accepted = 0
+    for chunk in iter_chunks(iter_json_records(file_path), IMPORT_CHUNK_ROWS):
+        details = [item for item in chunk if "인증정보" in item]
+        api_records = [item for item in chunk if "certNum" in item]
+        accepted += store.upsert_details(details) + store.upsert_api_records(api_records)
+        total += len(chunk)
+    print(f"{file_path}: {total}건 중 {accepted}건 저장")
+
+
+def import_files(store: CertStore, patterns: List[str]):
+    """기존 JSON/JSONL/.kcz 파일(크롤러 출력 또는 Open API 결과)을 DB로 가져옵니다.
+
+    파일 전체를 메모리에 올리지 않고 IMPORT_CHUNK_ROWS 건씩 읽어서 저장합니다.
+    certifications_all_years.json 처럼 {연도: [레코드]} 형식인 파일이나 PackSink 가 쓴 압축 블록 파일(.kcz)도
+    iter_json_records 가 레코드 단위로 읽습니다. .kcz 파일 옆에 블록에 들어가지 못한 저널 파일이 남아 있으면
+    (크롤러가 중단된 경우) 저널의 레코드도 함께 가져옵니다.
+    """
+    paths = set()
+    for pattern in patterns:
+        for file_path in glob.glob(pattern):
+            paths.add(file_path)
+            if file_path.endswith(PACK_SUFFIX) and os.path.exists(file_path + JOURNAL_SUFFIX):
+                paths.add(file_path + JOURNAL_SUFFIX)
+    for file_path in sorted(paths):
+        _import_file(store, file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KC 인증 데이터 저장소 관리")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"DB 파일 경로 (기본값: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="JSON/JSONL/.kcz 파일을 DB로 가져옵니다.")
+    import_parser.add_argument("patterns", nargs="+", help="가져올 파일 경로 또는 glob 패턴 (.json, .jsonl, .kcz)")
+
+    subparsers.add_parser("stats", help="저장된 레코드 수를 출력합니다.")
+
+    queue_parser = subparsers.add_parser("queue", help="상세 수집 대기열을 파일로 내보냅니다.")
+    queue_parser.add_argument("--output", type=str, default="detail_queue.txt", help="출력 파일 경로")
+
+    checkpoint_parser = subparsers.add_parser("checkpoints", help="크롤러 체크포인트를 출력합니다.")
+    checkpoint_parser.add_argument("--reset", action="store_true", help="모든 체크포인트를 삭제합니다.")
+
+    args = parser.parse_args()
+
+    with CertStore(args.db) as store:
+        if args.command == "import":
+            import_files(store, args.patterns)
+        elif args.command == "queue":
+            queue = store.detail_queue()
+            with open(args.output, "w", encoding="utf-8") as f:
+                for row in queue:
+                    f.write(f"{row['cert_num']}\t{row['reason']}\t{row['detail_link'] or ''}\n")
+            print(f"상세 수집 대기열 {len(queue)}건 저장: {args.output}")
+        elif args.command == "checkpoints":
+            for row in store.conn.execute("SELECT * FROM crawl_checkpoints ORDER BY worker").fetchall():
+                print(
+                    f"{row['worker']}: page {row['page']}, 커밋 {row['committed']}건, "
+                    f"수집 중: {row['in_flight'] or '-'} ({row['updated_at']})"
+                )
+                if args.reset:
+                    store.clear_checkpoint(row["worker"])
+        counts = store.count()
+        print(f"* 전체 인증 수: {counts['total']}개 (상세: {counts['detail']}개, API: {counts['api']}개)")
+
+
+if __name__ == "__main__":
+    main()
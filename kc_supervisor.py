@@ -0,0 +1,307 @@
+"""크롤러 워커 감독(supervisor)
+
+- 워커는 진행할 때마다 하트비트(마지막 진행 시각, 수집 건수, 브라우저 PID)를 DB의 worker_heartbeats 에 기록합니다.
+  SQLite 로 공유하므로 쓰레드/프로세스/asyncio 실행기 모두에서 동작합니다.
+- Watchdog 는 메인 프로세스에서 하트비트를 확인하고, STALL_TIMEOUT 동안 진행이 없는 워커의 브라우저
+  (chromedriver 와 그 하위 Chrome 프로세스)를 종료합니다. 멈춰 있던 WebDriver 호출이 오류로 끝나면서 워커가 종료됩니다.
+- run_with_restarts 는 워커 안에서 크롤러를 실행하고, 끝까지 수집하지 못하고 종료되면(브라우저 창 닫힘,
+  복구 실패, 브라우저 강제 종료 등) 지수 백오프 후 다시 실행합니다. 크롤러는 DB 체크포인트에서 이어서 수집합니다.
+
+사용 예:
+    python kc_supervisor.py --db data/certificates.db status
+"""
+
+import argparse
+import logging
+import os
+import random
+import signal
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from crawl_metrics import REGISTRY
+from kc_store import DEFAULT_DB_PATH
+from log_pipeline import LOGGER_NAME, get_worker_logger
+
+try:
+    import psutil
+except ImportError:  # psutil 이 없으면 /proc 에서 하위 프로세스를 찾음 (Linux)
+    psutil = None
+
+# 하트비트는 이 간격(초)보다 자주 기록하지 않음
+HEARTBEAT_INTERVAL = 10
+# 이 시간(초) 동안 하트비트가 없으면 멈춘 것으로 보고 브라우저를 종료 (스마트 대기 최대 타임아웃 30초의 여러 배)
+STALL_TIMEOUT = 5 * 60
+WATCHDOG_INTERVAL = 30
+
+# 재시작 대기: BACKOFF_BASE * 2^(연속 재시작 횟수 - 1) 초, 최대 BACKOFF_MAX 초
+BACKOFF_BASE = 5
+BACKOFF_MAX = 10 * 60
+# 이 시간(초) 이상 실행된 뒤 종료되면 연속 재시작 횟수를 초기화
+BACKOFF_RESET = 10 * 60
+# 연속 재시작 횟수가 이보다 많으면 워커를 포기
+MAX_RESTARTS = 10
+
+WORKER_RESTARTS_TOTAL = REGISTRY.counter("kc_worker_restarts_total", "Worker restarts by the supervisor.")
+WORKER_STALLS_TOTAL = REGISTRY.counter("kc_worker_stalls_total", "Stalled workers whose browser was killed.")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS worker_heartbeats (
+    run_id          TEXT NOT NULL,
+    worker          INTEGER NOT NULL,
+    state           TEXT NOT NULL,      -- running, backoff, finished, interrupted, failed
+    progress        INTEGER NOT NULL DEFAULT 0,  -- 이번 실행(재시작 후)에서 수집한 건수
+    pid             INTEGER,
+    browser_pid     INTEGER,
+    restarts        INTEGER NOT NULL DEFAULT 0,
+    started_at      REAL,
+    beat_at         REAL NOT NULL,
+    PRIMARY KEY (run_id, worker)
+);
+"""
+
+logger = logging.getLogger(f"{LOGGER_NAME}.supervisor")
+
+
+class HeartbeatBoard:
+    """워커 하트비트를 SQLite 에 기록하고 조회합니다. 프로세스/쓰레드마다 따로 만들어서 사용합니다."""
+
+    def __init__(self, db_path: str, run_id: Optional[str] = None):
+        self.run_id = run_id
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def update(self, worker: int, **fields):
+        """워커 행의 필드를 갱신하고 beat_at 을 현재 시각으로 기록합니다. 행이 없으면 만듭니다."""
+        updates = ", ".join(f"{column} = excluded.{column}" for column in [*fields, "beat_at"])
+        fields = {"state": "running", **fields, "beat_at": time.time()}
+        columns = ", ".join(fields)
+        placeholders = ", ".join("?" for _ in fields)
+        with self._lock, self.conn:
+            self.conn.execute(
+                f"""
+                INSERT INTO worker_heartbeats (run_id, worker, {columns}) VALUES (?, ?, {placeholders})
+                ON CONFLICT (run_id, worker) DO UPDATE SET {updates}
+                """,
+                (self.run_id, worker, *fields.values()),
+            )
+
+    def workers(self) -> List[sqlite3.Row]:
+        """이 실행(run_id)의 워커 상태를 조회합니다. run_id 가 없으면 마지막 실행의 워커를 조회합니다."""
+        run_id = self.run_id
+        if run_id is None:
+            row = self.conn.execute("SELECT run_id FROM worker_heartbeats ORDER BY beat_at DESC LIMIT 1").fetchone()
+            if row is None:
+                return []
+            run_id = row["run_id"]
+        return self.conn.execute(
+            "SELECT * FROM worker_heartbeats WHERE run_id = ? ORDER BY worker", (run_id,)
+        ).fetchall()
+
+    def clear_others(self):
+        """이전 실행의 하트비트를 지웁니다."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM worker_heartbeats WHERE run_id != ?", (self.run_id,))
+
+    def close(self):
+        self.conn.close()
+
+
+class Heartbeat:
+    """크롤러가 진행할 때마다 호출하는 하트비트입니다. HEARTBEAT_INTERVAL 마다 한 번만 DB에 기록합니다."""
+
+    def __init__(self, board: HeartbeatBoard, worker: int):
+        self.board = board
+        self.worker = worker
+        self.last = 0.0
+        self.base = None  # 기존 데이터로 로드한 건수는 진행으로 보지 않음
+        self.progress = 0
+
+    def reset(self):
+        """재시작할 때 호출합니다. 진행 건수를 새로 셉니다."""
+        self.base = None
+        self.progress = 0
+
+    def attach(self, browser_pid: Optional[int]):
+        """새로 시작한 브라우저의 PID 를 기록합니다. (멈췄을 때 Watchdog 가 종료할 대상)"""
+        self.board.update(self.worker, browser_pid=browser_pid)
+        self.last = time.monotonic()
+
+    def __call__(self, progress: int):
+        if self.base is None:
+            self.base = progress
+        self.progress = progress - self.base
+        now = time.monotonic()
+        if now - self.last < HEARTBEAT_INTERVAL:
+            return
+        self.last = now
+        try:
+            self.board.update(self.worker, progress=self.progress)
+        except sqlite3.Error as e:
+            # 하트비트 기록 실패로 수집을 멈추지 않음 (다음 하트비트에서 다시 기록)
+            logger.warning(f"하트비트 기록 실패 (worker {self.worker}): {e}")
+
+
+def _process_tree(pid: int) -> List[int]:
+    """pid 와 그 하위 프로세스 PID 목록을 반환합니다. (하위 프로세스부터)"""
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            return [child.pid for child in parent.children(recursive=True)][::-1] + [pid]
+        except psutil.NoSuchProcess:
+            return []
+
+    children: Dict[int, List[int]] = {}
+    for name in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "r") as f:
+                # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤에서 부모 PID 를 읽음
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree[::-1]
+
+
+def kill_browser(browser_pid: int) -> int:
+    """chromedriver 와 하위 Chrome 프로세스를 강제 종료하고 종료한 프로세스 수를 반환합니다."""
+    killed = 0
+    for pid in _process_tree(browser_pid):
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            killed += 1
+        except OSError:
+            continue
+    return killed
+
+
+class Watchdog(threading.Thread):
+    """STALL_TIMEOUT 동안 하트비트가 없는 워커의 브라우저를 종료하는 감시 쓰레드입니다."""
+
+    def __init__(self, db_path: str, run_id: str, stall_timeout: float = STALL_TIMEOUT, interval=WATCHDOG_INTERVAL):
+        super().__init__(name="watchdog", daemon=True)
+        self.board = HeartbeatBoard(db_path, run_id)
+        self.board.clear_others()
+        self.stall_timeout = stall_timeout
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def check(self):
+        now = time.time()
+        for row in self.board.workers():
+            idle = now - row["beat_at"]
+            if row["state"] != "running" or idle < self.stall_timeout:
+                continue
+            WORKER_STALLS_TOTAL.inc()
+            if row["browser_pid"]:
+                killed = kill_browser(row["browser_pid"])
+                logger.error(
+                    f"워커 {row['worker']}: {idle:.0f}초 동안 진행이 없어 브라우저를 종료합니다. (프로세스 {killed}개)"
+                )
+            else:
+                logger.error(f"워커 {row['worker']}: {idle:.0f}초 동안 진행이 없습니다. (종료할 브라우저 없음)")
+            # 같은 워커를 매번 다시 종료하지 않도록 하트비트 시각을 갱신
+            self.board.update(row["worker"], browser_pid=None)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.check()
+            except sqlite3.Error as e:
+                logger.warning(f"하트비트 확인 실패: {e}")
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.board.close()
+
+
+def backoff_delay(restarts: int) -> float:
+    """연속 재시작 횟수에 따른 대기 시간(초). 여러 워커가 동시에 재시작하지 않도록 ±20% 흔듦"""
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** max(0, restarts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def run_with_restarts(target, spec, options):
+    """target(spec, options) 를 실행하고, "finished" 나 "interrupted" 를 반환하지 않으면 백오프 후 다시 실행합니다."""
+    supervisor = options["supervisor"]
+    worker_logger = get_worker_logger(spec.index)
+    board = HeartbeatBoard(options["db_path"], supervisor["run_id"])
+    heartbeat = Heartbeat(board, spec.index)
+    options = dict(options, heartbeat=heartbeat)
+    restarts = 0
+    try:
+        while True:
+            started = time.time()
+            board.update(
+                spec.index, state="running", pid=os.getpid(), progress=0, restarts=restarts, started_at=started
+            )
+            heartbeat.reset()
+            outcome = target(spec, options)
+            if outcome in ("finished", "interrupted"):
+                board.update(spec.index, state=outcome, browser_pid=None, progress=heartbeat.progress)
+                return outcome
+
+            if time.time() - started >= BACKOFF_RESET:
+                restarts = 0
+            restarts += 1
+            if restarts > supervisor["max_restarts"]:
+                board.update(spec.index, state="failed", browser_pid=None, progress=heartbeat.progress)
+                worker_logger.error(f"연속 {restarts - 1}회 재시작했지만 수집을 마치지 못해 워커를 종료합니다.")
+                return outcome
+
+            delay = backoff_delay(restarts)
+            board.update(spec.index, state="backoff", browser_pid=None, progress=heartbeat.progress, restarts=restarts)
+            WORKER_RESTARTS_TOTAL.inc()
+            worker_logger.warning(
+                f"워커가 중단되었습니다 ({outcome}). {delay:.0f}초 후 체크포인트에서 다시 시작합니다. ({restarts}회째)"
+            )
+            time.sleep(delay)
+    finally:
+        board.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 워커 상태 확인")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="마지막 실행의 워커별 상태, 마지막 진행 후 경과 시간, 수집 속도를 출력합니다.")
+    args = parser.parse_args()
+
+    board = HeartbeatBoard(args.db)
+    try:
+        rows = board.workers()
+        if not rows:
+            print("기록된 워커가 없습니다.")
+            return
+        now = time.time()
+        print(f"* 실행 {rows[0]['run_id']}: 워커 {len(rows)}개")
+        for row in rows:
+            elapsed = max(1.0, row["beat_at"] - (row["started_at"] or row["beat_at"]))
+            rate = row["progress"] / elapsed * 3600
+            print(
+                f"  - 워커 {row['worker']:>2}: {row['state']:<8} 마지막 진행 {now - row['beat_at']:>6.0f}초 전, "
+                f"수집 {row['progress']}건 ({rate:.1f}건/시간), 재시작 {row['restarts']}회"
+            )
+    finally:
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import time
+from collections import deque
+
+from crawl_metrics import REGISTRY
+
+# selenium 은 SmartWait 를 처음 만들 때 import (Selenium 백엔드에서만 사용)
+JavascriptException = StaleElementReferenceException = ScriptTimeoutException = None
+TimeoutException = WebDriverException = WebDriverWait = None
+
+
+def _import_selenium():
+    global JavascriptException, StaleElementReferenceException, ScriptTimeoutException
+    global TimeoutException, WebDriverException, WebDriverWait
+    from selenium.common.exceptions import (
+        JavascriptException,
+        ScriptTimeoutException,
+        StaleElementReferenceException,
+        TimeoutException,
+        WebDriverException,
+    )
+    from selenium.webdriver.support.ui import WebDriverWait
+
+
+WAIT_SECONDS = REGISTRY.histogram("kc_wait_seconds", "Time spent in WebDriverWait, by wait type.")
+WAIT_TIMEOUTS_TOTAL = REGISTRY.counter("kc_wait_timeouts_total", "Smart waits that hit their timeout, by wait type.")
+
+# 조건 확인 간격 (초). WebDriverWait 기본값(0.5초)보다 짧게 확인해 준비되는 즉시 진행
+POLL_INTERVAL = 0.05
+
+# 대기 유형별 최근 소요 시간으로 타임아웃을 정하는 기준
+DEFAULT_TIMEOUT = 10.0  # 측정값이 없을 때 (기존 WebDriverWait 타임아웃)
+MIN_TIMEOUT = 2.0
+MAX_TIMEOUT = 30.0
+TIMEOUT_FACTOR = 4.0  # 최근 p95 소요 시간의 배수
+LATENCY_WINDOW = 50
+
+# 목록 페이지: 로딩 표시가 사라지고 행이 있으면 첫/마지막 행의 인증번호를 목록 식별값으로 반환
+LIST_TOKEN_JS = """
+if (document.readyState !== 'complete') return null;
+var loading = document.getElementById('loading');
+if (loading && loading.offsetParent !== null && getComputedStyle(loading).display !== 'none') return null;
+var rows = document.querySelectorAll('table.tb_list tr[onclick]');
+if (!rows.length) return null;
+var cell = function (row) { var td = row.querySelector('td:last-child'); return td ? td.textContent.trim() : ''; };
+return rows.length + ':' + cell(rows[0]) + ':' + cell(rows[rows.length - 1]);
+"""
+
+# 클릭 전에 현재 문서에 표시를 남겨, 같은 목록이 다시 로드된 경우(표시가 사라짐)도 이동 완료로 판단
+MARK_JS = "window.__kcWaitMark = true;" + LIST_TOKEN_JS
+
+# 목록이 previous 와 다르거나 새 문서로 교체되었으면 목록 식별값, 아니면 null
+LIST_CHANGED_JS = (
+    "var t = (function () {"
+    + LIST_TOKEN_JS
+    + "})(); return t && (t !== arguments[0] || !window.__kcWaitMark) ? t : null;"
+)
+
+# 목록 행이 바뀔 때까지 MutationObserver 로 기다린 뒤 콜백 (페이지 전체 이동이면 스크립트가 중단되어 폴링으로 대체)
+LIST_CHANGE_OBSERVER_JS = (
+    """
+var previous = arguments[0], done = arguments[arguments.length - 1];
+var token = function () {"""
+    + LIST_TOKEN_JS
+    + """};
+var check = function () {
+    var t = token();
+    if (t && (t !== previous || !window.__kcWaitMark)) { observer.disconnect(); done(t); return true; }
+    return false;
+};
+var observer = new MutationObserver(check);
+if (!check()) observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['style', 'class']});
+"""
+)
+
+DETAIL_READY_JS = """
+return document.readyState === 'complete' && document.querySelector('.contents_area') !== null;
+"""
+
+
+class LatencyTracker:
+    """대기 유형별 최근 소요 시간을 기록하고, 이를 바탕으로 타임아웃을 정합니다.
+
+    타임아웃은 최근 소요 시간 p95 의 TIMEOUT_FACTOR 배이며 [MIN_TIMEOUT, MAX_TIMEOUT] 범위로 제한합니다.
+    사이트가 느려지면 타임아웃이 늘어나고, 빨라지면 멈춘 페이지를 빨리 포기합니다.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self.samples = {}
+
+    def observe(self, wait_type, seconds):
+        self.samples.setdefault(wait_type, deque(maxlen=self.window)).append(seconds)
+
+    def timeout(self, wait_type):
+        samples = self.samples.get(wait_type)
+        if not samples or len(samples) < 5:
+            return DEFAULT_TIMEOUT
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, p95 * TIMEOUT_FACTOR))
+
+
+class SmartWait:
+    """페이지 준비 상태를 JS 조건과 DOM 변경(MutationObserver)으로 감지하는 대기 계층입니다.
+
+    고정 sleep 없이 조건이 만족되는 즉시 반환하며, 타임아웃은 LatencyTracker 가 최근 소요 시간으로 정합니다.
+    """
+
+    def __init__(self, driver, tracker=None):
+        _import_selenium()
+        self.driver = driver
+        self.tracker = tracker or LatencyTracker()
+
+    def until(self, wait_type, script, *args, timeout=None, started=None):
+        """script 가 참(truthy) 값을 반환할 때까지 기다리고 그 값을 반환합니다.
+
+        timeout 을 주지 않으면 LatencyTracker 의 타임아웃을 사용합니다.
+        started 를 주면 그 시각부터의 소요 시간을 기록합니다.
+        """
+        if timeout is None:
+            timeout = self.tracker.timeout(wait_type)
+        wait = WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=POLL_INTERVAL,
+            ignored_exceptions=(JavascriptException, StaleElementReferenceException),
+        )
+        if started is None:
+            started = time.perf_counter()
+        try:
+            with WAIT_SECONDS.time(wait_type=wait_type):
+                result = wait.until(lambda driver: driver.execute_script(script, *args))
+        except TimeoutException:
+            WAIT_TIMEOUTS_TOTAL.inc(wait_type=wait_type)
+            raise
+        self.tracker.observe(wait_type, time.perf_counter() - started)
+        return result
+
+    def list_ready(self):
+        """목록 페이지가 준비될 때까지 기다리고 목록 식별값을 반환합니다."""
+        return self.until("list", LIST_TOKEN_JS)
+
+    def mark(self):
+        """페이지 이동을 일으키는 클릭 직전에 호출합니다. 현재 목록 식별값을 반환합니다."""
+        try:
+            return self.driver.execute_script(MARK_JS)
+        except (JavascriptException, StaleElementReferenceException):
+            return None
+
+    def list_changed(self, previous):
+        """목록 행이 previous(mark 의 반환값)와 다른 목록으로 바뀔 때까지 기다리고 새 식별값을 반환합니다.
+
+        같은 문서 안에서 AJAX 로 행이 바뀌면 MutationObserver 콜백으로 즉시 반환하고,
+        페이지 전체가 다시 로드되어 스크립트가 중단되면 남은 시간 동안 JS 조건 폴링으로 이어서 기다립니다.
+        """
+        timeout = self.tracker.timeout("list_change")
+        started = time.perf_counter()
+        try:
+            self.driver.set_script_timeout(timeout)
+            with WAIT_SECONDS.time(wait_type="list_change"):
+                token = self.driver.execute_async_script(LIST_CHANGE_OBSERVER_JS, previous)
+            self.tracker.observe("list_change", time.perf_counter() - started)
+            return token
+        except (TimeoutException, ScriptTimeoutException):
+            WAIT_TIMEOUTS_TOTAL.inc(wait_type="list_change")
+            raise
+        except WebDriverException:
+            pass
+        remaining = timeout - (time.perf_counter() - started)
+        if remaining <= 0:
+            WAIT_TIMEOUTS_TOTAL.inc(wait_type="list_change")
+            raise TimeoutException(f"목록이 {timeout:.1f}초 안에 바뀌지 않았습니다.")
+        return self.until("list_change", LIST_CHANGED_JS, previous, timeout=remaining, started=started)
+
+    def detail_ready(self):
+        """상세 페이지가 준비될 때까지 기다립니다."""
+        return self.until("detail", DETAIL_READY_JS)
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import queue as queue_module
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOGGER_NAME = "kc"
+LOG_DIR = "logs"
+
+# 대량으로 발생하는 로그 메시지와 샘플링 비율 (N건 중 1건만 기록)
+SAMPLED_PREFIXES = {
+    "Skip existing cert number": 100,
+}
+
+# JSON 로그에 포함할 구조화 필드
+CONTEXT_FIELDS = ("worker", "page", "cert_num")
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 변환합니다."""
+
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if getattr(record, "sampled", None):
+            payload["sampled"] = record.sampled
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """콘솔 출력용 포맷터입니다. 워커/인증번호 정보를 메시지 앞에 붙입니다."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record):
+        text = super().format(record)
+        cert_num = getattr(record, "cert_num", None)
+        if cert_num:
+            text += f" [cert={cert_num}]"
+        return text
+
+
+class SamplingFilter(logging.Filter):
+    """지정된 접두어로 시작하는 메시지는 N건 중 1건만 통과시킵니다."""
+
+    def __init__(self, rates=None):
+        super().__init__()
+        self.rates = dict(SAMPLED_PREFIXES if rates is None else rates)
+        self._counts = {prefix: 0 for prefix in self.rates}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        message = record.msg if isinstance(record.msg, str) else str(record.msg)
+        for prefix, rate in self.rates.items():
+            if message.startswith(prefix):
+                with self._lock:
+                    self._counts[prefix] += 1
+                    count = self._counts[prefix]
+                if count % rate != 1 and rate > 1:
+                    return False
+                # 통과한 레코드에 샘플링 비율을 남겨 집계 시 보정할 수 있도록 함
+                record.sampled = rate
+                return True
+        return True
+
+
+class WorkerLogger(logging.LoggerAdapter):
+    """워커 ID 등 컨텍스트 필드를 모든 레코드에 붙여주는 어댑터입니다."""
+
+    def process(self, msg, kwargs):
+        extra = dict(self.extra)
+        extra.update(kwargs.get("extra") or {})
+        kwargs["extra"] = extra
+        return msg, kwargs
+
+    def bind(self, **fields):
+        """이후의 모든 로그에 포함할 컨텍스트 필드를 갱신합니다."""
+        self.extra.update(fields)
+
+
+def _build_handlers(log_dir, console):
+    os.makedirs(log_dir, exist_ok=True)
+    current_date = datetime.now().strftime("%y%m%d")
+
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, f"{current_date}.jsonl"),
+        maxBytes=50 * 1024 * 1024,  # 50MB
+        backupCount=5,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [file_handler]
+
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(ConsoleFormatter())
+        handlers.append(stream_handler)
+    return handlers
+
+
+def start_logging(log_dir=LOG_DIR, console=True, log_queue=None, level=logging.INFO):
+    """로그 기록 전용 쓰레드(QueueListener)를 시작합니다.
+
+    멀티프로세스 환경에서는 multiprocessing.Queue를 log_queue로 넘기고,
+    자식 프로세스에서 configure_worker(log_queue)를 호출합니다.
+    """
+    if log_queue is None:
+        log_queue = queue_module.SimpleQueue()
+    listener = QueueListener(log_queue, *_build_handlers(log_dir, console), respect_handler_level=True)
+    listener.start()
+    configure_worker(log_queue, level)
+    return log_queue, listener
+
+
+def configure_worker(log_queue, level=logging.INFO):
+    """현재 프로세스의 크롤러 로그가 큐로 전달되도록 설정합니다."""
+    logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    handler = QueueHandler(log_queue)
+    handler.addFilter(SamplingFilter())
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def stop_logging(listener):
+    """큐에 남은 로그를 모두 기록한 후 로그 쓰레드를 종료합니다."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def get_worker_logger(index, **fields) -> WorkerLogger:
+    """워커별 로거를 반환합니다. 모든 레코드에 worker 필드가 포함됩니다."""
+    logger = logging.getLogger(f"{LOGGER_NAME}.worker_{index}")
+    return WorkerLogger(logger, {"worker": index, **fields})
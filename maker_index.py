@@ -0,0 +1,451 @@
+"""제조사/제조공장 검색 인덱스
+
+인증 DB 의 제조사명(makerName), 제조공장명, 인증번호, 모델명, 제조지역을 정규화해서 토큰/트라이그램 역색인 파일을 만들고
+정확(exact), 접두어(prefix), 유사(fuzzy) 검색을 제공합니다.
+
+- 인덱스 파일은 mmap 으로 열기 때문에 시작할 때 파일 전체를 읽지 않고, 검색에 필요한 용어와 문서만 읽습니다.
+- build 는 이전 인덱스를 만든 뒤 갱신된(updated_at) 인증만 DB 에서 다시 읽어 문서를 교체하고 인덱스 파일을 새로 씁니다.
+  kc_crawl.py / fetch_kc_cert.py 의 --index 옵션을 주면 수집이 끝난 뒤 자동으로 갱신합니다.
+
+인덱스 파일 구조 (little-endian):
+    헤더 | 문서 오프셋(u64) | 문서(JSON) | 용어 오프셋(u64) | 용어(정렬된 UTF-8) | 포스팅 오프셋(u64) | 포스팅(u32 문서 번호)
+    | 문서별 인증변경일자(u32 YYYYMMDD, 결과 정렬용)
+
+사용 예:
+    python maker_index.py build
+    python maker_index.py search "shenzhen abc electronics" --field factory --mode fuzzy
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from kc_store import CertStore, DEFAULT_DB_PATH
+from normalizers import REGIONS, map_region, normalize_company_name
+
+DEFAULT_INDEX_PATH = os.path.join("data", "maker_index.bin")
+
+MAGIC = b"KCMIDX01"
+# 매직, 문서 수, 용어 수, 워터마크(updated_at), 섹션 오프셋 7개
+HEADER = struct.Struct("<8sII32s7Q")
+
+# 검색 필드 -> 용어 접두어
+FIELDS = {"maker": "m", "factory": "f", "cert": "c", "model": "o", "region": "r"}
+# 오타/표기 차이가 많은 필드만 트라이그램을 색인
+TRIGRAM_FIELDS = ("maker", "factory", "model")
+COMPANY_FIELDS = ("maker", "factory")
+
+# 용어 종류: 정규화한 값 전체, 단어, 트라이그램
+EXACT, TOKEN, TRIGRAM = "e", "t", "g"
+
+MODES = ("auto", "exact", "prefix", "fuzzy")
+# 유사 검색에서 결과로 내보내는 최소 트라이그램 자카드 유사도
+FUZZY_THRESHOLD = 0.3
+# 유사 검색에서 공유 트라이그램이 많은 순서로 이 수만큼의 후보만 유사도 계산
+FUZZY_CANDIDATES = 500
+
+
+def normalize(field: str, value: Optional[str]) -> str:
+    """필드 값을 색인/검색용으로 정규화합니다. 질의와 문서에 같은 규칙을 적용합니다."""
+    if not value:
+        return ""
+    value = value.upper()
+    if field in COMPANY_FIELDS:
+        # json2csv.clean_factory_name 처럼 마침표/쉼표를 먼저 정리해야 'CO., LTD.' 가 법인 형태로 제거됨
+        value = normalize_company_name(" ".join(value.replace(".", "").replace(",", " ").split()))
+    elif field == "region":
+        # 영문 지역명으로 검색해도 색인된 한글 지역명과 일치하도록 변환
+        value = REGIONS.get(value.strip(), value)
+    return " ".join(re.sub(r"[^\w&]+", " ", value).split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """단어별로 앞뒤에 공백을 붙여 만든 트라이그램 집합"""
+    grams = set()
+    for word in text.split():
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """트라이그램 자카드 유사도"""
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def _term(field: str, kind: str, value: str) -> bytes:
+    return f"{FIELDS[field]}{kind}:{value}".encode("utf-8")
+
+
+def field_values(doc: Dict, field: str) -> List[str]:
+    """문서에서 필드 원본 값 목록을 꺼냅니다."""
+    if field == "maker":
+        return [doc["maker_name"]] if doc.get("maker_name") else []
+    if field == "factory":
+        return [factory["name"] for factory in doc.get("factories", []) if factory.get("name")]
+    if field == "cert":
+        return [doc["cert_num"]]
+    if field == "model":
+        return [doc["model_name"]] if doc.get("model_name") else []
+    return list(doc.get("regions", []))
+
+
+def doc_terms(doc: Dict) -> Set[bytes]:
+    """문서를 색인할 용어 집합"""
+    terms = set()
+    for field in FIELDS:
+        for value in field_values(doc, field):
+            value = normalize(field, value)
+            if not value:
+                continue
+            terms.add(_term(field, EXACT, value))
+            terms.update(_term(field, TOKEN, word) for word in value.split())
+            if field in TRIGRAM_FIELDS:
+                terms.update(_term(field, TRIGRAM, gram) for gram in trigrams(value))
+    return terms
+
+
+def iter_documents(store: CertStore, since: str = "") -> Iterator[Dict]:
+    """updated_at 이 since 이후인 인증을 검색 문서로 변환합니다."""
+    rows = store.conn.execute(
+        "SELECT cert_num, maker_name, model_name, product_name, cert_state, change_date, updated_at "
+        "FROM certificates WHERE updated_at >= ? ORDER BY cert_num",
+        (since,),
+    ).fetchall()
+    for row in rows:
+        factories = [
+            {"name": factory["factory_name"] or "", "country": factory["country"] or ""}
+            for factory in store.factories(row["cert_num"])
+        ]
+        names = [row["maker_name"] or ""] + [factory["name"] for factory in factories]
+        regions = sorted({region for region in map(map_region, (name.upper() for name in names)) if region})
+        yield {
+            "cert_num": row["cert_num"],
+            "maker_name": row["maker_name"] or "",
+            "factories": factories,
+            "model_name": row["model_name"] or "",
+            "product_name": row["product_name"] or "",
+            "cert_state": row["cert_state"] or "",
+            "change_date": row["change_date"] or "",
+            "regions": regions,
+            "updated_at": row["updated_at"],
+        }
+
+
+def _pad(f, position: int) -> int:
+    """u64 배열이 8바이트 경계에서 시작하도록 0으로 채웁니다."""
+    padding = -position % 8
+    f.write(b"\0" * padding)
+    return position + padding
+
+
+def _u64(values: Iterable[int]) -> bytes:
+    data = array("Q", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_index(path: str, docs: List[Dict], watermark: str):
+    """문서 목록(인증번호 순)으로 인덱스 파일을 만듭니다. 임시 파일에 쓴 뒤 교체하므로 검색 중인 프로세스에 영향이 없습니다."""
+    postings: Dict[bytes, array] = defaultdict(lambda: array("I"))
+    doc_blobs = []
+    for doc_id, doc in enumerate(docs):
+        doc_blobs.append(json.dumps(doc, ensure_ascii=False).encode("utf-8"))
+        for term in doc_terms(doc):
+            postings[term].append(doc_id)
+    terms = sorted(postings)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * HEADER.size)
+        position = HEADER.size
+        offsets = []
+
+        for blobs in (doc_blobs, terms):
+            position = _pad(f, position)
+            offsets.append(position)
+            bounds = [0]
+            for blob in blobs:
+                bounds.append(bounds[-1] + len(blob))
+            f.write(_u64(bounds))
+            position += 8 * len(bounds)
+            offsets.append(position)
+            for blob in blobs:
+                f.write(blob)
+            position += bounds[-1]
+
+        position = _pad(f, position)
+        offsets.append(position)
+        bounds = [0]
+        for term in terms:
+            bounds.append(bounds[-1] + len(postings[term]))
+        f.write(_u64(bounds))
+        position += 8 * len(bounds)
+        offsets.append(position)
+        for term in terms:
+            data = postings[term]
+            if sys.byteorder != "little":
+                data.byteswap()
+            f.write(data.tobytes())
+        position += 4 * bounds[-1]
+
+        offsets.append(position)
+        dates = array("I", (int(doc["change_date"]) if doc["change_date"].isdigit() else 0 for doc in docs))
+        if sys.byteorder != "little":
+            dates.byteswap()
+        f.write(dates.tobytes())
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(docs), len(terms), watermark.encode("ascii"), *offsets))
+    os.replace(tmp_path, path)
+
+
+class MakerIndex:
+    """mmap 으로 연 검색 인덱스입니다.
+
+    search() 는 문서 dict 에 score(유사도, 정확/접두어 일치는 1.0)와 fields(일치한 필드)를 붙여 반환합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.doc_count, self.term_count, watermark, *sections = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"검색 인덱스 파일이 아닙니다: {path}")
+        if sys.byteorder != "little":
+            self._mm.close()
+            raise ValueError("little-endian 시스템에서만 인덱스를 열 수 있습니다.")
+        self.watermark = watermark.rstrip(b"\0").decode("ascii")
+        view = memoryview(self._mm)
+        doc_offsets, self._doc_base, term_offsets, self._term_base, posting_offsets, posting_base, dates = sections
+        self._doc_offsets = view[doc_offsets : doc_offsets + 8 * (self.doc_count + 1)].cast("Q")
+        self._term_offsets = view[term_offsets : term_offsets + 8 * (self.term_count + 1)].cast("Q")
+        self._posting_offsets = view[posting_offsets : posting_offsets + 8 * (self.term_count + 1)].cast("Q")
+        self._postings = view[posting_base : posting_base + 4 * self._posting_offsets[-1]].cast("I")
+        self._dates = view[dates : dates + 4 * self.doc_count].cast("I")
+
+    def close(self):
+        # mmap 을 닫기 전에 memoryview 를 먼저 해제해야 함
+        for name in ("_doc_offsets", "_term_offsets", "_posting_offsets", "_postings", "_dates"):
+            getattr(self, name).release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def doc(self, doc_id: int) -> Dict:
+        start = self._doc_base + self._doc_offsets[doc_id]
+        return json.loads(self._mm[start : self._doc_base + self._doc_offsets[doc_id + 1]])
+
+    def iter_docs(self) -> Iterator[Dict]:
+        for doc_id in range(self.doc_count):
+            yield self.doc(doc_id)
+
+    def _key(self, i: int) -> bytes:
+        return self._mm[self._term_base + self._term_offsets[i] : self._term_base + self._term_offsets[i + 1]]
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _posting(self, i: int) -> memoryview:
+        return self._postings[self._posting_offsets[i] : self._posting_offsets[i + 1]]
+
+    def _lookup(self, key: bytes) -> memoryview:
+        i = self._lower_bound(key)
+        if i < self.term_count and self._key(i) == key:
+            return self._posting(i)
+        return self._postings[0:0]
+
+    def _prefixed(self, prefix: bytes) -> Set[int]:
+        """prefix 로 시작하는 모든 용어의 문서 번호"""
+        docs = set()
+        i = self._lower_bound(prefix)
+        while i < self.term_count and self._key(i).startswith(prefix):
+            docs.update(self._posting(i))
+            i += 1
+        return docs
+
+    def exact(self, field: str, query: str) -> Set[int]:
+        """정규화한 값 전체가 같은 문서"""
+        value = normalize(field, query)
+        return set(self._lookup(_term(field, EXACT, value))) if value else set()
+
+    def prefix(self, field: str, query: str) -> Set[int]:
+        """질의의 모든 단어가 어떤 단어의 접두어인 문서 ('shenzhen abc' -> 'SHENZHEN ABCD ELECTRONICS')"""
+        docs = None
+        for word in normalize(field, query).split():
+            matched = self._prefixed(_term(field, TOKEN, word))
+            docs = matched if docs is None else docs & matched
+            if not docs:
+                break
+        return docs or set()
+
+    def fuzzy(self, field: str, query: str, threshold: float = FUZZY_THRESHOLD) -> Dict[int, float]:
+        """트라이그램 자카드 유사도가 threshold 이상인 문서와 유사도"""
+        if field not in TRIGRAM_FIELDS:
+            return {}
+        grams = trigrams(normalize(field, query))
+        if not grams:
+            return {}
+        hits = Counter()
+        for gram in grams:
+            hits.update(self._lookup(_term(field, TRIGRAM, gram)))
+        # 자카드 유사도는 (공유 트라이그램 수 / 질의 트라이그램 수)를 넘을 수 없으므로 그보다 적게 공유하면 제외
+        min_hits = math.ceil(len(grams) * threshold)
+        scores = {}
+        for doc_id, count in hits.most_common(FUZZY_CANDIDATES):
+            if count < min_hits:
+                break
+            values = field_values(self.doc(doc_id), field)
+            score = max((similarity(grams, trigrams(normalize(field, value))) for value in values), default=0.0)
+            if score >= threshold:
+                scores[doc_id] = score
+        return scores
+
+    def search(
+        self, query: str, field: Optional[str] = None, mode: str = "auto", limit: Optional[int] = 20
+    ) -> List[Dict]:
+        """query 를 field(None 이면 모든 필드)에서 검색합니다.
+
+        auto 는 정확 -> 접두어 -> 유사 검색 순서로 결과가 나올 때까지 시도합니다.
+        정확/접두어 결과는 인증변경일자 최신순, 유사 검색 결과는 유사도순으로 정렬합니다.
+        """
+        fields = [field] if field else list(FIELDS)
+        modes = ("exact", "prefix", "fuzzy") if mode == "auto" else (mode,)
+        for current in modes:
+            scores: Dict[int, float] = {}
+            matched: Dict[int, List[str]] = defaultdict(list)
+            for name in fields:
+                if current == "fuzzy":
+                    found = self.fuzzy(name, query)
+                else:
+                    found = dict.fromkeys(getattr(self, current)(name, query), 1.0)
+                for doc_id, score in found.items():
+                    scores[doc_id] = max(score, scores.get(doc_id, 0.0))
+                    matched[doc_id].append(name)
+            if scores:
+                break
+        # 문서를 읽기 전에 점수와 인증변경일자로 정렬해서 내보낼 문서만 읽음
+        ranked = sorted(scores, key=lambda doc_id: (scores[doc_id], self._dates[doc_id]), reverse=True)
+        results = []
+        for doc_id in ranked[:limit] if limit else ranked:
+            doc = self.doc(doc_id)
+            doc.update(score=round(scores[doc_id], 3), fields=matched[doc_id], mode=current)
+            results.append(doc)
+        return results
+
+
+def build(db_path: str = DEFAULT_DB_PATH, index_path: str = DEFAULT_INDEX_PATH, full: bool = False) -> Dict:
+    """인덱스를 만들거나 갱신합니다.
+
+    기존 인덱스가 있으면 그 워터마크(가장 최근 updated_at) 이후에 갱신된 인증만 DB 에서 다시 읽습니다.
+    같은 초에 갱신된 인증을 놓치지 않도록 워터마크와 같은 시각의 인증도 다시 읽습니다.
+    """
+    docs: Dict[str, Dict] = {}
+    watermark = ""
+    if not full and os.path.exists(index_path):
+        try:
+            with MakerIndex(index_path) as previous:
+                watermark = previous.watermark
+                docs = {doc["cert_num"].lower(): doc for doc in previous.iter_docs()}
+        except (OSError, ValueError, struct.error) as e:
+            print(f"기존 인덱스를 읽지 못해 전체를 다시 만듭니다: {e}")
+            docs, watermark = {}, ""
+
+    changed = 0
+    latest = watermark
+    with CertStore(db_path) as store:
+        for doc in iter_documents(store, watermark):
+            key = doc["cert_num"].lower()
+            changed += docs.get(key) != doc
+            docs[key] = doc
+            latest = max(latest, doc["updated_at"])
+
+    write_index(index_path, [docs[key] for key in sorted(docs)], latest)
+    return {"docs": len(docs), "changed": changed, "watermark": latest}
+
+
+def update_index(db_path: str, index_path: str, full: bool = False):
+    """검색 인덱스를 갱신하고 결과를 출력합니다. 수집이 끝난 뒤 호출합니다."""
+    started = time.perf_counter()
+    result = build(db_path, index_path, full)
+    elapsed = time.perf_counter() - started
+    print(f"* 검색 인덱스 갱신: 문서 {result['docs']}건 (변경 {result['changed']}건, {elapsed:.1f}초) -> {index_path}")
+
+
+def _print_result(doc: Dict):
+    factories = ", ".join(factory["name"] for factory in doc["factories"])
+    regions = ",".join(doc["regions"]) or "-"
+    print(
+        f"{doc['score']:.3f}  {doc['cert_num']}\t{doc['cert_state']}\t{doc['change_date']}\t"
+        f"{doc['maker_name']}\t{doc['model_name']}\t[{factories}]\t{regions}\t({'/'.join(doc['fields'])})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제조사/제조공장 검색 인덱스")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    parser.add_argument(
+        "--index", type=str, default=DEFAULT_INDEX_PATH, help=f"인덱스 파일 경로 (기본값: {DEFAULT_INDEX_PATH})"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="갱신된 인증만 반영해서 인덱스를 만듭니다.")
+    build_parser.add_argument("--full", action="store_true", help="기존 인덱스를 무시하고 전체를 다시 만듭니다.")
+
+    search_parser = subparsers.add_parser("search", help="인덱스를 검색합니다.")
+    search_parser.add_argument("query", help="검색어 (제조사/제조공장명, 인증번호, 모델명, 지역)")
+    search_parser.add_argument("--field", choices=sorted(FIELDS), default=None, help="검색할 필드 (기본값: 전체)")
+    search_parser.add_argument("--mode", choices=MODES, default="auto", help="검색 방식 (기본값: auto)")
+    search_parser.add_argument("--limit", type=int, default=20, help="출력할 결과 수 (기본값: 20, 0이면 전체)")
+
+    subparsers.add_parser("stats", help="인덱스 정보를 출력합니다.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        update_index(args.db, args.index, args.full)
+        return
+
+    with MakerIndex(args.index) as index:
+        if args.command == "search":
+            started = time.perf_counter()
+            results = index.search(args.query, args.field, args.mode, args.limit)
+            elapsed = (time.perf_counter() - started) * 1000
+            for doc in results:
+                _print_result(doc)
+            mode = results[0]["mode"] if results else args.mode
+            print(f"* {len(results)}건 ({mode}, {elapsed:.1f}ms)")
+        else:
+            size = os.path.getsize(args.index)
+            print(f"* 문서 {index.doc_count}건, 용어 {index.term_count}개, {size / 1024 / 1024:.1f}MB")
+            print(f"* 마지막 갱신: {index.watermark or '-'}")
+
+
+if __name__ == "__main__":
+    main()
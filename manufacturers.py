@@ -0,0 +1,555 @@
+"""제조사 개체 식별(entity resolution) 배치 작업
+
+인증 DB 의 제조사명(Open API makerName)과 제조공장명을 모든 국가에 대해 같은 업체끼리 묶고,
+실행할 때마다 같은 업체에는 같은 ID 가 붙는 제조사 테이블을 만듭니다. 분석에서는 클러스터를 다시 계산하지 않고
+certificate_manufacturers 를 인증번호로 조인해서 manufacturer_id 를 사용합니다.
+
+묶는 기준:
+1. 이름: 제조지역이 같고, 정규화한 이름(maker_index.normalize)에서 지역명을 뺀 부분이 같거나 공백만 다르거나
+   문자 유사도(difflib)가 FUZZY_RATIO 이상인 이름. (노트북의 fuzz.ratio 클러스터링에 해당)
+   국가, 제조지역, 이름 앞 BLOCK_PREFIX 글자가 같은 이름끼리 블록으로 나눠서 프로세스 풀에서 병렬로 처리합니다.
+2. 동시 출현: 같은 인증의 makerName 과 첫 번째 제조공장, 연관 인증 번호로 연결된 인증의 제조사가 같은 국가에서
+   LINK_MIN_COUNT 번 이상 함께 나오고, 이름이 LINK_SIMILARITY 이상 비슷하거나 한글/영문으로 표기가 다른 경우.
+
+클러스터마다 검토가 필요한 경우를 flags 로 기록합니다 (노트북의 케이스 분석 셀에 해당).
+    no_space: 공백만 다른 이름끼리 합침, fuzzy: 유사 이름을 합침, linked: 동시 출현으로 합침,
+    mixed_script: 한글과 영문이 섞인 이름이 있음, cross_script: 한글 이름과 영문 이름이 함께 있음,
+    multi_region: 제조지역이 여러 곳, large: 이름이 LARGE_CLUSTER_NAMES 개 초과, no_country: 국가 정보 없음
+
+ID 는 이전 실행의 이름 -> ID 매핑에서 출현 수 기준으로 가장 많이 겹치는 클러스터가 물려받고,
+합쳐져서 없어진 ID 는 manufacturer_redirects 에 새 ID 를 기록합니다. 새 클러스터는 국가와 정규화 이름의 해시로 ID 를 만듭니다.
+
+사용 예:
+    python manufacturers.py resolve --workers 8 --export manufacturer_v2.json
+    python manufacturers.py show M1A2B3C4D5E
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from kc_store import CertStore, DEFAULT_DB_PATH
+from maker_index import normalize, similarity, trigrams
+from normalizers import REGIONS, map_region
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS manufacturers (
+    manufacturer_id TEXT PRIMARY KEY,
+    country         TEXT NOT NULL,
+    name            TEXT NOT NULL,
+    normalized_name TEXT NOT NULL,
+    region          TEXT,
+    names_json      TEXT NOT NULL,
+    name_count      INTEGER NOT NULL,
+    cert_count      INTEGER NOT NULL,
+    flags           TEXT NOT NULL DEFAULT '',
+    updated_at      TEXT NOT NULL
+);
+
+-- (국가, 원본 이름) -> 제조사 ID (다음 실행에서 ID 를 물려줄 때 사용)
+CREATE TABLE IF NOT EXISTS manufacturer_names (
+    country         TEXT NOT NULL,
+    name            TEXT NOT NULL,
+    manufacturer_id TEXT NOT NULL,
+    PRIMARY KEY (country, name)
+);
+CREATE INDEX IF NOT EXISTS idx_manufacturer_names_id ON manufacturer_names (manufacturer_id);
+
+-- 인증별 제조사 (role: maker 는 Open API makerName, factory 는 상세 페이지 제조공장 seq 번째)
+CREATE TABLE IF NOT EXISTS certificate_manufacturers (
+    cert_num        TEXT NOT NULL COLLATE NOCASE,
+    role            TEXT NOT NULL,
+    seq             INTEGER NOT NULL,
+    manufacturer_id TEXT NOT NULL,
+    PRIMARY KEY (cert_num, role, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_certificate_manufacturers_id ON certificate_manufacturers (manufacturer_id);
+
+-- 다른 클러스터에 합쳐져서 없어진 ID -> 현재 ID
+CREATE TABLE IF NOT EXISTS manufacturer_redirects (
+    old_id          TEXT PRIMARY KEY,
+    manufacturer_id TEXT NOT NULL,
+    updated_at      TEXT NOT NULL
+);
+"""
+
+# 유사 이름 후보를 찾는 최소 트라이그램 자카드 유사도와, 후보를 합치는 최소 문자 유사도 (difflib ratio)
+FUZZY_CANDIDATE = 0.6
+FUZZY_RATIO = 0.95
+# 동시 출현으로 합치는 최소 연결 수와 (같은 문자 체계일 때) 최소 이름 유사도
+LINK_MIN_COUNT = 2
+LINK_SIMILARITY = 0.5
+# 비교용 이름 끝에서 빼는 법인 형태
+LEGAL_SUFFIXES = {"CO", "LTD", "INC", "CORP", "LIMITED", "COMPANY", "CORPORATION", "LLC", "GMBH"}
+# 이름 묶기 단위: 국가 + 제조지역 + 지역명을 뺀 이름(공백 제거)의 앞 글자 수
+BLOCK_PREFIX = 2
+# 프로세스 풀 작업 하나에 담는 이름 수 (작은 블록은 모아서 보냄)
+TASK_NAMES = 2000
+LARGE_CLUSTER_NAMES = 20
+
+HANGUL = re.compile(r"[가-힣]")
+LATIN = re.compile(r"[A-Za-z]")
+
+
+def script(name: str) -> str:
+    """이름의 문자 체계: ko(한글), en(영문), mixed(섞임), 빈 문자열(둘 다 없음)"""
+    has_hangul, has_latin = bool(HANGUL.search(name)), bool(LATIN.search(name))
+    if has_hangul and has_latin:
+        return "mixed"
+    return "ko" if has_hangul else "en" if has_latin else ""
+
+
+def clean_name(name: Optional[str]) -> str:
+    """원본 이름의 공백만 정리합니다. (국가, 이 이름)이 manufacturer_names 의 키"""
+    return " ".join((name or "").split())
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """a 와 b 를 합칩니다. 이미 같은 집합이면 False"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if b < a:
+            a, b = b, a
+        self.parent[b] = a
+        return True
+
+    def groups(self) -> Dict[int, List[int]]:
+        groups = defaultdict(list)
+        for x in range(len(self.parent)):
+            groups[self.find(x)].append(x)
+        return groups
+
+
+def normalize_names(names: Sequence[str]) -> List[str]:
+    """프로세스 풀 작업: 이름 목록을 정규화합니다. 정규화 후 빈 이름은 대문자 원본을 사용합니다."""
+    return [normalize("maker", name) or name.upper() for name in names]
+
+
+def split_region(norm: str) -> Tuple[Optional[str], str]:
+    """정규화 이름에서 제조지역(map_region 과 같은 규칙)을 찾아 (지역, 비교용 이름)을 반환합니다.
+
+    'SHENZHEN ABC' 와 'SHENZHEN ABD' 처럼 흔한 지역명 때문에 이름이 비슷해 보이지 않도록 지역명을 빼고,
+    normalize_company_name 이 남기는 끝의 법인 형태('CO' 등)도 빼고 비교합니다.
+    """
+    region = None
+    words = norm.split()
+    for key, name in REGIONS.items():
+        if key in norm:
+            region, words = name, norm.replace(key, " ").split()
+            break
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return region, " ".join(words) or norm
+
+
+def resolve_block(cores: Sequence[str]) -> List[Tuple[List[int], List[str]]]:
+    """프로세스 풀 작업: 같은 블록(국가, 지역)의 이름(지역명을 뺀 정규화 이름)을 묶어 [(순번 목록, 병합 플래그)] 를 반환합니다."""
+    uf = UnionFind(len(cores))
+    merges: List[Tuple[int, str]] = []
+
+    # 1) 같거나 공백만 다른 이름
+    first: Dict[str, int] = {}
+    for i, core in enumerate(cores):
+        j = first.setdefault(core.replace(" ", ""), i)
+        if j != i and uf.union(i, j) and core != cores[j]:
+            merges.append((i, "no_space"))
+
+    # 2) 유사 이름: 트라이그램 자카드 유사도로 후보를 찾고 문자 유사도로 확인
+    #    (prefix filtering: 드문 트라이그램 순으로 앞쪽 일부만 색인/탐색해도 자카드 유사도가 FUZZY_CANDIDATE 이상인 쌍은
+    #    반드시 공통 트라이그램을 가짐)
+    grams = [trigrams(core) for core in cores]
+    frequency = Counter(gram for item in grams for gram in item)
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for i, item in enumerate(grams):
+        ordered = sorted(item, key=lambda gram: (frequency[gram], gram))
+        prefix = ordered[: len(ordered) - math.ceil(FUZZY_CANDIDATE * len(ordered)) + 1]
+        candidates = {j for gram in prefix for j in postings[gram]}
+        size = len(cores[i])
+        for j in candidates:
+            # ratio 는 2 * 공통 글자 수 / 길이 합이므로 길이 차이만으로 걸러지는 쌍은 비교하지 않음
+            if 2 * min(size, len(cores[j])) < FUZZY_RATIO * (size + len(cores[j])):
+                continue
+            if similarity(item, grams[j]) < FUZZY_CANDIDATE or uf.find(i) == uf.find(j):
+                continue
+            matcher = difflib.SequenceMatcher(None, cores[i], cores[j], autojunk=False)
+            if matcher.quick_ratio() >= FUZZY_RATIO and matcher.ratio() >= FUZZY_RATIO:
+                uf.union(i, j)
+                merges.append((i, "fuzzy"))
+        for gram in prefix:
+            postings[gram].append(i)
+
+    flags = defaultdict(set)
+    for i, flag in merges:
+        flags[uf.find(i)].add(flag)
+    return [(members, sorted(flags[root])) for root, members in uf.groups().items()]
+
+
+def resolve_blocks(blocks: Sequence[Sequence[str]]) -> List[List[Tuple[List[int], List[str]]]]:
+    return [resolve_block(block) for block in blocks]
+
+
+def _batches(blocks: List[List[int]]) -> Iterator[List[List[int]]]:
+    """큰 블록부터 TASK_NAMES 개 정도씩 묶어서 작업 단위를 만듭니다."""
+    batch, size = [], 0
+    for block in sorted(blocks, key=len, reverse=True):
+        batch.append(block)
+        size += len(block)
+        if size >= TASK_NAMES:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+class Mentions:
+    """인증 DB 에서 읽은 제조사 이름 출현 목록"""
+
+    def __init__(self, store: CertStore):
+        self.names: List[Tuple[str, str]] = []  # name_id -> (국가, 이름)
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self.rows: List[Tuple[str, str, int, int]] = []  # (인증번호, role, seq, name_id)
+        self.weights: Counter = Counter()  # name_id -> 출현 수
+        self.links: Counter = Counter()  # (name_id, name_id) -> 함께 나온 수
+        self._load(store)
+
+    def _name_id(self, country: Optional[str], name: Optional[str]) -> Optional[int]:
+        name = clean_name(name)
+        if not name:
+            return None
+        key = ((country or "").strip(), name)
+        name_id = self._ids.get(key)
+        if name_id is None:
+            name_id = self._ids[key] = len(self.names)
+            self.names.append(key)
+        return name_id
+
+    def _add(self, cert_num: str, role: str, seq: int, country, name) -> Optional[int]:
+        name_id = self._name_id(country, name)
+        if name_id is not None:
+            self.rows.append((cert_num, role, seq, name_id))
+            self.weights[name_id] += 1
+        return name_id
+
+    def _link(self, a: Optional[int], b: Optional[int]):
+        if a is not None and b is not None and a != b and self.names[a][0] == self.names[b][0]:
+            self.links[min(a, b), max(a, b)] += 1
+
+    def _load(self, store: CertStore):
+        representative: Dict[str, int] = {}  # 인증번호(소문자) -> 대표 제조사 name_id
+        makers = store.conn.execute(
+            "SELECT cert_num, json_extract(api_json, '$.makerCntryName'), json_extract(api_json, '$.makerName') "
+            "FROM certificates WHERE api_json IS NOT NULL"
+        )
+        for cert_num, country, name in makers:
+            name_id = self._add(cert_num, "maker", 0, country, name)
+            if name_id is not None:
+                representative[cert_num.lower()] = name_id
+
+        first_factory: Dict[str, int] = {}
+        for cert_num, seq, name, country in store.conn.execute(
+            "SELECT cert_num, seq, factory_name, country FROM factories ORDER BY cert_num, seq"
+        ):
+            name_id = self._add(cert_num, "factory", seq, country, name)
+            if name_id is not None and cert_num.lower() not in first_factory:
+                first_factory[cert_num.lower()] = name_id
+
+        # 같은 인증의 makerName 과 첫 번째 제조공장은 같은 업체를 다르게 적은 경우가 많음
+        for cert_key, name_id in first_factory.items():
+            self._link(representative.get(cert_key), name_id)
+            representative.setdefault(cert_key, name_id)
+
+        # 연관 인증(파생 모델 등)은 대부분 같은 제조사
+        for cert_num, related_num in store.conn.execute("SELECT cert_num, related_num FROM related_certs"):
+            self._link(representative.get(cert_num.lower()), representative.get(related_num.lower()))
+
+
+def _map(pool: Optional[ProcessPoolExecutor], func, items: List) -> List:
+    return list(pool.map(func, items)) if pool is not None else list(map(func, items))
+
+
+def cluster(mentions: Mentions, workers: Optional[int] = None) -> Tuple[List[str], List[Tuple[List[int], Set[str]]]]:
+    """이름을 묶어 (정규화 이름 목록, [(name_id 목록, 병합 플래그)]) 를 반환합니다. workers=1 이면 프로세스 풀 없이 실행"""
+    names = [name for _, name in mentions.names]
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        chunks = [names[i : i + TASK_NAMES] for i in range(0, len(names), TASK_NAMES)]
+        norms = [norm for chunk in _map(pool, normalize_names, chunks) for norm in chunk]
+
+        blocks: Dict[Tuple[str, Optional[str], str], List[int]] = defaultdict(list)
+        cores = []
+        for name_id, (country, _) in enumerate(mentions.names):
+            region, core = split_region(norms[name_id])
+            cores.append(core)
+            blocks[country, region, core.replace(" ", "")[:BLOCK_PREFIX]].append(name_id)
+        batches = list(_batches(list(blocks.values())))
+        tasks = [[[cores[name_id] for name_id in block] for block in batch] for batch in batches]
+        results = _map(pool, resolve_blocks, tasks)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    uf = UnionFind(len(names))
+    block_flags = []
+    for batch, batch_result in zip(batches, results):
+        for block, groups in zip(batch, batch_result):
+            for members, merge_flags in groups:
+                for member in members[1:]:
+                    uf.union(block[members[0]], block[member])
+                block_flags.append((block[members[0]], merge_flags))
+    flags = defaultdict(set)
+    for name_id, merge_flags in block_flags:
+        flags[uf.find(name_id)].update(merge_flags)
+
+    # 동시 출현 신호로 이름 클러스터를 합침 (대표 이름끼리 비교)
+    canonical = {}
+    for root, members in uf.groups().items():
+        canonical[root] = max(members, key=lambda name_id: mentions.weights[name_id])
+    cluster_links = Counter()
+    for (a, b), count in mentions.links.items():
+        ra, rb = uf.find(a), uf.find(b)
+        if ra != rb:
+            cluster_links[min(ra, rb), max(ra, rb)] += count
+    for (ra, rb), count in cluster_links.most_common():
+        if count < LINK_MIN_COUNT or uf.find(ra) == uf.find(rb):
+            continue
+        a, b = canonical[ra], canonical[rb]
+        cross = {script(names[a]), script(names[b])} == {"ko", "en"}
+        if cross or similarity(trigrams(norms[a]), trigrams(norms[b])) >= LINK_SIMILARITY:
+            merged = flags.pop(uf.find(ra), set()) | flags.pop(uf.find(rb), set()) | {"linked"}
+            uf.union(ra, rb)
+            flags[uf.find(ra)] = merged
+
+    return norms, [(members, flags.get(root, set())) for root, members in uf.groups().items()]
+
+
+def quality_flags(countries: Set[str], names: List[str], norms: List[str], merge_flags: Set[str]) -> List[str]:
+    """클러스터의 검토 필요 항목"""
+    flags = set(merge_flags)
+    scripts = {script(name) for name in names}
+    if "mixed" in scripts:
+        flags.add("mixed_script")
+    if {"ko", "en"} <= scripts:
+        flags.add("cross_script")
+    if len({region for region in map(map_region, norms) if region}) > 1:
+        flags.add("multi_region")
+    if len(names) > LARGE_CLUSTER_NAMES:
+        flags.add("large")
+    if countries == {""}:
+        flags.add("no_country")
+    return sorted(flags)
+
+
+def _new_id(country: str, normalized_name: str, used: Set[str]) -> str:
+    """국가와 정규화 이름으로 ID 를 만듭니다. 같은 입력이면 항상 같은 ID (충돌하면 순번을 붙여 다시 해시)"""
+    for attempt in range(len(used) + 1):
+        seed = f"{country}\t{normalized_name}\t{attempt}" if attempt else f"{country}\t{normalized_name}"
+        manufacturer_id = "M" + hashlib.sha1(seed.encode("utf-8")).hexdigest()[:10].upper()
+        if manufacturer_id not in used:
+            return manufacturer_id
+    raise RuntimeError("제조사 ID 를 만들지 못했습니다.")
+
+
+def assign_ids(
+    store: CertStore, mentions: Mentions, clusters: List[List[int]], seeds: List[str]
+) -> Tuple[List[str], Dict[str, str]]:
+    """클러스터별 ID 와 {없어진 ID: 새 ID} 를 반환합니다.
+
+    이전 ID 는 출현 수 기준으로 가장 많이 겹치는 클러스터가 물려받고, 물려받을 ID 가 없는 클러스터는
+    (국가, seeds[클러스터] = 대표 정규화 이름)으로 새 ID 를 만듭니다.
+    """
+    rows = store.conn.execute("SELECT country, name, manufacturer_id FROM manufacturer_names")
+    previous = {(country, name): manufacturer_id for country, name, manufacturer_id in rows}
+    votes = []
+    for index, members in enumerate(clusters):
+        counter = Counter()
+        for name_id in members:
+            old_id = previous.get(mentions.names[name_id])
+            if old_id:
+                counter[old_id] += mentions.weights[name_id]
+        votes += [(count, old_id, index) for old_id, count in counter.items()]
+
+    ids: List[Optional[str]] = [None] * len(clusters)
+    used: Set[str] = set()
+    redirects: Dict[str, int] = {}
+    for count, old_id, index in sorted(votes, key=lambda vote: (-vote[0], vote[1])):
+        if ids[index] is None and old_id not in used:
+            ids[index] = old_id
+            used.add(old_id)
+        elif old_id not in used:
+            redirects.setdefault(old_id, index)
+
+    for index, members in enumerate(clusters):
+        if ids[index] is None:
+            ids[index] = _new_id(mentions.names[members[0]][0], seeds[index], used)
+            used.add(ids[index])
+    return ids, {old_id: ids[index] for old_id, index in redirects.items() if old_id not in used}
+
+
+def resolve(db_path: str = DEFAULT_DB_PATH, workers: Optional[int] = None) -> Dict[str, int]:
+    """제조사 테이블을 다시 만들고 집계를 반환합니다."""
+    with CertStore(db_path) as store:
+        with store.conn:
+            store.conn.executescript(SCHEMA)
+        mentions = Mentions(store)
+        norms, clusters = cluster(mentions, workers)
+        # 각 클러스터의 이름은 출현 수가 많은 순서 (첫 번째가 대표 이름)
+        for members, _ in clusters:
+            members.sort(key=lambda name_id: (-mentions.weights[name_id], mentions.names[name_id][1]))
+        clusters.sort(key=lambda item: mentions.names[item[0][0]])
+        members_list = [members for members, _ in clusters]
+        ids, redirects = assign_ids(store, mentions, members_list, [norms[members[0]] for members in members_list])
+
+        certs = defaultdict(set)
+        for cert_num, _, _, name_id in mentions.rows:
+            certs[name_id].add(cert_num.lower())
+
+        now = datetime.now().isoformat(timespec="seconds")
+        manufacturer_rows, name_rows, flag_counts = [], [], Counter()
+        for manufacturer_id, (members, merge_flags) in zip(ids, clusters):
+            names = [mentions.names[name_id][1] for name_id in members]
+            countries = {mentions.names[name_id][0] for name_id in members}
+            member_norms = [norms[name_id] for name_id in members]
+            regions = Counter(region for region in map(map_region, member_norms) if region)
+            flags = quality_flags(countries, names, member_norms, merge_flags)
+            flag_counts.update(flags)
+            cert_count = len(set().union(*(certs[name_id] for name_id in members)))
+            manufacturer_rows.append(
+                (
+                    manufacturer_id,
+                    mentions.names[members[0]][0],
+                    names[0],
+                    member_norms[0],
+                    regions.most_common(1)[0][0] if regions else None,
+                    json.dumps(names, ensure_ascii=False),
+                    len(names),
+                    cert_count,
+                    ",".join(flags),
+                    now,
+                )
+            )
+            name_rows += [(*mentions.names[name_id], manufacturer_id) for name_id in members]
+        name_to_id = {name_id: ids[index] for index, members in enumerate(members_list) for name_id in members}
+
+        with store.conn:
+            for table in ("manufacturers", "manufacturer_names", "certificate_manufacturers"):
+                store.conn.execute(f"DELETE FROM {table}")
+            store.conn.executemany("INSERT INTO manufacturers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", manufacturer_rows)
+            store.conn.executemany("INSERT INTO manufacturer_names VALUES (?, ?, ?)", name_rows)
+            store.conn.executemany(
+                "INSERT OR REPLACE INTO certificate_manufacturers VALUES (?, ?, ?, ?)",
+                ((cert_num, role, seq, name_to_id[name_id]) for cert_num, role, seq, name_id in mentions.rows),
+            )
+            # 다시 살아난 ID 의 리다이렉트는 지우고, 없어진 ID 를 가리키던 리다이렉트는 새 ID 로 옮김
+            store.conn.executemany("DELETE FROM manufacturer_redirects WHERE old_id = ?", ((i,) for i in ids))
+            store.conn.executemany(
+                "INSERT OR REPLACE INTO manufacturer_redirects VALUES (?, ?, ?)",
+                ((old_id, new_id, now) for old_id, new_id in redirects.items()),
+            )
+            store.conn.executemany(
+                "UPDATE manufacturer_redirects SET manufacturer_id = ?, updated_at = ? WHERE manufacturer_id = ?",
+                ((new_id, now, old_id) for old_id, new_id in redirects.items()),
+            )
+
+    result = {"names": len(mentions.names), "manufacturers": len(clusters), "redirects": len(redirects)}
+    result.update((f"flag[{flag}]", count) for flag, count in sorted(flag_counts.items()))
+    return result
+
+
+def lookup(store: CertStore, manufacturer_id: str) -> Optional[Dict]:
+    """ID(없어진 ID 면 리다이렉트를 따라감)로 제조사를 조회합니다."""
+    row = store.conn.execute(
+        "SELECT manufacturer_id FROM manufacturer_redirects WHERE old_id = ?", (manufacturer_id,)
+    ).fetchone()
+    if row is not None:
+        manufacturer_id = row[0]
+    row = store.conn.execute("SELECT * FROM manufacturers WHERE manufacturer_id = ?", (manufacturer_id,)).fetchone()
+    if row is None:
+        return None
+    result = dict(row)
+    result["names"] = json.loads(result.pop("names_json"))
+    result["flags"] = result["flags"].split(",") if result["flags"] else []
+    result["certNum"] = [
+        cert_num
+        for (cert_num,) in store.conn.execute(
+            "SELECT DISTINCT cert_num FROM certificate_manufacturers WHERE manufacturer_id = ? ORDER BY cert_num",
+            (manufacturer_id,),
+        )
+    ]
+    return result
+
+
+def export(store: CertStore, path: str) -> int:
+    """제조사 테이블을 manufacturer_v1.json 과 비슷한 형식(ID, 이름 목록, 인증번호 목록, 플래그)으로 저장합니다."""
+    ids = [row[0] for row in store.conn.execute("SELECT manufacturer_id FROM manufacturers ORDER BY manufacturer_id")]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([lookup(store, manufacturer_id) for manufacturer_id in ids], f, ensure_ascii=False, indent=4)
+    return len(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제조사 개체 식별 배치 작업")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    resolve_parser = subparsers.add_parser("resolve", help="제조사 테이블을 다시 만듭니다.")
+    resolve_parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    resolve_parser.add_argument("--export", type=str, default=None, help="결과를 저장할 JSON 파일")
+
+    show_parser = subparsers.add_parser("show", help="제조사 ID 로 조회합니다.")
+    show_parser.add_argument("ids", nargs="+", help="제조사 ID")
+
+    subparsers.add_parser("stats", help="제조사 수와 플래그별 클러스터 수를 출력합니다.")
+    args = parser.parse_args()
+
+    if args.command == "resolve":
+        started = time.perf_counter()
+        result = resolve(args.db, args.workers)
+        print(
+            f"* 이름 {result['names']}개 -> 제조사 {result['manufacturers']}개 "
+            f"(리다이렉트 {result['redirects']}개, {time.perf_counter() - started:.1f}초)"
+        )
+        for key, count in result.items():
+            if key.startswith("flag["):
+                print(f"  - {key[5:-1]}: {count}개")
+
+    with CertStore(args.db) as store:
+        with store.conn:
+            store.conn.executescript(SCHEMA)
+        if args.command == "resolve" and args.export:
+            print(f"* {export(store, args.export)}개 제조사 저장: {args.export}")
+        elif args.command == "show":
+            for manufacturer_id in args.ids:
+                result = lookup(store, manufacturer_id)
+                print(json.dumps(result, ensure_ascii=False, indent=4) if result else f"{manufacturer_id}: 없음")
+        elif args.command == "stats":
+            (total,) = store.conn.execute("SELECT COUNT(*) FROM manufacturers").fetchone()
+            print(f"* 제조사: {total}개")
+            flag_counts = Counter()
+            for (flags,) in store.conn.execute("SELECT flags FROM manufacturers WHERE flags != ''"):
+                flag_counts.update(flags.split(","))
+            for flag, count in flag_counts.most_common():
+                print(f"  - {flag}: {count}개")
+
+
+if __name__ == "__main__":
+    main()
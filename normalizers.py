@@ -0,0 +1,195 @@
+import re
+
+# 대표적인 중국 제조지역 (영문 대문자 -> 한글)
+REGIONS = {
+    "SHENZHEN": "심천",
+    "SHANGHAI": "상해",
+    "BEIJING": "베이징",
+    "GUANGZHOU": "광저우",
+    "CHENGDU": "청두",
+    "TIANJIN": "텐진",
+    "DONGGUAN": "동관",
+    "WUHAN": "우한",
+    "CHONGQING": "충칭",
+    "SUZHOU": "쑤저우",
+    "NINGBO": "닝보",
+    "XIAMEN": "샤먼",
+    "ZHONGSHAN": "중산",
+    "BEIHAI": "베이하이",
+    "ZHUHAI": "주하이",
+    "FOSHAN": "포산",
+    "NANJING": "난징",
+    "CHANGZHOU": "창저우",
+    "HANGZHOU": "항저우",
+    "HUIZHOU": "후이저우",
+    "QINGDAO": "칭다오",
+}
+
+# 업체명에서 제거할 단어 리스트
+COMPANY_COMMON_WORDS = ["CO LTD", "LTD", "INC", "CORP", "COMPANY", "유한공사", "주식회사", "PLC"]
+
+# 품목명 교체 규칙 (패턴: 치환할 한글)
+PRODUCT_RULES = {
+    r"\bADAPT[EO]R\b": "어댑터",  # ADAPTER, ADAPTOR 둘 다 치환
+    r"\bPLAYER\b": "플레이어",
+    r"\bRECEIVER\b": "리시버",
+    r"\b테블릿": "태블릿",
+    r"유사한": "유사",
+    r"(?<=[가-힣])\s*와\s*(?=[가-힣])": "",
+    r"커패시터": "캐패시터",
+    r"레이져": "레이저",
+    r"제픔": "제품",
+    r"그라인다": "그라인더",
+    r"로타리": "로터리",
+    r"핼라이드": "할라이드",
+}
+
+# 품목분류명 교체 규칙
+CATEGORY_RULES = {
+    r"을 사용하는": "",
+    r"을 이용한": "",
+    r"플래이어": "플레이어",
+    r"을 내장한": " 내장형",
+}
+
+
+def unify_single_quotes(text: str) -> str:
+    """유사한 단일 따옴표 문자들을 표준 단일 따옴표(')로 통일합니다."""
+    similar_quotes = "‘’‚‛`´ʼ❛❜＇'"
+    pattern = f"[{re.escape(similar_quotes)}]"
+    return re.sub(pattern, "'", text)
+
+
+def remove_korean_in_parentheses(text: str) -> str:
+    """'영어(한글)', '한글(영어)', '(한글)영어' 형태에서 영어 부분만 남깁니다."""
+    text = re.sub(r"([A-Za-z]+)\([가-힣]+\)", r"\1", text)
+    text = re.sub(r"[가-힣]+\(([A-Za-z]+)\)", r"\1", text)
+    return re.sub(r"\([가-힣]+\)([A-Za-z]+)", r"\1", text)
+
+
+def extract_english(text: str) -> str:
+    """'영어 / 한글' 형태의 이름에서 영어 부분을 추출합니다."""
+    pattern = r"^([A-Za-z\s]+)\s*/[가-힣]+[가-힣\s]+"
+    match = re.match(pattern, text)
+    if match:
+        return match.group(1).strip()
+    return text
+
+
+def normalize_company_name(name: str) -> str:
+    """업체명을 클러스터링용으로 정규화합니다."""
+    # (주) 제거 및 괄호는 공백으로 치환
+    name = re.sub(r"\(주\)", "", name)
+    name = re.sub(r"\(유\)", "", name)
+    name = unify_single_quotes(name)
+    name = (
+        name.replace("（", "(")
+        .replace("）", ")")
+        .replace("[", "(")
+        .replace("]", ")")
+        .replace("&", " & ")
+        .replace("˚", "O")
+        .replace('"', "")
+        .replace("㈜", "")
+        .replace("_", " ")
+        .replace("，", " ")
+        .replace("!", " ")
+        .replace("‐", "-")
+        .replace("-", " ")
+    )
+
+    # 영어(한글) 삭제
+    name = remove_korean_in_parentheses(name)
+
+    name = name.replace("(", " ").replace(")", " ")
+
+    # "CO LTD"가 공백 없이 붙어있거나 공백이 있어도 제거 (문자열 끝에서 제거)
+    name = re.sub(r"CO\s*LTD$", "", name, flags=re.IGNORECASE).strip()
+
+    # 마지막 단어가 'LIMITED COMPANY' 또는 'COMPANY LIMITED'이면 마지막 두 단어를 'CO LTD'로 대체
+    if name.endswith("LIMITED COMPANY") or name.endswith("COMPANY LIMITED"):
+        name = " ".join(name.split()[:-2]) + " CO LTD"
+
+    # 불필요한 단어들을 정규식으로 제거
+    for word in COMPANY_COMMON_WORDS:
+        name = re.sub(r"\b" + re.escape(word) + r"\b", "", name)
+
+    # 영어 / 한글 -> 영어 추출
+    name = extract_english(name)
+
+    # 마지막 단어가 'CO', 'COLTD', 또는 'LIMITED'면 제거 (반복 확인)
+    words = name.split()
+    while words and words[-1] in {"CO", "COLTD", "LIMITED"}:
+        words.pop()
+
+    return " ".join(words)
+
+
+def remove_unbalanced_parentheses(text: str) -> str:
+    """괄호와 그 안의 내용을 제거하고, 닫히지 않은 괄호 이후의 내용도 제거합니다."""
+    # 1. 균형 잡힌 괄호(가장 안쪽부터)를 모두 제거
+    pattern_balanced = re.compile(r"\([^()]*\)")
+    while re.search(pattern_balanced, text):
+        text = re.sub(pattern_balanced, "", text)
+    # 2. 아직 남아 있는 미완성 괄호와 그 이후의 모든 내용 제거
+    text = re.sub(r"\(.*$", "", text)
+
+    return text.strip()
+
+
+def _apply_rules(text: str, rules: dict) -> str:
+    for pattern, replacement in rules.items():
+        # 대소문자 구분 없이 치환
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    return text
+
+
+def normalize_product_name(name) -> str:
+    """품목명을 정규화합니다."""
+    name = str(name).upper()
+    name = (
+        name.replace("（", "(")
+        .replace("）", ")")
+        .replace("[", "(")
+        .replace("]", ")")
+        .replace("_", " ")
+        .replace("，", " ")
+        .replace("!", " ")
+        .replace("‐", "-")
+        .replace("-", " ")
+        .replace(".", "·")
+        .replace("·", " ")
+        .replace(",", " ")
+    )
+
+    name = remove_unbalanced_parentheses(name)  # 괄호와 그 안의 내용 제거
+    name = name.replace("(", "").replace(")", "").replace("및", "&")
+    name = re.sub(r"\s+", " ", name)  # 중복 공백 제거
+    name = re.sub(r":.*$", "", name).strip()
+
+    name = _apply_rules(name, PRODUCT_RULES)
+    name = re.sub(r"(?<=\w)\s+(?=[가-힣&])|(?<=[가-힣&])\s+(?=\w)", "", name)
+    return name
+
+
+def normalize_category_name(name) -> list:
+    """'대분류 > 소분류' 형식의 품목분류명을 정규화된 분류 리스트로 변환합니다."""
+    name = str(name).upper()
+    name = name.replace("·", "/").replace(",", "").replace("/", "")
+    name = remove_unbalanced_parentheses(name)
+    name = _apply_rules(name, CATEGORY_RULES)
+    name = name.replace(" ", "")
+    return list(set([category.strip() for category in name.split(">")]))
+
+
+def normalize_cert_name(name: str) -> list:
+    """'>'로 구분된 인증구분명을 리스트로 변환합니다."""
+    return list(set([category.strip() for category in name.split(">")]))
+
+
+def map_region(maker_name: str):
+    """업체명에 포함된 중국 제조지역을 한글 지역명으로 반환합니다."""
+    for key in REGIONS.keys():
+        if key in maker_name:
+            return REGIONS[key]
+    return None  # 키가 없으면 None 반환
@@ -1,19 +1,32 @@
+import argparse
 import json
 import csv
 import glob
 import os
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List
 import pandas as pd
 
+from consolidate import Consolidator
+from kc_record import iter_chunks, iter_output_records
+from kc_store import CertStore
 
-def read_json_file(file_path: str) -> List[Dict]:
-    """JSON 파일을 읽어서 데이터를 반환합니다."""
+# 평탄화한 레코드를 이 행 수만큼 모아서 DataFrame 을 만듦 (dict 목록 전체를 메모리에 두지 않도록)
+CHUNK_ROWS = 10000
+
+
+def read_json_file(file_path: str) -> Iterator[Dict]:
+    """JSON(배열) 또는 JSONL 파일의 레코드를 하나씩 읽습니다. 읽는 도중 오류가 나면 그때까지 읽은 레코드만 반환합니다."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        yield from iter_output_records(file_path)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
-        return []
+
+
+def iter_records(json_files) -> Iterator[Dict]:
+    """여러 파일의 레코드를 순서대로 읽습니다."""
+    for file_path in json_files:
+        print(f"Processing {file_path}...")
+        yield from read_json_file(file_path)
 
 
 def flatten_data(item: Dict) -> Dict:
@@ -54,6 +67,12 @@ def flatten_data(item: Dict) -> Dict:
     return flattened
 
 
+def build_dataframe(records: Iterable[Dict], columns: List[str]) -> pd.DataFrame:
+    """레코드를 하나씩 평탄화해서 CHUNK_ROWS 행씩 DataFrame 으로 만든 뒤 합칩니다."""
+    chunks = [pd.DataFrame(rows, columns=columns) for rows in iter_chunks(map(flatten_data, records), CHUNK_ROWS)]
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+
+
 def clean_factory_name(name: str) -> str:
     """제조공장명을 정제합니다."""
     cleaned = name.replace(".", "").upper().replace(",", " ")
@@ -100,6 +119,10 @@ def extract_chinese_factories(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과를 CSV로 변환합니다.")
+    parser.add_argument("--db", type=str, default=None, help="JSON 파일 대신 인증 DB에서 최신 데이터를 읽습니다.")
+    args = parser.parse_args()
+
     # CSV 헤더 정의
     headers = [
         "인증번호",
@@ -119,47 +142,22 @@ def main():
         "연관인증번호",
     ]
 
-    # 모든 데이터를 저장할 리스트
-    all_data = []
-
-    # output 디렉토리의 모든 JSON 파일 읽기
-    json_files = glob.glob("output_bak/*.json")
-
-    # 각 JSON 파일 처리
-    for file_path in json_files:
-        print(f"Processing {file_path}...")
-        data = read_json_file(file_path)
-
-        # 각 항목을 평탄화하여 저장
-        for item in data:
-            flattened = flatten_data(item)
-            all_data.append(flattened)
-
-    # 데이터프레임으로 변환
-    df = pd.DataFrame(all_data)
-
-    # 처리 전 데이터 수 저장
-    total_before = len(df)
-
-    # 중복 제거 (모든 컬럼 값이 동일한 행 제거)
-    df_no_duplicates = df.drop_duplicates()
-
-    # 인증번호 기준 중복 제거 (가장 최근 데이터 유지)
-    df_unique = df_no_duplicates.sort_values("인증변경일자", ascending=False).drop_duplicates(
-        subset=["인증번호"], keep="first"
-    )
-
-    # 중복 제거 결과 출력
-    total_after_full_dup = len(df_no_duplicates)
+    if args.db:
+        # DB에는 인증번호별 최신 버전만 저장되어 있으므로 별도의 중복 제거가 필요 없음
+        print(f"Processing {args.db}...")
+        with CertStore(args.db) as store:
+            df_unique = build_dataframe(store.iter_details(), headers)
+    else:
+        # output 디렉토리의 모든 JSON/JSONL/.kcz 파일을 인증번호 기준으로 외부 병합 정렬하면서 중복 제거 (가장 최근 데이터 유지)
+        json_files = glob.glob("output_bak/*.json") + glob.glob("output_bak/*.jsonl") + glob.glob("output_bak/*.kcz")
+        consolidator = Consolidator(iter_records(json_files))
+        df_unique = build_dataframe(consolidator.records(), headers)
+
+        print(f"\n중복 제거 결과:")
+        print(f"- 원본 데이터: {consolidator.read}개 (인증번호 없음: {consolidator.invalid}개)")
+        print(f"- 인증번호 기준 중복 제거 후: {consolidator.written}개 (제거된 행: {consolidator.duplicates}개)")
     total_after_cert_dup = len(df_unique)
 
-    print(f"\n중복 제거 결과:")
-    print(f"- 원본 데이터: {total_before}개")
-    print(f"- 완전 중복 제거 후: {total_after_full_dup}개 (제거된 행: {total_before - total_after_full_dup}개)")
-    print(
-        f"- 인증번호 기준 중복 제거 후: {total_after_cert_dup}개 (추가 제거된 행: {total_after_full_dup - total_after_cert_dup}개)"
-    )
-
     # CSV 파일로 저장
     output_file = "output.csv"
     df_unique.to_csv(output_file, index=False, encoding="utf-8-sig")
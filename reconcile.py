@@ -0,0 +1,75 @@
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from kc_record import iter_chunks, iter_json_records
+from kc_store import CertStore, DEFAULT_DB_PATH, IMPORT_CHUNK_ROWS
+
+# Open API 레코드에는 제조공장 목록(factories)과 연관 인증 번호가 없고 대표 제조사(makerName) 한 건만 있으므로,
+# API 레코드만으로는 상세 페이지의 어떤 항목이 빠졌는지 알 수 없음. 상세 데이터가 아직 없는 인증번호를 모두 수집 대상으로 봄
+GAP_REASON = "no_detail"
+
+
+def plan_gaps(store: CertStore, records, detail_numbers: Optional[set] = None) -> List[Tuple[str, str]]:
+    """API 레코드 중 상세 데이터가 아직 없는 인증번호를 대기열에 넣고 (인증번호, GAP_REASON) 목록을 반환합니다."""
+    if detail_numbers is None:
+        detail_numbers = store.cert_numbers(detail_only=True)
+
+    planned = []
+    for record in records:
+        cert_num = (record.get("certNum") or "").strip()
+        if cert_num and cert_num.lower() not in detail_numbers:
+            planned.append((cert_num, GAP_REASON))
+    store.enqueue_details(planned)
+    return planned
+
+
+def reconcile(store: CertStore, records=None) -> Dict[str, int]:
+    """API 결과와 저장된 상세 데이터를 비교해 브라우저 수집 대기열을 만들고 집계를 반환합니다.
+
+    records 가 없으면 DB에 저장된 Open API 레코드를 사용합니다.
+    상태가 바뀐 인증번호(변경 감지)와 상세 데이터가 아직 없는 인증번호가 대기열에 들어갑니다.
+    """
+    if records is None:
+        records = store.iter_api_records()
+    detail_numbers = store.cert_numbers(detail_only=True)
+
+    # 레코드를 IMPORT_CHUNK_ROWS 건씩 한 번만 순회하므로 파일이나 DB의 API 레코드를 메모리에 모두 올리지 않음
+    stats = {"api": 0, "detail": 0, "changed": 0, "gaps": 0}
+    for chunk in iter_chunks(records, IMPORT_CHUNK_ROWS):
+        stats["api"] += len(chunk)
+        stats["detail"] += sum(1 for record in chunk if (record.get("certNum") or "").strip().lower() in detail_numbers)
+        stats["changed"] += len(store.detector.plan_refresh(chunk))
+        stats["gaps"] += len(plan_gaps(store, chunk, detail_numbers))
+    return {**stats, "queue": len(store.detail_queue())}
+
+
+def load_api_files(paths: List[str]) -> Iterator[Dict]:
+    """fetch_kc_cert.py 가 저장한 JSON 파일(연도별 또는 전체)의 Open API 레코드를 하나씩 읽습니다."""
+    for path in paths:
+        # certifications_all_years.json 의 {연도: [레코드]} 형식도 iter_json_records 가 레코드 단위로 읽음
+        yield from (item for item in iter_json_records(path) if "certNum" in item)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open API 결과와 상세 데이터를 비교해 브라우저 수집 대기열 생성")
+    parser.add_argument("files", nargs="*", help="Open API 결과 JSON 파일 (없으면 DB에 저장된 API 레코드 사용)")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help=f"인증 DB 경로 (기본값: {DEFAULT_DB_PATH})")
+    args = parser.parse_args()
+
+    with CertStore(args.db) as store:
+        records = None
+        if args.files:
+            # 대기열을 만들기 전에 모두 저장해 두고, 비교할 때는 파일을 다시 스트리밍으로 읽음
+            for chunk in iter_chunks(load_api_files(args.files), IMPORT_CHUNK_ROWS):
+                store.upsert_api_records(chunk)
+            records = load_api_files(args.files)
+        stats = reconcile(store, records)
+
+    print(f"* API 레코드: {stats['api']}건 (상세 수집 완료: {stats['detail']}건)")
+    print(f"* 상태 변경 재수집: {stats['changed']}건")
+    print(f"* 상세 데이터 없음: {stats['gaps']}건")
+    print(f"* 상세 수집 대기열: {stats['queue']}건 (kc_crawl_mt.py --mode queue 로 수집)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import json
+import random
+
+import consolidate
+from consolidate import Consolidator
+from kc_pack import iter_pack_records
+
+
+def make_record(cert_num, change_date=None, tag=None):
+    return {"인증정보": {"인증번호": cert_num, "인증변경일자": change_date, "tag": tag}}
+
+
+def tags(records):
+    return [(record["인증정보"]["인증번호"], record["인증정보"]["tag"]) for record in records]
+
+
+def test_latest_change_date_wins_and_ties_keep_the_later_record():
+    records = [
+        make_record("SU0002", "2023-05-12", "old"),
+        make_record("SU0001", "2023.01.01", "first"),
+        make_record("SU0002", "20240101", "new"),
+        make_record("SU0002", "2023-06-01", "older than new"),
+        make_record("su0001", "2023-01-01", "same date, read later"),
+        make_record("", "2024-01-01", "no cert number"),
+        {"certNum": "SU0003"},
+    ]
+    consolidator = Consolidator(records)
+
+    assert tags(consolidator.records()) == [("su0001", "same date, read later"), ("SU0002", "new")]
+    assert (consolidator.read, consolidator.invalid, consolidator.written) == (7, 2, 2)
+    assert consolidator.duplicates == 3
+
+
+def test_multi_level_merge_matches_in_memory_result(monkeypatch, tmp_path):
+    monkeypatch.setattr(consolidate, "MERGE_FAN_IN", 3)
+    rng = random.Random(7)
+    records = [
+        make_record(f"SU{rng.randrange(40):04d}", f"2024-01-{rng.randrange(1, 4):02d}", str(i)) for i in range(500)
+    ]
+    expected = {}
+    for record in records:
+        info = record["인증정보"]
+        key = info["인증번호"].lower()
+        if key not in expected or info["인증변경일자"] >= expected[key]["인증변경일자"]:
+            expected[key] = info
+
+    consolidator = Consolidator(records, run_size=7, tmp_dir=str(tmp_path))
+    result = [record["인증정보"] for record in consolidator.records()]
+
+    assert consolidator.runs > consolidate.MERGE_FAN_IN**2
+    assert result == [expected[key] for key in sorted(expected)]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_main_writes_kcz_output(monkeypatch, tmp_path):
+    first, second = tmp_path / "worker-0.jsonl", tmp_path / "worker-1.jsonl"
+    first.write_text(json.dumps(make_record("SU0001", "2023-01-01", "a"), ensure_ascii=False) + "\n", encoding="utf-8")
+    second.write_text(
+        "\n".join(
+            json.dumps(record, ensure_ascii=False)
+            for record in (make_record("SU0001", "2023-02-01", "b"), make_record("SU0002", "2023-01-01", "c"))
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "all.kcz"
+    monkeypatch.setattr("sys.argv", ["consolidate.py", str(first), str(second), "--output", str(output)])
+
+    consolidate.main()
+
+    assert tags(iter_pack_records(str(output))) == [("SU0001", "b"), ("SU0002", "c")]
+    assert not (tmp_path / "all.kcz.tmp").exists()
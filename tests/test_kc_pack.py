@@ -0,0 +1,108 @@
+import json
+import os
+
+import pytest
+
+import kc_pack
+from kc_pack import PackReader, PackWriter, iter_pack_keys, iter_pack_records
+
+
+def make_record(i, **fields):
+    return {
+        "인증정보": {"인증번호": f"SU0{i:05d}-0001", "인증상태": "적합", **fields},
+        "제조공장": [{"제조공장": f"FACTORY {i}", "제조국": "중국"}],
+        "연관 인증 번호": [],
+    }
+
+
+def write_pack(path, records, **options):
+    with PackWriter(str(path), **options) as writer:
+        for record in records:
+            writer.write(record)
+    return writer
+
+
+def test_round_trip_keeps_records_and_key_order(tmp_path):
+    path = tmp_path / "out.kcz"
+    records = [make_record(i) for i in range(600)]
+    writer = write_pack(path, records, block_records=256)
+
+    assert writer.blocks == 3
+    assert list(iter_pack_records(str(path))) == records
+    assert [list(record["인증정보"]) for record in iter_pack_records(str(path))][0] == ["인증번호", "인증상태"]
+    assert list(iter_pack_keys(str(path))) == [record["인증정보"]["인증번호"] for record in records]
+
+    with PackReader(str(path)) as reader:
+        assert len(reader) == 600
+        assert "su000300-0001" in reader
+        assert reader.get("SU000300-0001") == records[300]
+        assert reader.get("SU099999-0001") is None
+
+
+def test_reader_returns_latest_record_for_duplicate_key(tmp_path):
+    path = tmp_path / "out.kcz"
+    write_pack(path, [make_record(1, 인증상태="적합"), make_record(2)], block_records=1)
+    write_pack(path, [make_record(1, 인증상태="취소")], block_records=1)
+
+    with PackReader(str(path)) as reader:
+        assert len(reader) == 2
+        assert reader.get("SU000001-0001")["인증정보"]["인증상태"] == "취소"
+
+
+def test_truncated_last_block_is_ignored_and_cut_on_append(tmp_path):
+    path = tmp_path / "out.kcz"
+    write_pack(path, [make_record(i) for i in range(4)], block_records=2)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+
+    assert [record["인증정보"]["인증번호"] for record in iter_pack_records(str(path))] == [
+        "SU000000-0001",
+        "SU000001-0001",
+    ]
+
+    write_pack(path, [make_record(9)], block_records=2)
+    assert [record["인증정보"]["인증번호"] for record in iter_pack_records(str(path))] == [
+        "SU000000-0001",
+        "SU000001-0001",
+        "SU000009-0001",
+    ]
+
+
+def test_journal_records_are_recovered_after_crash(tmp_path):
+    path = tmp_path / "out.kcz"
+    writer = PackWriter(str(path), block_records=10, journal=True)
+    for i in range(3):
+        writer.write(make_record(i))
+    # 블록을 쓰기 전에 중단된 경우 (마지막 줄은 쓰는 도중 잘림)
+    writer._journal.write(json.dumps(make_record(3), ensure_ascii=False)[:20])
+    writer._journal.close()
+    writer._f.close()
+    assert list(iter_pack_records(str(path))) == []
+
+    writer = PackWriter(str(path), block_records=10, journal=True)
+    assert list(iter_pack_keys(str(path))) == ["SU000000-0001", "SU000001-0001", "SU000002-0001"]
+    writer.write(make_record(4))
+    writer.close()
+
+    assert len(list(iter_pack_records(str(path)))) == 4
+    assert not os.path.exists(writer.journal_path)
+
+
+def test_corrupt_block_header_raises(tmp_path):
+    path = tmp_path / "out.kcz"
+    path.write_bytes(b"NOPE" + bytes(kc_pack.BLOCK_HEADER.size))
+
+    with pytest.raises(ValueError):
+        list(iter_pack_records(str(path)))
+
+
+@pytest.mark.skipif(kc_pack.zstandard is None, reason="zstandard 가 설치되어 있지 않음")
+def test_blocks_with_different_codecs_can_be_mixed(tmp_path):
+    path = tmp_path / "out.kcz"
+    write_pack(path, [make_record(1)], codec=kc_pack.CODEC_ZLIB)
+    write_pack(path, [make_record(2)], codec=kc_pack.CODEC_ZSTD)
+
+    assert [record["인증정보"]["인증번호"] for record in iter_pack_records(str(path))] == [
+        "SU000001-0001",
+        "SU000002-0001",
+    ]
@@ -0,0 +1,38 @@
+import io
+import json
+import logging
+
+import pytest
+
+import kc_record
+from kc_record import _iter_json_items, iter_json_records
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 40))
+def test_top_level_numbers_split_at_every_chunk_size(monkeypatch, chunk_size):
+    monkeypatch.setattr(kc_record, "STREAM_CHUNK_SIZE", chunk_size)
+    text = '[1, 2, 12345.678, -3e10, 4, {"n": 1.5e-3}, "a,b]", true, null]'
+
+    assert list(_iter_json_items(io.StringIO(text))) == json.loads(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 1 << 16])
+def test_object_of_arrays_is_streamed(monkeypatch, chunk_size):
+    monkeypatch.setattr(kc_record, "STREAM_CHUNK_SIZE", chunk_size)
+    text = '{"2023": [{"certNum": "A"}, {"certNum": "B"}], "2024": [], "2025": [{"certNum": "C"}]}'
+
+    assert [item["certNum"] for item in _iter_json_items(io.StringIO(text))] == ["A", "B", "C"]
+
+
+def test_unterminated_array_raises():
+    with pytest.raises(ValueError):
+        list(_iter_json_items(io.StringIO("[1, 2")))
+
+
+def test_malformed_jsonl_lines_are_skipped_with_a_warning(caplog, tmp_path):
+    path = tmp_path / "0.jsonl"
+    path.write_text('{"a": 1}\n{"a": \n{"a": 3}\n{"a"', encoding="utf-8")
+
+    with caplog.at_level(logging.WARNING, logger="kc_record"):
+        assert list(iter_json_records(str(path))) == [{"a": 1}, {"a": 3}]
+    assert [record.getMessage().split(" ")[0] for record in caplog.records] == [f"{path}:2", f"{path}:4"]
@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+
+from kc_record import CertRecord, load_cert_numbers
+from kc_sinks import JsonlSink, PackSink
+
+logger = logging.getLogger("test_kc_sinks")
+
+
+def make_record(cert_num):
+    return CertRecord.from_detail({"인증정보": {"인증번호": cert_num}, "제조공장": [], "연관 인증 번호": []})
+
+
+def test_jsonl_sink_falls_back_to_backup_and_raises_when_both_fail(monkeypatch, tmp_path):
+    sink = JsonlSink(None, logger, str(tmp_path))
+    (tmp_path / "0.jsonl").mkdir()  # 본 파일을 열 수 없도록 같은 이름의 디렉터리를 만듦
+
+    assert sink.write(make_record("SU0001"), None) is False
+    assert sink.backup_path in sink.existing_paths()
+    assert load_cert_numbers(sink.backup_path) == {"su0001"}
+
+    (tmp_path / "backup_0.jsonl").unlink()
+    (tmp_path / "backup_0.jsonl").mkdir()
+    with pytest.raises(OSError):
+        sink.write(make_record("SU0002"), None)
+
+
+def test_pack_sink_raises_when_write_fails(monkeypatch, tmp_path):
+    sink = PackSink(None, logger, str(tmp_path))
+
+    def fail(record):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(sink.writer, "write", fail)
+    with pytest.raises(OSError):
+        sink.write(make_record("SU0001"), None)
+    sink.close()
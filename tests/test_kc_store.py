@@ -0,0 +1,57 @@
+import json
+
+from kc_pack import JOURNAL_SUFFIX, PackWriter
+from kc_store import CertStore, import_files
+
+
+def detail_record(cert_num, change_date):
+    return {
+        "인증정보": {"인증번호": cert_num, "인증상태": "적합", "인증변경일자": change_date},
+        "제품정보": {},
+        "제조공장": [],
+        "연관 인증 번호": [],
+    }
+
+
+def api_record(cert_num, change_date):
+    return {"certNum": cert_num, "makerName": "ABC", "certState": "적합", "certChgDate": change_date}
+
+
+def test_older_detail_page_keeps_the_refresh_request_queued(tmp_path):
+    with CertStore(str(tmp_path / "certs.db")) as store:
+        store.upsert_detail(detail_record("CB001", "2024-01-01"))
+        store.enqueue_details([("CB001", "changed")])
+
+        assert store.upsert_detail(detail_record("CB001", "2023-01-01")) is False
+        assert store.is_queued("CB001")
+
+        assert store.upsert_detail(detail_record("CB001", "2024-02-01")) is True
+        assert not store.is_queued("CB001")
+
+
+def test_newer_api_record_marks_the_stored_detail_as_stale(tmp_path):
+    with CertStore(str(tmp_path / "certs.db")) as store:
+        store.upsert_detail(detail_record("CB001", "2024-01-01"))
+        store.upsert_detail(detail_record("CB002", "2024-01-01"))
+        store.upsert_api_records([api_record("CB001", "2024-03-01"), api_record("CB002", "2024-01-01")])
+
+        # 같은 날짜의 API 레코드는 상세 데이터를 그대로 유효하게 둠
+        assert store.cert_numbers(detail_only=True) == {"cb002"}
+        assert store.get("CB001")["detail_json"] is not None
+
+        store.upsert_detail(detail_record("CB001", "2024-03-01"))
+        assert store.cert_numbers(detail_only=True) == {"cb001", "cb002"}
+
+
+def test_import_reads_kcz_files_and_their_pending_journal(tmp_path):
+    path = tmp_path / "0.kcz"
+    with PackWriter(str(path)) as writer:
+        writer.write(detail_record("CB001", "2024-01-01"))
+    # 크롤러가 블록을 쓰기 전에 중단되어 저널에만 남은 레코드
+    (tmp_path / ("0.kcz" + JOURNAL_SUFFIX)).write_text(
+        json.dumps(detail_record("CB002", "2024-01-01"), ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+    with CertStore(str(tmp_path / "certs.db")) as store:
+        import_files(store, [str(tmp_path / "*.kcz")])
+        assert store.cert_numbers(detail_only=True) == {"cb001", "cb002"}
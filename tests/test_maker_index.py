@@ -0,0 +1,92 @@
+import maker_index
+from kc_store import CertStore
+from maker_index import MakerIndex, build
+
+
+def api_record(cert_num, maker, change_date, model="", factories=()):
+    return {
+        "certNum": cert_num,
+        "makerName": maker,
+        "makerCntryName": "중국",
+        "modelName": model,
+        "certState": "적합",
+        "certChgDate": change_date,
+        "factories": [{"makerName": name, "makerCntryName": "중국"} for name in factories],
+    }
+
+
+def make_db(path):
+    with CertStore(str(path)) as store:
+        store.upsert_api_records(
+            [
+                api_record("CB001", "SHENZHEN ABC ELECTRONICS CO., LTD.", "2023-01-01", "ABC-100"),
+                api_record("CB002", "Shenzhen ABC Electronics Co Ltd", "2024-01-01", factories=["NINGBO XYZ PLANT"]),
+                api_record("CB003", "DONGGUAN HAPPY TOYS CO., LTD.", "2022-01-01", "TOY-7"),
+            ]
+        )
+        # 증분 갱신을 확인할 수 있도록 갱신 시각을 과거로 고정
+        store.conn.execute("UPDATE certificates SET updated_at = '2000-01-01T00:00:00' WHERE cert_num != 'CB003'")
+        store.conn.execute("UPDATE certificates SET updated_at = '2000-01-02T00:00:00' WHERE cert_num = 'CB003'")
+        store.conn.commit()
+
+
+def cert_nums(results):
+    return [doc["cert_num"] for doc in results]
+
+
+def test_search_modes_and_ranking(tmp_path):
+    db, index = tmp_path / "certs.db", tmp_path / "index.bin"
+    make_db(db)
+    assert build(str(db), str(index)) == {"docs": 3, "changed": 3, "watermark": "2000-01-02T00:00:00"}
+
+    with MakerIndex(str(index)) as idx:
+        # 정규화 후 같은 이름은 exact, 결과는 인증변경일자 최신순
+        results = idx.search("shenzhen abc electronics co ltd", field="maker")
+        assert cert_nums(results) == ["CB002", "CB001"]
+        assert results[0]["mode"] == "exact"
+
+        assert cert_nums(idx.search("shenz ab", field="maker")) == ["CB002", "CB001"]
+        assert cert_nums(idx.search("happy toy", field="maker", mode="exact")) == []
+        assert cert_nums(idx.search("dongguan hapy toys", field="maker", mode="auto")) == ["CB003"]
+        assert cert_nums(idx.search("ningbo xyz", field="factory")) == ["CB002"]
+        assert cert_nums(idx.search("cb003", field="cert")) == ["CB003"]
+        # 영문 지역명은 한글 지역명으로 바꿔서 검색
+        assert cert_nums(idx.search("NINGBO", field="region")) == ["CB002"]
+        assert cert_nums(idx.search("abc electronics", limit=1)) == ["CB002"]
+
+
+def test_incremental_build_reads_only_updated_certificates(monkeypatch, tmp_path):
+    db, index = tmp_path / "certs.db", tmp_path / "index.bin"
+    make_db(db)
+    build(str(db), str(index))
+
+    with CertStore(str(db)) as store:
+        store.upsert_api_records([api_record("CB001", "SHENZHEN NEW NAME CO., LTD.", "2025-01-01")])
+
+    read = []
+    iter_documents = maker_index.iter_documents
+
+    def recording(store, since=""):
+        for doc in iter_documents(store, since):
+            read.append(doc["cert_num"])
+            yield doc
+
+    monkeypatch.setattr(maker_index, "iter_documents", recording)
+    result = build(str(db), str(index))
+
+    # 워터마크와 같은 시각의 CB003 은 다시 읽지만 바뀌지 않았으므로 변경 건수에 넣지 않음
+    assert sorted(read) == ["CB001", "CB003"]
+    assert (result["docs"], result["changed"]) == (3, 1)
+    with MakerIndex(str(index)) as idx:
+        assert cert_nums(idx.search("shenzhen new name", field="maker", mode="exact")) == ["CB001"]
+        assert cert_nums(idx.search("shenzhen abc electronics", field="maker", mode="exact")) == ["CB002"]
+
+
+def test_unreadable_index_is_rebuilt(tmp_path):
+    db, index = tmp_path / "certs.db", tmp_path / "index.bin"
+    make_db(db)
+    index.write_bytes(b"not an index" * 20)
+
+    assert build(str(db), str(index))["docs"] == 3
+    with MakerIndex(str(index)) as idx:
+        assert idx.doc_count == 3
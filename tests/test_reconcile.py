@@ -0,0 +1,25 @@
+import reconcile
+from kc_store import CertStore
+
+
+def api_record(i):
+    return {"certNum": f"CB{i:03d}", "makerName": "ABC", "certState": "적합", "certChgDate": "2024-01-01"}
+
+
+def detail_record(i):
+    info = {"인증번호": f"CB{i:03d}", "인증상태": "적합", "인증변경일자": "2024-01-01"}
+    return {"인증정보": info, "제품정보": {}, "제조공장": [], "연관 인증 번호": []}
+
+
+def test_reconcile_streams_stored_api_records_and_queues_certs_without_detail(monkeypatch, tmp_path):
+    monkeypatch.setattr(reconcile, "IMPORT_CHUNK_ROWS", 7)
+    with CertStore(str(tmp_path / "certs.db")) as store:
+        store.upsert_details([detail_record(i) for i in range(0, 50, 5)])
+        store.upsert_api_records([api_record(i) for i in range(50)])
+
+        stats = reconcile.reconcile(store)
+
+        assert stats == {"api": 50, "detail": 10, "changed": 0, "gaps": 40, "queue": 40}
+        queued = {row["cert_num"]: row["reason"] for row in store.detail_queue()}
+        assert set(queued.values()) == {reconcile.GAP_REASON}
+        assert "CB005" not in queued and "CB006" in queued